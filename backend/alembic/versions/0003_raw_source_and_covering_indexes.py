@@ -0,0 +1,37 @@
+"""create raw_source and covering date indexes on transaction
+
+Mirrors app.models_core.TRANSACTION_INDEXES / _ensure_indexes: legacy databases that keep the
+direction in a 'direction' column (no 'type') get that column in the covering index, and an index
+whose columns are missing is skipped.
+
+Revision ID: covering_indexes_0003
+Revises: create_indexes_0002
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "covering_indexes_0003"
+down_revision = "create_indexes_0002"
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ("idx_transaction_raw_source", ("raw_source",)),
+    ("idx_transaction_date_cover", ("date", "type", "major_category", "sub_category", "category", "amount")),
+)
+
+def upgrade():
+    existing = {c["name"] for c in sa.inspect(op.get_bind()).get_columns("transaction")}
+    for name, cols in INDEXES:
+        if "type" not in existing and "direction" in existing:
+            cols = tuple("direction" if c == "type" else c for c in cols)
+        if all(c in existing for c in cols):
+            op.create_index(name, "transaction", list(cols), unique=False)
+
+def downgrade():
+    existing = {ix["name"] for ix in sa.inspect(op.get_bind()).get_indexes("transaction")}
+    for name, _ in INDEXES:
+        if name in existing:
+            op.drop_index(name, table_name="transaction")
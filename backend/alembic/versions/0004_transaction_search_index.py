@@ -0,0 +1,65 @@
+"""create the transaction text-search index
+
+SQLite: FTS5 trigram table transaction_search (case-insensitive, over the "transaction" columns)
++ sync triggers, filled from existing rows. Revision 0010 replaces it with the lower()-ed definition.
+PostgreSQL: pg_trgm GIN indexes on the searched columns.
+The DDL is inlined as it stood at this revision (app.models_core.transaction_search_ddl moves on).
+
+Revision ID: search_index_0004
+Revises: covering_indexes_0003
+Create Date: 2026-10-16 00:00:00.000000
+"""
+import sqlite3
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "search_index_0004"
+down_revision = "covering_indexes_0003"
+branch_labels = None
+depends_on = None
+
+COLUMNS = ("major_category", "sub_category", "description", "category")
+TABLE = "transaction_search"
+
+
+def _sqlite_ddl():
+    cols = ", ".join(COLUMNS)
+    new_vals = ", ".join(f"new.{c}" for c in COLUMNS)
+    old_vals = ", ".join(f"old.{c}" for c in COLUMNS)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE} USING fts5({cols}, "
+        f"content='transaction', content_rowid='id', tokenize='trigram')",
+        f'CREATE TRIGGER IF NOT EXISTS {TABLE}_ai AFTER INSERT ON "transaction" BEGIN '
+        f"INSERT INTO {TABLE}(rowid, {cols}) VALUES (new.id, {new_vals}); END",
+        f'CREATE TRIGGER IF NOT EXISTS {TABLE}_ad AFTER DELETE ON "transaction" BEGIN '
+        f"INSERT INTO {TABLE}({TABLE}, rowid, {cols}) VALUES ('delete', old.id, {old_vals}); END",
+        f'CREATE TRIGGER IF NOT EXISTS {TABLE}_au AFTER UPDATE OF {cols} ON "transaction" BEGIN '
+        f"INSERT INTO {TABLE}({TABLE}, rowid, {cols}) VALUES ('delete', old.id, {old_vals}); "
+        f"INSERT INTO {TABLE}(rowid, {cols}) VALUES (new.id, {new_vals}); END",
+    ]
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        if sqlite3.sqlite_version_info < (3, 34, 0):  # first release with the trigram tokenizer
+            return
+        for stmt in _sqlite_ddl():
+            op.execute(stmt)
+        op.execute(f"INSERT INTO {TABLE}({TABLE}) VALUES ('rebuild')")
+    elif dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for col in COLUMNS:
+            op.execute(f'CREATE INDEX IF NOT EXISTS idx_transaction_{col}_trgm ON "transaction" USING gin ({col} gin_trgm_ops)')
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for suffix in ("ai", "ad", "au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {TABLE}_{suffix}")
+        op.execute(f"DROP TABLE IF EXISTS {TABLE}")
+    elif dialect == "postgresql":
+        for col in COLUMNS:
+            op.drop_index(f"idx_transaction_{col}_trgm", table_name="transaction")
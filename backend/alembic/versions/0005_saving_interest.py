@@ -0,0 +1,25 @@
+"""add interest columns to saving
+
+interest_rate: annual rate in percent (0 = no interest); interest_type: 'simple' | 'compound'.
+Mirrors the _ensure_columns call in app.models_core.create_db_and_tables.
+
+Revision ID: saving_interest_0005
+Revises: search_index_0004
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "saving_interest_0005"
+down_revision = "search_index_0004"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column("saving", sa.Column("interest_rate", sa.Float(), nullable=True, server_default="0"))
+    op.add_column("saving", sa.Column("interest_type", sa.String(), nullable=True, server_default="simple"))
+
+def downgrade():
+    op.drop_column("saving", "interest_type")
+    op.drop_column("saving", "interest_rate")
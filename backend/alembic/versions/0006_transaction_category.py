@@ -0,0 +1,34 @@
+"""create the transaction_category table (distinct major/sub pairs with row counts)
+
+Filled from existing transactions; crud keeps it up to date on every transaction write.
+Mirrors app.models_core.TransactionCategory / app.crud._rebuild_transaction_categories.
+
+Revision ID: transaction_category_0006
+Revises: saving_interest_0005
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "transaction_category_0006"
+down_revision = "saving_interest_0005"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        "transaction_category",
+        sa.Column("major_category", sa.String(), nullable=False, server_default=""),
+        sa.Column("sub_category", sa.String(), nullable=False, server_default=""),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("major_category", "sub_category"),
+    )
+    op.execute(
+        'INSERT INTO transaction_category (major_category, sub_category, count) '
+        'SELECT COALESCE(major_category, \'\'), COALESCE(sub_category, \'\'), COUNT(*) FROM "transaction" '
+        'GROUP BY COALESCE(major_category, \'\'), COALESCE(sub_category, \'\')'
+    )
+
+def downgrade():
+    op.drop_table("transaction_category")
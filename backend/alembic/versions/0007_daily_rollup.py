@@ -0,0 +1,45 @@
+"""create the daily_rollup table (per-day totals by direction/major/sub)
+
+Filled from existing transactions; crud keeps it up to date on every transaction write.
+Mirrors app.models_core.DailyRollup / app.crud._rebuild_daily_rollup.
+
+Revision ID: daily_rollup_0007
+Revises: transaction_category_0006
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "daily_rollup_0007"
+down_revision = "transaction_category_0006"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        "daily_rollup",
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("direction", sa.String(), nullable=False, server_default=""),
+        sa.Column("major_category", sa.String(), nullable=False, server_default=""),
+        sa.Column("sub_category", sa.String(), nullable=False, server_default=""),
+        sa.Column("amount", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("date", "direction", "major_category", "sub_category"),
+    )
+    # legacy databases keep the direction in a 'direction' column instead of 'type' (see 0003)
+    existing = {c["name"] for c in sa.inspect(op.get_bind()).get_columns("transaction")}
+    direction = "type" if "type" in existing or "direction" not in existing else "direction"
+    # same keys as _rollup_key: empty string for NULL/empty, legacy category as the major fallback
+    op.execute(
+        "INSERT INTO daily_rollup (date, direction, major_category, sub_category, amount, count) "
+        f"SELECT date, COALESCE(NULLIF({direction}, ''), ''), "
+        "COALESCE(NULLIF(major_category, ''), NULLIF(category, ''), ''), COALESCE(NULLIF(sub_category, ''), ''), "
+        "SUM(COALESCE(amount, 0)), COUNT(*) "
+        'FROM "transaction" WHERE date IS NOT NULL '
+        f"GROUP BY date, COALESCE(NULLIF({direction}, ''), ''), "
+        "COALESCE(NULLIF(major_category, ''), NULLIF(category, ''), ''), COALESCE(NULLIF(sub_category, ''), '')"
+    )
+
+def downgrade():
+    op.drop_table("daily_rollup")
@@ -0,0 +1,29 @@
+"""create the data_version table (single-row write counter behind the read endpoints' ETags)
+
+Seeded with its one row (id=1, version=0); crud bumps it in the same transaction as every write.
+Mirrors app.models_core.DataVersion.
+
+Revision ID: data_version_0008
+Revises: daily_rollup_0007
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "data_version_0008"
+down_revision = "daily_rollup_0007"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    table = op.create_table(
+        "data_version",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.bulk_insert(table, [{"id": 1, "version": 0}])
+
+def downgrade():
+    op.drop_table("data_version")
@@ -0,0 +1,30 @@
+"""create the data_change table (per-version log of the date ranges each write touched)
+
+Other workers replay it to invalidate only the overlapping entries of their response caches.
+Starts empty: workers that are behind the log simply clear their caches once.
+Mirrors app.models_core.DataChange.
+
+Revision ID: data_change_0009
+Revises: data_version_0008
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "data_change_0009"
+down_revision = "data_version_0008"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        "data_change",
+        sa.Column("version", sa.Integer(), nullable=False, autoincrement=False),
+        sa.Column("origin", sa.String(), nullable=False, server_default=""),
+        sa.Column("ranges", sa.String(), nullable=False, server_default="[]"),
+        sa.PrimaryKeyConstraint("version"),
+    )
+
+def downgrade():
+    op.drop_table("data_change")
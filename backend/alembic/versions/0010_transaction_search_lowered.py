@@ -0,0 +1,77 @@
+"""re-create the SQLite search index over lower()-ed columns
+
+The 0004 table folded case with the trigram tokenizer (Unicode-aware), while the ILIKE fallback and
+SQLite's lower() fold ASCII only, so FTS and fallback results could differ. The table now reads from
+the transaction_search_source view (lower() of each column) with tokenize='trigram case_sensitive 1',
+and the triggers insert lower()-ed values. PostgreSQL is unchanged (pg_trgm indexes).
+The DDL is inlined as it stands at this revision; mirrors app.models_core.transaction_search_ddl.
+
+Revision ID: search_index_lowered_0010
+Revises: data_change_0009
+Create Date: 2026-10-16 00:00:00.000000
+"""
+import sqlite3
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "search_index_lowered_0010"
+down_revision = "data_change_0009"
+branch_labels = None
+depends_on = None
+
+COLUMNS = ("major_category", "sub_category", "description", "category")
+TABLE = "transaction_search"
+SOURCE = "transaction_search_source"
+
+
+def _drop():
+    for suffix in ("ai", "ad", "au"):
+        op.execute(f"DROP TRIGGER IF EXISTS {TABLE}_{suffix}")
+    op.execute(f"DROP TABLE IF EXISTS {TABLE}")
+    op.execute(f"DROP VIEW IF EXISTS {SOURCE}")
+
+
+def _create(content: str, tokenize: str, wrap: str):
+    cols = ", ".join(COLUMNS)
+    new_vals = ", ".join(wrap.format(f"new.{c}") for c in COLUMNS)
+    old_vals = ", ".join(wrap.format(f"old.{c}") for c in COLUMNS)
+    op.execute(
+        f"CREATE VIRTUAL TABLE {TABLE} USING fts5({cols}, "
+        f"content='{content}', content_rowid='id', tokenize='{tokenize}')"
+    )
+    op.execute(
+        f'CREATE TRIGGER {TABLE}_ai AFTER INSERT ON "transaction" BEGIN '
+        f"INSERT INTO {TABLE}(rowid, {cols}) VALUES (new.id, {new_vals}); END"
+    )
+    op.execute(
+        f'CREATE TRIGGER {TABLE}_ad AFTER DELETE ON "transaction" BEGIN '
+        f"INSERT INTO {TABLE}({TABLE}, rowid, {cols}) VALUES ('delete', old.id, {old_vals}); END"
+    )
+    op.execute(
+        f'CREATE TRIGGER {TABLE}_au AFTER UPDATE OF {cols} ON "transaction" BEGIN '
+        f"INSERT INTO {TABLE}({TABLE}, rowid, {cols}) VALUES ('delete', old.id, {old_vals}); "
+        f"INSERT INTO {TABLE}(rowid, {cols}) VALUES (new.id, {new_vals}); END"
+    )
+    op.execute(f"INSERT INTO {TABLE}({TABLE}) VALUES ('rebuild')")
+
+
+def _supported() -> bool:
+    # same condition as 0004: nothing was created on other backends or before the trigram tokenizer
+    return op.get_bind().dialect.name == "sqlite" and sqlite3.sqlite_version_info >= (3, 34, 0)
+
+
+def upgrade():
+    if not _supported():
+        return
+    _drop()
+    lowered = ", ".join(f"lower({c}) AS {c}" for c in COLUMNS)
+    op.execute(f'CREATE VIEW {SOURCE} AS SELECT id, {lowered} FROM "transaction"')
+    _create(SOURCE, "trigram case_sensitive 1", "lower({})")
+
+def downgrade():
+    if not _supported():
+        return
+    _drop()
+    _create("transaction", "trigram", "{}")
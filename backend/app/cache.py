@@ -0,0 +1,143 @@
+"""
+In-process LRU/TTL cache for date-range read endpoints (/api/summary, /api/calendar).
+
+Entries are keyed by (endpoint, start, end, ...) and remember the date range they cover; a missing
+start/end means the range is unbounded on that side. crud records the dates each write touches on its
+session and invalidates the overlapping entries once the write commits (see crud._touch_dates).
+Writes committed by other processes are replayed from the data_change log up to `synced_version`
+(see main._sync_response_cache).
+"""
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Dict, Hashable, Iterable, Optional
+
+# sentinel returned by RangeCache.get on a miss (None is a valid cached value)
+MISS = object()
+
+
+class RangeCache:
+    """
+    Thread-safe LRU cache whose entries expire after `ttl` seconds and can be dropped by date range.
+    maxsize <= 0 or ttl <= 0 disables caching (every get is a miss, put is a no-op).
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (expires_at, start, end, value), least recently used first
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        # bumped by every invalidation; put() drops values computed before the latest one
+        self.generation = 0
+        # data_version whose data_change rows have been applied; None = not synced since the last clear()
+        self.synced_version: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl > 0
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                    self.evictions += 1
+                self.misses += 1
+                return MISS
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[3]
+
+    def put(self, key: Hashable, start: Optional[date], end: Optional[date], value: Any,
+            generation: Optional[int] = None) -> None:
+        """
+        Store `value` for the range [start, end]. Pass the `generation` read before computing the value:
+        if a write was invalidated in the meantime the value may be stale and is not stored.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (self._clock() + self.ttl, start, end, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate_range(self, start: Optional[date] = None, end: Optional[date] = None) -> int:
+        """Drop entries whose range overlaps [start, end] (None = unbounded). Returns the number dropped."""
+        with self._lock:
+            self.generation += 1
+            stale = [
+                key for key, (_, s, e, _) in self._entries.items()
+                if (end is None or s is None or s <= end) and (start is None or e is None or e >= start)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+            return len(stale)
+
+    def invalidate_dates(self, dates: Iterable[date]) -> int:
+        """Drop entries whose range contains any of `dates`."""
+        dates = sorted(set(dates))
+        if not dates:
+            return 0
+        with self._lock:
+            self.generation += 1
+            stale = []
+            for key, (_, s, e, _) in self._entries.items():
+                lo = 0 if s is None else bisect_left(dates, s)
+                if lo < len(dates) and (e is None or dates[lo] <= e):
+                    stale.append(key)
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self.synced_version = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "synced_version": self.synced_version,
+            }
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        raise ValueError(f"Invalid value for {name}: '{raw}'")
+
+
+# shared cache for the read endpoints; MONEY_CALENDAR_CACHE_SIZE=0 or MONEY_CALENDAR_CACHE_TTL=0 disables it
+response_cache = RangeCache(
+    maxsize=int(_env_number("MONEY_CALENDAR_CACHE_SIZE", 256)),
+    ttl=_env_number("MONEY_CALENDAR_CACHE_TTL", 300.0),
+)
@@ -1,77 +1,203 @@
 from sqlmodel import Session, select
-from .models_core import engine, Transaction, FixedExpense, Saving, CategoryMajor, CategorySub
+from .utils.csv_parser import iter_csv_transaction_batches
+from .cache import response_cache
+from .models_core import engine, TRANSACTION_SEARCH_TABLE, Transaction, DailyRollup, TransactionCategory, DataVersion, DataChange, FixedExpense, Saving, CategoryMajor, CategorySub
 from typing import List, Optional, Dict, Any, Union, Tuple
-from collections import defaultdict
-from datetime import date, datetime
+from collections import defaultdict, namedtuple
+from datetime import date, datetime, timedelta
+import bisect
 import calendar
-from sqlalchemy import func
+import base64
+import functools
+import heapq
+import json
+import os
+import threading
+import uuid
+import weakref
+from itertools import accumulate, islice
+from sqlalchemy import func, delete, insert, update, event, case, inspect, column, literal_column, table
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 def get_session():
     with Session(engine) as session:
         yield session
 
 
-# Completed CRUD helpers for Transaction
+# Change tracking: writes record the dates/ranges they touch on session.info. The data_version
+# counter is bumped inside the committing transaction together with a data_change row listing those
+# ranges, and the overlapping response-cache entries are dropped once (and only if) it commits.
+# Other processes replay data_change to invalidate their own caches (see get_data_changes).
 
-def _normalize_tx_dict(tx: Dict[str, Any]) -> Dict[str, Any]:
+# data_change rows kept for workers that are behind; one further behind clears its whole cache
+DATA_CHANGE_KEEP = 1000
+# more separate touched dates than this are logged as one [min, max] range
+_CHANGE_RUNS_MAX = 64
+# with the pid, identifies the writing process in data_change (the pid alone can repeat across hosts)
+_ORIGIN_TOKEN = uuid.uuid4().hex[:12]
+# (version, origin, [(start, end), ...]) as returned by get_data_changes
+DataChangeRow = Tuple[int, str, List[Tuple[Optional[date], Optional[date]]]]
+
+def _mark_changed(session: Session) -> None:
+    """Flag a write with no date range (e.g. settings) so the commit still bumps data_version."""
+    session.info["data_changed"] = True
+
+
+def _touch_dates(session: Session, dates) -> None:
+    _mark_changed(session)
+    session.info.setdefault("touched_dates", set()).update(dates)
+
+
+def _touch_range(session: Session, start: Optional[date] = None, end: Optional[date] = None) -> None:
+    """Record a written date range (None = unbounded), e.g. a fixed expense or saving period."""
+    _mark_changed(session)
+    session.info.setdefault("touched_ranges", []).append((start, end))
+
+
+def change_origin() -> str:
+    """data_change.origin written by this process (computed per call so forked workers differ)."""
+    return f"{_ORIGIN_TOKEN}-{os.getpid()}"
+
+
+def _change_ranges(dates, ranges) -> List[List[Optional[str]]]:
+    """Touched dates as runs of consecutive days (or one [min, max] if fragmented) plus the touched ranges."""
+    runs: List[List[date]] = []
+    for d in sorted(dates or ()):
+        if runs and (d - runs[-1][1]).days <= 1:
+            runs[-1][1] = d
+        else:
+            runs.append([d, d])
+    if len(runs) > _CHANGE_RUNS_MAX:
+        runs = [[runs[0][0], runs[-1][1]]]
+    return [[s and s.isoformat(), e and e.isoformat()] for s, e in list(runs) + list(ranges or ())]
+
+
+def _bump_data_version(session: Session) -> None:
+    # one upsert statement: concurrent first writers cannot both INSERT the row
+    table = DataVersion.__table__
+    stmt = _upsert_insert(session, table).values(id=1, version=1)
+    session.execute(stmt.on_conflict_do_update(index_elements=[table.c.id], set_={"version": table.c.version + 1}))
+    version = _get_data_version(session)
+    log = DataChange.__table__
+    ranges = _change_ranges(session.info.get("touched_dates"), session.info.get("touched_ranges"))
+    session.execute(insert(log).values(version=version, origin=change_origin(), ranges=json.dumps(ranges)))
+    session.execute(delete(log).where(log.c.version <= version - DATA_CHANGE_KEEP))
+
+
+def _get_data_version(session: Session) -> int:
+    return session.exec(select(DataVersion.version).where(DataVersion.id == 1)).first() or 0
+
+
+def get_data_version() -> int:
+    """Current value of the data_version counter (0 before the first write)."""
+    with Session(engine) as session:
+        return _get_data_version(session)
+
+
+def _get_data_changes(session: Session, after: int, upto: int) -> List[DataChangeRow]:
+    table = DataChange.__table__
+    rows = session.execute(
+        select(table.c.version, table.c.origin, table.c.ranges)
+        .where(table.c.version > after, table.c.version <= upto)
+        .order_by(table.c.version)
+    ).all()
+    changes = []
+    for version, origin, ranges in rows:
+        spans = [(s and date.fromisoformat(s), e and date.fromisoformat(e)) for s, e in json.loads(ranges)]
+        changes.append((version, origin, spans))
+    return changes
+
+
+def get_data_changes(after: int, upto: int) -> List[DataChangeRow]:
     """
-    Normalize incoming dict so it can be passed to Transaction constructor.
-    - Map legacy 'type' -> 'direction' (SQLModel uses direction -> DB column "type")
-    - Coerce date strings to datetime.date
-    - Coerce amount strings to float
-    - Normalize direction/type to English canonical values: "Income" or "Expense"
-    - Raise ValueError on invalid date/amount so caller can handle/report
+    data_change rows with after < version <= upto, oldest first.
+    Fewer rows than versions means some were pruned or written without crud; callers must then assume
+    anything changed.
     """
+    with Session(engine) as session:
+        return _get_data_changes(session, after, upto)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_if_changed(session) -> None:
+    if session.info.pop("data_changed", False):
+        _bump_data_version(session)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_touched(session) -> None:
+    dates = session.info.pop("touched_dates", None)
+    ranges = session.info.pop("touched_ranges", None)
+    if dates:
+        response_cache.invalidate_dates(dates)
+    for start, end in ranges or ():
+        response_cache.invalidate_range(start, end)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_touched(session) -> None:
+    session.info.pop("data_changed", None)
+    session.info.pop("touched_dates", None)
+    session.info.pop("touched_ranges", None)
+
+
+# Completed CRUD helpers for Transaction
+
+# Date formats accepted for transaction dates, tried in this order.
+_TX_DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%d/%m/%Y", "%m/%d/%Y")
+
+
+def _canon_direction(v: Any) -> Optional[str]:
+    """Normalize direction value to canonical English labels ("Income"/"Expense")."""
+    if v is None:
+        return None
+    s = str(v).strip().lower()
+    if not s:
+        return None
+    if "income" in s or "수입" in s:
+        return "Income"
+    if "expense" in s or "지출" in s:
+        return "Expense"
+    # fallback: use title-cased token (helpful for 'inc'/'exp' or 'INCOME')
+    return s.capitalize()
+
+
+def _parse_tx_date(d: str) -> date:
+    """Parse a transaction date string with the common formats, then ISO as a last resort."""
+    s = d.strip()
+    # try common formats
+    for fmt in _TX_DATE_FORMATS:
+        try:
+            return datetime.strptime(s, fmt).date()
+        except Exception:
+            continue
+    # try ISO parser as a last resort
+    try:
+        return datetime.fromisoformat(s).date()
+    except Exception:
+        raise ValueError(f"Invalid date format: '{d}'")
+
+
+def _normalize_tx_row(tx: Dict[str, Any], parse_date, canon_direction) -> Dict[str, Any]:
+    """Shared body of _normalize_tx_dict / normalize_tx_batch; only the date/direction helpers differ."""
     tx_copy = dict(tx)
 
     # Normalize type/direction: prefer explicit 'direction' field; else map 'type' -> 'direction'
     if "direction" in tx_copy and tx_copy["direction"] is not None:
         tx_copy.pop("type", None)
-        raw_dir = tx_copy.get("direction")
     else:
         raw_dir = tx_copy.pop("type", tx_copy.get("direction", None))
         if raw_dir is not None:
             tx_copy["direction"] = raw_dir
 
-    # Normalize direction value to canonical English labels
-    def _canon_direction(v: Any) -> Optional[str]:
-        if v is None:
-            return None
-        s = str(v).strip().lower()
-        if not s:
-            return None
-        if "income" in s or "수입" in s:
-            return "Income"
-        if "expense" in s or "지출" in s:
-            return "Expense"
-        # fallback: use title-cased token (helpful for 'inc'/'exp' or 'INCOME')
-        return s.capitalize()
-
     if "direction" in tx_copy:
-        tx_copy["direction"] = _canon_direction(tx_copy.get("direction"))
-
-    # remove stray 'type' key to avoid unexpected kwargs
-    tx_copy.pop("type", None)
+        tx_copy["direction"] = canon_direction(tx_copy.get("direction"))
 
     # Coerce date strings -> datetime.date
     d = tx_copy.get("date")
     if isinstance(d, str):
-        s = d.strip()
-        parsed = None
-        # try common formats
-        for fmt in ("%Y-%m-%d", "%Y/%m/%d", "%d/%m/%Y", "%m/%d/%Y"):
-            try:
-                parsed = datetime.strptime(s, fmt).date()
-                break
-            except Exception:
-                continue
-        if parsed is None:
-            # try ISO parser as a last resort
-            try:
-                parsed = datetime.fromisoformat(s).date()
-            except Exception:
-                raise ValueError(f"Invalid date format: '{d}'")
-        tx_copy["date"] = parsed
+        tx_copy["date"] = parse_date(d)
 
     # Coerce amount to float (accept strings with commas)
     amt = tx_copy.get("amount")
@@ -81,13 +207,90 @@ def _normalize_tx_dict(tx: Dict[str, Any]) -> Dict[str, Any]:
             tx_copy["amount"] = float(s)
         except Exception:
             raise ValueError(f"Invalid amount: '{amt}'")
-
     # If amount is int, convert to float (consistent type)
-    if isinstance(tx_copy.get("amount"), int):
-        tx_copy["amount"] = float(tx_copy["amount"])
+    elif isinstance(amt, int):
+        tx_copy["amount"] = float(amt)
 
     return tx_copy
 
+
+def _normalize_tx_dict(tx: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize incoming dict so it can be passed to Transaction constructor.
+    - Map legacy 'type' -> 'direction' (SQLModel uses direction -> DB column "type")
+    - Coerce date strings to datetime.date
+    - Coerce amount strings to float
+    - Normalize direction/type to English canonical values: "Income" or "Expense"
+    - Raise ValueError on invalid date/amount so caller can handle/report
+    """
+    return _normalize_tx_row(tx, _parse_tx_date, _canon_direction)
+
+
+class _BatchDateParser:
+    """
+    Date parser for one column of a batch: the format is detected from the first string and
+    reused; values that don't match it fall back to the full per-row _parse_tx_date.
+    """
+
+    def __init__(self) -> None:
+        self._formats: Optional[Tuple[str, ...]] = None
+        self._iso = False
+
+    def __call__(self, d: str) -> date:
+        s = d.strip()
+        if self._iso:
+            # fixed-width YYYY-MM-DD: slicing is much cheaper than strptime and gives the same result
+            if len(s) == 10 and s[4] == "-" and s[7] == "-" and s.isascii() and (s[:4] + s[5:7] + s[8:]).isdigit():
+                try:
+                    return date(int(s[:4]), int(s[5:7]), int(s[8:]))
+                except ValueError:
+                    pass
+        elif self._formats is not None:
+            for fmt in self._formats:
+                try:
+                    return datetime.strptime(s, fmt).date()
+                except ValueError:
+                    continue
+        parsed = _parse_tx_date(d)
+        if self._formats is None and not self._iso:
+            self._detect(s)
+        return parsed
+
+    def _detect(self, s: str) -> None:
+        for i, fmt in enumerate(_TX_DATE_FORMATS):
+            try:
+                datetime.strptime(s, fmt)
+            except ValueError:
+                continue
+            if i == 0:
+                self._iso = True
+            else:
+                # the per-row parser tries formats in order, so an earlier format that can match the same
+                # shape (d/m/Y before m/d/Y) must still be tried first to keep results identical
+                self._formats = _TX_DATE_FORMATS[2:i + 1] if i == 3 else (fmt,)
+            return
+
+
+def normalize_tx_batch(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Normalize a whole list of transaction dicts; output and errors match _normalize_tx_dict row by row.
+    The date format is detected once for the batch and direction labels are canonicalized once per distinct value.
+    """
+    parse_date = _BatchDateParser()
+    directions: Dict[Any, Optional[str]] = {}
+
+    def canon_direction(v: Any) -> Optional[str]:
+        try:
+            return directions[v]
+        except KeyError:
+            out = directions[v] = _canon_direction(v)
+            return out
+        except TypeError:
+            # unhashable value: nothing to cache
+            return _canon_direction(v)
+
+    return [_normalize_tx_row(tx, parse_date, canon_direction) for tx in rows]
+
 def _coerce_date(val, name: str = "date") -> Optional[date]:
     """Convert strings/datetimes to datetime.date. Return None if val is None."""
     if val is None:
@@ -114,6 +317,153 @@ def _coerce_date(val, name: str = "date") -> Optional[date]:
     # unsupported type
     raise ValueError(f"Invalid {name} type: {type(val)}")
 
+# --- daily_rollup maintenance ---
+# Every Transaction write passes the rows it adds/removes to _apply_rollup_deltas inside the same
+# session, so daily_rollup (and transaction_category) commit or roll back together with the
+# transaction table.
+
+def _tx_field(t, name: str):
+    """Read a field from a Transaction-like object or a normalized dict."""
+    if isinstance(t, dict):
+        return t.get(name)
+    return getattr(t, name, None)
+
+
+def _rollup_key(t) -> Tuple[date, str, str, str]:
+    return (
+        _tx_field(t, "date"),
+        _tx_field(t, "direction") or "",
+        _tx_field(t, "major_category") or _tx_field(t, "category") or "",
+        _tx_field(t, "sub_category") or "",
+    )
+
+
+def _apply_rollup_deltas(session: Session, added=(), removed=()) -> None:
+    """Fold added/removed rows into per-key (amount, count) deltas and upsert them into daily_rollup."""
+    _apply_category_deltas(session, added, removed)
+    deltas: Dict[Tuple[date, str, str, str], List[float]] = defaultdict(lambda: [0.0, 0])
+    for t in added:
+        if _tx_field(t, "date") is None:
+            continue
+        acc = deltas[_rollup_key(t)]
+        acc[0] += float(_tx_field(t, "amount") or 0)
+        acc[1] += 1
+    removed_dates = set()
+    for t in removed:
+        if _tx_field(t, "date") is None:
+            continue
+        key = _rollup_key(t)
+        acc = deltas[key]
+        acc[0] -= float(_tx_field(t, "amount") or 0)
+        acc[1] -= 1
+        removed_dates.add(key[0])
+    _touch_dates(session, {k[0] for k in deltas})
+    params = [
+        {"date": k[0], "direction": k[1], "major_category": k[2], "sub_category": k[3], "amount": v[0], "count": v[1]}
+        for k, v in deltas.items()
+        if v[1] != 0 or v[0] != 0.0
+    ]
+    if not params:
+        return
+    table = DailyRollup.__table__
+    stmt = _upsert_insert(session, table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.date, table.c.direction, table.c.major_category, table.c.sub_category],
+        set_={"amount": table.c.amount + stmt.excluded.amount, "count": table.c.count + stmt.excluded.count},
+    )
+    session.execute(stmt, params)
+    if removed_dates:
+        session.execute(delete(table).where(table.c.date.in_(sorted(removed_dates))).where(table.c.count <= 0))
+
+
+def _category_key(t) -> Tuple[str, str]:
+    return (_tx_field(t, "major_category") or "", _tx_field(t, "sub_category") or "")
+
+
+def _apply_category_deltas(session: Session, added=(), removed=()) -> None:
+    """Upsert per-(major, sub) row-count deltas into transaction_category; drop pairs left with no rows."""
+    deltas: Dict[Tuple[str, str], int] = defaultdict(int)
+    for t in added:
+        deltas[_category_key(t)] += 1
+    for t in removed:
+        deltas[_category_key(t)] -= 1
+    params = [{"major_category": k[0], "sub_category": k[1], "count": n} for k, n in deltas.items() if n]
+    if not params:
+        return
+    table = TransactionCategory.__table__
+    stmt = _upsert_insert(session, table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.major_category, table.c.sub_category],
+        set_={"count": table.c.count + stmt.excluded.count},
+    )
+    session.execute(stmt, params)
+    if any(p["count"] < 0 for p in params):
+        session.execute(delete(table).where(table.c.count <= 0))
+
+
+def _upsert_insert(session: Session, table):
+    """INSERT construct supporting ON CONFLICT for the session's backend (SQLite or PostgreSQL)."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "sqlite":
+        return sqlite_insert(table)
+    if dialect == "postgresql":
+        return pg_insert(table)
+    raise NotImplementedError(f"upsert is not supported on '{dialect}'")
+
+
+def _rebuild_daily_rollup(session: Session) -> int:
+    """Recompute daily_rollup from the transaction table. Returns the number of rollup rows written."""
+    table = DailyRollup.__table__
+    session.execute(delete(table))
+    _touch_range(session)
+    direction = func.coalesce(func.nullif(Transaction.direction, ""), "")
+    major = func.coalesce(func.nullif(Transaction.major_category, ""), func.nullif(Transaction.category, ""), "")
+    sub = func.coalesce(func.nullif(Transaction.sub_category, ""), "")
+    grouped = (
+        select(Transaction.date, direction, major, sub, func.sum(func.coalesce(Transaction.amount, 0)), func.count())
+        .where(Transaction.date.is_not(None))
+        .group_by(Transaction.date, direction, major, sub)
+    )
+    session.execute(
+        table.insert().from_select(["date", "direction", "major_category", "sub_category", "amount", "count"], grouped)
+    )
+    return session.exec(select(func.count()).select_from(table)).one()
+
+
+def _rebuild_transaction_categories(session: Session) -> int:
+    """Recompute transaction_category from the transaction table. Returns the number of pairs written."""
+    table = TransactionCategory.__table__
+    session.execute(delete(table))
+    _mark_changed(session)
+    major = func.coalesce(Transaction.major_category, "")
+    sub = func.coalesce(Transaction.sub_category, "")
+    grouped = select(major, sub, func.count()).group_by(major, sub)
+    session.execute(table.insert().from_select(["major_category", "sub_category", "count"], grouped))
+    return session.exec(select(func.count()).select_from(table)).one()
+
+
+def rebuild_daily_rollup() -> int:
+    """Drop and recompute the whole daily_rollup (and transaction_category) table in one transaction."""
+    with Session(engine) as session:
+        n = _rebuild_daily_rollup(session)
+        _rebuild_transaction_categories(session)
+        session.commit()
+    return n
+
+
+def ensure_daily_rollup() -> None:
+    """Populate daily_rollup / transaction_category for databases created before the tables existed."""
+    with Session(engine) as session:
+        has_rollup = session.exec(select(DailyRollup.date).limit(1)).first() is not None
+        has_categories = session.exec(select(TransactionCategory.count).limit(1)).first() is not None
+        has_tx = session.exec(select(Transaction.id).limit(1)).first() is not None
+        if has_tx and not has_rollup:
+            _rebuild_daily_rollup(session)
+        if has_tx and not has_categories:
+            _rebuild_transaction_categories(session)
+        session.commit()
+
+
 def create_transactions(transactions: List[Union[Dict[str, Any], Transaction]]) -> List[Transaction]:
     """
     Accepts a list of Transaction instances or dicts and persists them.
@@ -129,15 +479,69 @@ def create_transactions(transactions: List[Union[Dict[str, Any], Transaction]])
     with Session(engine) as session:
         for o in objs:
             session.add(o)
+        _apply_rollup_deltas(session, added=objs)
         session.commit()
         for o in objs:
             session.refresh(o)
     return objs
 
 
+# Attribute names accepted by the bulk INSERT path. Every row is padded to this full key set so
+# SQLAlchemy can send a whole batch as one multi-row INSERT ... RETURNING statement.
+_TX_INSERT_KEYS = ("date", "amount", "major_category", "sub_category", "category", "description",
+                   "account", "remarks", "raw_source", "direction")
+
+IMPORT_BATCH_SIZE = 1000
+
+
+def _insert_transaction_rows(session: Session, rows: List[Dict[str, Any]]) -> List[int]:
+    """
+    Insert already-normalized transaction dicts with a single executemany INSERT and return
+    their ids (in input order) via RETURNING; daily_rollup is updated in the same session.
+    """
+    if not rows:
+        return []
+    params = [{k: r.get(k) for k in _TX_INSERT_KEYS} for r in rows]
+    if session.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order:
+        result = session.execute(insert(Transaction).returning(Transaction.id, sort_by_parameter_order=True), params)
+        ids = list(result.scalars())
+    else:
+        # SQLite < 3.35 has no RETURNING. The rows were just appended under this transaction's
+        # write lock, so they own the top len(params) rowids in insertion order.
+        session.execute(insert(Transaction), params)
+        last_id = session.exec(select(func.max(Transaction.id))).one()
+        ids = list(range(last_id - len(params) + 1, last_id + 1))
+    _apply_rollup_deltas(session, added=params)
+    return ids
+
+
+def import_transactions_csv(f, batch_size: int = IMPORT_BATCH_SIZE) -> List[int]:
+    """
+    Stream-parse a CSV text stream and insert it batch by batch (one INSERT per batch).
+    The whole import is one DB transaction: a parse error in any row rolls everything back.
+    Returns the created ids in file order.
+    """
+    ids: List[int] = []
+    with Session(engine) as session:
+        for batch in iter_csv_transaction_batches(f, batch_size):
+            ids.extend(_insert_transaction_rows(session, normalize_tx_batch(batch)))
+        session.commit()
+    return ids
+
+
 # wrapper expected by main.py
-def create_transactions_bulk(transactions: List[Dict[str, Any]]) -> List[Transaction]:
-    return create_transactions(transactions)
+def create_transactions_bulk(transactions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Persist a list of transaction dicts with one INSERT ... RETURNING statement (no per-row refresh).
+    Returns the normalized input dicts, each with its new "id".
+    """
+    rows = normalize_tx_batch(transactions)
+    with Session(engine) as session:
+        ids = _insert_transaction_rows(session, rows)
+        session.commit()
+    for row, new_id in zip(rows, ids):
+        row["id"] = new_id
+    return rows
 
 
 def get_transactions() -> List[Transaction]:
@@ -152,8 +556,12 @@ def list_transactions() -> List[Transaction]:
 
 
 def get_transaction(transaction_id: int) -> Optional[Transaction]:
-    """Return a single transaction by id or None if not found."""
+    """Return a single transaction by id or None if not found (negative ids resolve virtual fixed-expense rows)."""
     with Session(engine) as session:
+        if transaction_id < 0:
+            if FIXED_EXPENSE_MODE != "virtual":
+                return None
+            return _get_virtual_transaction(session, transaction_id)
         return session.get(Transaction, transaction_id)
 
 
@@ -170,6 +578,7 @@ def update_transaction(transaction_id: int, patch: Dict[str, Any]) -> Optional[T
         tx = session.get(Transaction, transaction_id)
         if not tx:
             return None
+        before = {k: getattr(tx, k) for k in ("date", "direction", "major_category", "category", "sub_category", "amount")}
         for k, v in normalized_patch.items():
             # map direction -> attribute name on model
             if k == "direction":
@@ -179,6 +588,7 @@ def update_transaction(transaction_id: int, patch: Dict[str, Any]) -> Optional[T
             if hasattr(tx, k):
                 setattr(tx, k, v)
         session.add(tx)
+        _apply_rollup_deltas(session, added=[tx], removed=[before])
         session.commit()
         session.refresh(tx)
         return tx
@@ -190,31 +600,132 @@ def delete_transaction(transaction_id: int) -> bool:
         tx = session.get(Transaction, transaction_id)
         if not tx:
             return False
+        _apply_rollup_deltas(session, removed=[tx])
         session.delete(tx)
         session.commit()
         return True
 
 
+# How fixed-expense occurrences are stored:
+# - "materialized" (default, compatible): create/update write one Transaction per month with
+#   raw_source="fixed:{id}".
+# - "virtual": nothing is written; query_transactions, daily/calendar totals and exports expand the
+#   active rules for the requested window only, using synthetic negative ids (see _virtual_tx_id).
+FIXED_EXPENSE_MODE = os.environ.get("MONEY_CALENDAR_FIXED_EXPENSE_MODE", "materialized").strip().lower()
+
+# synthetic id = -(fixed_expense_id * stride + year * 12 + month - 1); stable and decodable
+_VIRTUAL_ID_STRIDE = 1_000_000
+
+
+def _fixed_occurrence_dates(fe: FixedExpense, start: Optional[date] = None, end: Optional[date] = None) -> List[date]:
+    """
+    Monthly occurrence dates of a fixed expense within its own active period and [start, end]
+    (day clamped to month end), matching the occurrence merge in get_summary.
+    """
+    lower = [d for d in (fe.start_date, start) if d is not None]
+    upper = [d for d in (fe.end_date, end) if d is not None]
+    if not lower or not upper:
+        return []
+    s, e = max(lower), min(upper)
+    if s > e:
+        return []
+    out = []
+    for y, m in _iter_months(s, e):
+        last_day = calendar.monthrange(y, m)[1]
+        occ = date(y, m, min(fe.day_of_month, last_day))
+        if s <= occ <= e:
+            out.append(occ)
+    return out
+
+
+def _virtual_tx_id(fe_id: int, d: date) -> int:
+    return -(fe_id * _VIRTUAL_ID_STRIDE + d.year * 12 + d.month - 1)
+
+
+def _fixed_occurrence_tx(fe: FixedExpense, d: date, tx_id: Optional[int] = None) -> Transaction:
+    return Transaction(
+        id=tx_id,
+        date=d,
+        amount=float(fe.amount),
+        direction="Expense",
+        major_category=fe.major_category,
+        sub_category=fe.sub_category,
+        description=fe.description,
+        raw_source=f"fixed:{fe.id}",
+    )
+
+
+# Read-only transaction projection: a tuple subclass with no per-row __dict__, ORM state or validation.
+# Used for virtual fixed-expense occurrences; full Transaction models are built only where one is returned
+# to a caller that may mutate it (query_transactions, get_transaction).
+TransactionRow = namedtuple(
+    "TransactionRow",
+    ["id", "date", "amount", "direction", "major_category", "sub_category", "category", "description", "raw_source"],
+)
+
+
+def _fixed_occurrence_row(fe: FixedExpense, d: date, tx_id: int) -> TransactionRow:
+    return TransactionRow(tx_id, d, float(fe.amount), "Expense", fe.major_category, fe.sub_category, None,
+                          fe.description, f"fixed:{fe.id}")
+
+
+def _row_to_transaction(row: TransactionRow) -> Transaction:
+    return Transaction(**row._asdict())
+
+
 def _build_fixed_expense_transactions(fe: FixedExpense) -> List[Transaction]:
+    # materialized mode keeps its historical rule: one row for every month touched by [start_date, end_date]
     occurrences: List[Transaction] = []
     for y, m in _iter_months(fe.start_date, fe.end_date):
         last_day = calendar.monthrange(y, m)[1]
-        day = min(fe.day_of_month, last_day)
-        occ_date = date(y, m, day)
-        occurrences.append(
-            Transaction(
-                date=occ_date,
-                amount=float(fe.amount),
-                direction="Expense",
-                major_category=fe.major_category,
-                sub_category=fe.sub_category,
-                description=fe.description,
-                raw_source=f"fixed:{fe.id}",
-            )
-        )
+        occurrences.append(_fixed_occurrence_tx(fe, date(y, m, min(fe.day_of_month, last_day))))
     return occurrences
 
 
+def _virtual_fixed_transactions(session: Session, start: Optional[date], end: Optional[date],
+                                tx_type: Optional[str] = None, search: Optional[str] = None) -> List[TransactionRow]:
+    """
+    Expand active fixed expenses into TransactionRow occurrences for [start, end] when
+    FIXED_EXPENSE_MODE == "virtual" (empty list otherwise), applying the same type/search
+    substring filters as query_transactions. Sorted by (date DESC, id DESC).
+    """
+    if FIXED_EXPENSE_MODE != "virtual":
+        return []
+    if tx_type and tx_type.lower() not in "expense":
+        return []
+    stmt = select(FixedExpense).where(FixedExpense.active == True)
+    if start:
+        stmt = stmt.where((FixedExpense.end_date == None) | (FixedExpense.end_date >= start))
+    if end:
+        stmt = stmt.where((FixedExpense.start_date == None) | (FixedExpense.start_date <= end))
+    needle = search.lower() if search else None
+    out: List[TransactionRow] = []
+    for fe in session.exec(stmt).all():
+        if needle and not any(needle in (v or "").lower() for v in (fe.major_category, fe.sub_category, fe.description)):
+            continue
+        out.extend(_fixed_occurrence_row(fe, d, _virtual_tx_id(fe.id, d)) for d in _fixed_occurrence_dates(fe, start, end))
+    out.sort(key=_tx_sort_key, reverse=True)
+    return out
+
+
+def _tx_sort_key(t) -> Tuple[date, int]:
+    return (t.date, t.id)
+
+
+def _get_virtual_transaction(session: Session, transaction_id: int) -> Optional[Transaction]:
+    """Resolve a synthetic (negative) id back to its fixed-expense occurrence, if it still exists."""
+    fe_id, ym = divmod(-transaction_id, _VIRTUAL_ID_STRIDE)
+    fe = session.get(FixedExpense, fe_id)
+    if not fe or not fe.active:
+        return None
+    y, m = divmod(ym, 12)
+    month_start = date(y, m + 1, 1)
+    month_end = date(y, m + 1, calendar.monthrange(y, m + 1)[1])
+    for d in _fixed_occurrence_dates(fe, month_start, month_end):
+        return _row_to_transaction(_fixed_occurrence_row(fe, d, transaction_id))
+    return None
+
+
 def create_fixed_expense(data: Dict[str, Any]) -> FixedExpense:
     """
     Create FixedExpense and generate Transaction occurrences for each month in the range.
@@ -253,16 +764,14 @@ def create_fixed_expense(data: Dict[str, Any]) -> FixedExpense:
 
     with Session(engine) as session:
         session.add(fe)
-        session.commit()
-        session.refresh(fe)
+        session.flush()  # assigns fe.id for raw_source
+        _touch_range(session, fe.start_date, fe.end_date)
 
-        occurrences = _build_fixed_expense_transactions(fe)
-        for tx in occurrences:
-            session.add(tx)
+        if FIXED_EXPENSE_MODE != "virtual":
+            _insert_transaction_rows(session, [_fixed_row(t) for t in _build_fixed_expense_transactions(fe)])
 
         session.commit()
-        for t in occurrences:
-            session.refresh(t)
+        session.refresh(fe)
     return fe
 
 def delete_fixed_expense(fe_id: int) -> bool:
@@ -274,26 +783,26 @@ def delete_fixed_expense(fe_id: int) -> bool:
         fe = session.get(FixedExpense, fe_id)
         if not fe:
             return False
-        # delete generated transactions
-        pattern = f"fixed:{fe_id}"
-        # use .raw_source field match
-        stmt = select(Transaction).where(Transaction.raw_source == pattern)
-        generated = session.exec(stmt).all()
-        for g in generated:
-            session.delete(g)
+        # delete generated transactions (matched on raw_source) with one DELETE
+        _delete_generated_rows(session, fe_id)
+        _touch_range(session, fe.start_date, fe.end_date)
         session.delete(fe)
         session.commit()
     return True
 
 def update_fixed_expense(fe_id: int, patch: Dict[str, Any]) -> Optional[FixedExpense]:
     """
-    Update FixedExpense. For simplicity, if update succeeds we delete previously generated transactions
-    for this fixed expense and re-generate occurrences based on the new/current values.
+    Update FixedExpense and bring its generated transactions in line, in one DB transaction.
+    Only the difference between the old and new occurrence sets is written: months that dropped
+    out are deleted, newly covered months are inserted, and kept months get one bulk UPDATE for
+    changed attributes (plus a by-id date update when the day moved).
+    In "virtual" mode previously generated rows are dropped and nothing is re-generated.
     """
     with Session(engine) as session:
         fe = session.get(FixedExpense, fe_id)
         if not fe:
             return None
+        _touch_range(session, fe.start_date, fe.end_date)
         # apply patch fields (coerce dates/numbers where appropriate)
         for k, v in patch.items():
             if not hasattr(fe, k):
@@ -312,26 +821,78 @@ def update_fixed_expense(fe_id: int, patch: Dict[str, Any]) -> Optional[FixedExp
                     raise ValueError(f"Invalid day_of_month: {patch.get('day_of_month')}")
             setattr(fe, k, v)
         session.add(fe)
+        _touch_range(session, fe.start_date, fe.end_date)
+
+        if FIXED_EXPENSE_MODE == "virtual":
+            _delete_generated_rows(session, fe_id)
+        else:
+            _sync_generated_rows(session, fe)
+
         session.commit()
         session.refresh(fe)
+        return fe
 
-        # remove previously generated transactions
-        pattern = f"fixed:{fe_id}"
-        stmt = select(Transaction).where(Transaction.raw_source == pattern)
-        prev = session.exec(stmt).all()
-        for p in prev:
-            session.delete(p)
-        session.commit()
 
-        # re-generate occurrences
-        occurrences = _build_fixed_expense_transactions(fe)
-        for tx in occurrences:
-            session.add(tx)
+def _fixed_row(t: Transaction) -> Dict[str, Any]:
+    return {k: getattr(t, k) for k in _TX_INSERT_KEYS}
 
-        session.commit()
-        for t in occurrences:
-            session.refresh(t)
-        return fe
+
+# columns of generated rows that follow the FixedExpense (besides date)
+_FIXED_SYNC_KEYS = ("amount", "direction", "major_category", "sub_category", "description")
+
+
+def _generated_rows(session: Session, fe_id: int):
+    cols = [Transaction.id, Transaction.date, Transaction.category] + [getattr(Transaction, k) for k in _FIXED_SYNC_KEYS]
+    return session.exec(select(*cols).where(Transaction.raw_source == f"fixed:{fe_id}")).all()
+
+
+def _delete_generated_rows(session: Session, fe_id: int) -> None:
+    prev = _generated_rows(session, fe_id)
+    if prev:
+        _apply_rollup_deltas(session, removed=[dict(r._mapping) for r in prev])
+        session.execute(delete(Transaction).where(Transaction.raw_source == f"fixed:{fe_id}"))
+
+
+def _sync_generated_rows(session: Session, fe: FixedExpense) -> None:
+    """Diff the stored occurrences of `fe` against its current rule and write only the changes."""
+    pattern = f"fixed:{fe.id}"
+    old_rows: Dict[Tuple[int, int], Dict[str, Any]] = {}
+    dropped: List[Dict[str, Any]] = []
+    for r in _generated_rows(session, fe.id):
+        row = dict(r._mapping)
+        ym = (row["date"].year, row["date"].month)
+        if ym in old_rows:
+            # a month should hold one generated row; drop any extra
+            dropped.append(row)
+        else:
+            old_rows[ym] = row
+    new_rows = {(t.date.year, t.date.month): _fixed_row(t) for t in _build_fixed_expense_transactions(fe)}
+
+    dropped.extend(row for ym, row in old_rows.items() if ym not in new_rows)
+    added = [row for ym, row in new_rows.items() if ym not in old_rows]
+    kept = [(old_rows[ym], row) for ym, row in new_rows.items() if ym in old_rows]
+
+    target = {k: getattr(_fixed_occurrence_tx(fe, fe.start_date), k) for k in _FIXED_SYNC_KEYS}
+    attrs_differ = any(old[k] != target[k] for old, _ in kept for k in _FIXED_SYNC_KEYS)
+    moved = [(old, new) for old, new in kept if old["date"] != new["date"]]
+    touched = [(old, new) for old, new in kept if attrs_differ or old["date"] != new["date"]]
+
+    if dropped:
+        session.execute(delete(Transaction).where(Transaction.id.in_([r["id"] for r in dropped])))
+    if attrs_differ:
+        session.execute(
+            update(Transaction).where(Transaction.raw_source == pattern).values(**target),
+            execution_options={"synchronize_session": False},
+        )
+    if moved:
+        session.execute(update(Transaction), [{"id": old["id"], "date": new["date"]} for old, new in moved])
+
+    _apply_rollup_deltas(
+        session,
+        added=[{**old, **new} for old, new in touched],
+        removed=dropped + [old for old, _ in touched],
+    )
+    _insert_transaction_rows(session, added)
 
 def list_fixed_expenses() -> List[FixedExpense]:
     with Session(engine) as session:
@@ -341,6 +902,25 @@ def get_fixed_expense(fe_id: int) -> Optional[FixedExpense]:
     with Session(engine) as session:
         return session.get(FixedExpense, fe_id)
 
+def sync_fixed_expense_transactions() -> int:
+    """
+    Bring stored fixed-expense rows in line with FIXED_EXPENSE_MODE: drop every generated
+    "fixed:*" row, then re-generate them all in "materialized" mode. Returns rows written.
+    """
+    with Session(engine) as session:
+        prev = session.exec(select(Transaction).where(Transaction.raw_source.like("fixed:%"))).all()
+        _apply_rollup_deltas(session, removed=prev)
+        for p in prev:
+            session.delete(p)
+        occurrences: List[Transaction] = []
+        if FIXED_EXPENSE_MODE != "virtual":
+            for fe in session.exec(select(FixedExpense)).all():
+                occurrences.extend(_build_fixed_expense_transactions(fe))
+            session.add_all(occurrences)
+            _apply_rollup_deltas(session, added=occurrences)
+        session.commit()
+    return len(occurrences)
+
 
 def _iter_months(start: date, end: date):
     # yield (year, month) inclusive
@@ -351,28 +931,146 @@ def _iter_months(start: date, end: date):
         m = ym % 12 + 1
         yield y, m
 
+def _month_occurrence(y: int, m: int, day_of_month: int) -> date:
+    """The day_of_month-th of (y, m), clamped to the month's last day."""
+    return date(y, m, min(day_of_month, calendar.monthrange(y, m)[1]))
+
+
+# lightweight rows for aggregates computed partly in Python (same fields as the SQL result rows)
+DailyTotal = namedtuple("DailyTotal", ["date", "direction", "amount", "count"])
+CalendarDay = namedtuple("CalendarDay", ["date", "income", "expense", "count"])
+CategoryTotal = namedtuple("CategoryTotal", ["direction", "major_category", "category", "sub_category", "amount", "count"])
+
+
+def _aggregate_transactions(session: Session, start: Optional[date], end: Optional[date]):
+    """
+    GROUP BY direction/major/category/sub with SUM(amount) over [start, end] (inclusive).
+    Rows expose .direction, .major_category, .category, .sub_category, .amount and .count;
+    callers apply their own fallback labels for NULL/empty categories.
+    """
+    stmt = select(
+        Transaction.direction.label("direction"),
+        Transaction.major_category.label("major_category"),
+        Transaction.category.label("category"),
+        Transaction.sub_category.label("sub_category"),
+        func.sum(Transaction.amount).label("amount"),
+        func.count().label("count"),
+    )
+    if start:
+        stmt = stmt.where(Transaction.date >= start)
+    if end:
+        stmt = stmt.where(Transaction.date <= end)
+    stmt = stmt.group_by(Transaction.direction, Transaction.major_category, Transaction.category, Transaction.sub_category)
+    return session.exec(stmt).all()
+
+def aggregate_transactions(start: Optional[date] = None, end: Optional[date] = None):
+    """
+    Aggregated (direction, major, category, sub) totals for [start, end]; see _aggregate_transactions.
+    Virtual fixed-expense occurrences are appended as extra groups in "virtual" mode.
+    """
+    with Session(engine) as session:
+        groups = list(_aggregate_transactions(session, start, end))
+        virtual = _virtual_fixed_transactions(session, start, end)
+    acc: Dict[Tuple, List[float]] = {}
+    for v in virtual:
+        slot = acc.setdefault((v.direction, v.major_category, None, v.sub_category), [0.0, 0])
+        slot[0] += v.amount
+        slot[1] += 1
+    groups.extend(CategoryTotal(*k, a, c) for k, (a, c) in acc.items())
+    return groups
+
+def get_daily_totals(start: Optional[date] = None, end: Optional[date] = None):
+    """
+    Per-day totals from daily_rollup for [start, end], ordered by date.
+    Rows expose .date, .direction ("" when unknown), .amount and .count.
+    Virtual fixed-expense occurrences are added on top in "virtual" mode.
+    """
+    with Session(engine) as session:
+        return _get_daily_totals(session, start, end)
+
+def _get_daily_totals(session: Session, start: Optional[date], end: Optional[date]):
+    virtual = _virtual_fixed_transactions(session, start, end)
+    stmt = select(
+        DailyRollup.date,
+        DailyRollup.direction,
+        func.sum(DailyRollup.amount).label("amount"),
+        func.sum(DailyRollup.count).label("count"),
+    )
+    if start:
+        stmt = stmt.where(DailyRollup.date >= start)
+    if end:
+        stmt = stmt.where(DailyRollup.date <= end)
+    stmt = stmt.group_by(DailyRollup.date, DailyRollup.direction).order_by(DailyRollup.date)
+    rows = session.exec(stmt).all()
+    if not virtual:
+        return rows
+    acc: Dict[Tuple[date, str], List[float]] = {(r.date, r.direction): [float(r.amount or 0), int(r.count or 0)] for r in rows}
+    for v in virtual:
+        slot = acc.setdefault((v.date, v.direction), [0.0, 0])
+        slot[0] += v.amount
+        slot[1] += 1
+    return [DailyTotal(d, direction, a, c) for (d, direction), (a, c) in sorted(acc.items())]
+
+def get_calendar_days(start: date, end: date) -> List[CalendarDay]:
+    """
+    One (date, income, expense, count) row per day in [start, end] with any activity, ordered by date.
+    Income/expense are split in SQL over daily_rollup (a direction is income when it contains "income",
+    case-insensitively, or is "수입"; everything else counts as expense), so no rows are capped or
+    summed in Python. Virtual fixed-expense occurrences are added as expenses in "virtual" mode.
+    """
+    with Session(engine) as session:
+        return _get_calendar_days(session, start, end)
+
+def _rollup_is_income():
+    """SQL condition: a daily_rollup direction counts as income (contains "income", any case, or is "수입")."""
+    return func.lower(DailyRollup.direction).like("%income%") | (DailyRollup.direction == "수입")
+
+def _get_calendar_days(session: Session, start: date, end: date) -> List[CalendarDay]:
+    is_income = _rollup_is_income()
+    stmt = (
+        select(
+            DailyRollup.date,
+            func.sum(case((is_income, DailyRollup.amount), else_=0.0)).label("income"),
+            func.sum(case((is_income, 0.0), else_=DailyRollup.amount)).label("expense"),
+            func.sum(DailyRollup.count).label("count"),
+        )
+        .where(DailyRollup.date >= start)
+        .where(DailyRollup.date <= end)
+        .group_by(DailyRollup.date)
+        .order_by(DailyRollup.date)
+    )
+    days = {r.date: [float(r.income or 0), float(r.expense or 0), int(r.count or 0)] for r in session.exec(stmt).all()}
+    for v in _virtual_fixed_transactions(session, start, end):
+        slot = days.setdefault(v.date, [0.0, 0.0, 0])
+        slot[1] += v.amount
+        slot[2] += 1
+    return [CalendarDay(d, *vals) for d, vals in sorted(days.items())]
+
 def get_summary(start: Optional[date] = None, end: Optional[date] = None) -> Dict[str, Any]:
     """
     Return summary: total amount and totals by major -> sub categories.
       Optimized: avoid loading entire table. If start/end missing, query min/max(date) from DB.
     """
-    # determine default range using DB min/max if needed
     with Session(engine) as session:
-        # result shape may vary by SQLAlchemy version (Row/tuple); handle safely
-        minmax_res = session.exec(select(func.min(Transaction.date), func.max(Transaction.date)))
-        min_max = minmax_res.first()
-        if not min_max:
-            db_min, db_max = None, None
+        return _get_summary(session, start, end)
+
+def _get_summary(session: Session, start: Optional[date], end: Optional[date]) -> Dict[str, Any]:
+    # determine default range using DB min/max if needed
+    # result shape may vary by SQLAlchemy version (Row/tuple); handle safely
+    minmax_res = session.exec(select(func.min(Transaction.date), func.max(Transaction.date)))
+    min_max = minmax_res.first()
+    if not min_max:
+        db_min, db_max = None, None
+    else:
+        # min_max might be an int/str/date tuple-like or a scalar-like value
+        if isinstance(min_max, (list, tuple)):
+            db_min, db_max = min_max[0], min_max[1]
         else:
-            # min_max might be an int/str/date tuple-like or a scalar-like value
-            if isinstance(min_max, (list, tuple)):
+            # single scalar (rare for two-col select) — try indexing, otherwise set to None
+            try:
                 db_min, db_max = min_max[0], min_max[1]
-            else:
-                # single scalar (rare for two-col select) — try indexing, otherwise set to None
-                try:
-                    db_min, db_max = min_max[0], min_max[1]
-                except Exception:
-                    db_min, db_max = None, None
+            except Exception:
+                db_min, db_max = None, None
 
     if start is None or end is None:
         if db_min is not None and db_max is not None:
@@ -392,24 +1090,25 @@ def get_summary(start: Optional[date] = None, end: Optional[date] = None) -> Dic
     major_sub_acc: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
     total = 0.0
 
-    # load only transactions within [start, end] (reduces memory for large DB)
-    with Session(engine) as session:
-        stmt = select(Transaction).where(Transaction.date >= start).where(Transaction.date <= end)
-        txs = session.exec(stmt).all()
+    # read the materialized daily_rollup: cost grows with days x categories, not with transactions
+    stmt = (
+        select(DailyRollup.major_category, DailyRollup.sub_category, func.sum(DailyRollup.amount).label("amount"))
+        .where(DailyRollup.date >= start)
+        .where(DailyRollup.date <= end)
+        .group_by(DailyRollup.major_category, DailyRollup.sub_category)
+    )
+    groups = session.exec(stmt).all()
 
-    for t in txs:
-        if t.date is None:
-            continue
-        amt = float(t.amount or 0)
+    for g in groups:
+        amt = float(g.amount or 0)
         total += amt
-        major = t.major_category or t.category or "uncategorized"
-        sub = t.sub_category or "unspecified"
+        major = g.major_category or "uncategorized"
+        sub = g.sub_category or "unspecified"
         major_acc[major] += amt
         major_sub_acc[major][sub] += amt
 
     # include fixed expenses occurrences (same as before)
-    with Session(engine) as session:
-        fixed_list = session.exec(select(FixedExpense).where(FixedExpense.active == True)).all()
+    fixed_list = session.exec(select(FixedExpense).where(FixedExpense.active == True)).all()
 
     for fe in fixed_list:
         fe_start = fe.start_date or start
@@ -444,89 +1143,443 @@ def query_transactions(start: Optional[date] = None,
                        tx_type: Optional[str] = None,
                        search: Optional[str] = None,
                        page: int = 1,
-                       per_page: int = 100) -> Tuple[List[Transaction], int]:
+                       per_page: int = 100,
+                       after: Optional[Tuple[date, int]] = None,
+                       include_total: bool = True) -> Tuple[List[Transaction], Optional[int]]:
     """
     Return (items, total_count) filtered by optional start/end (inclusive),
     tx_type (substring match), search (searches major/sub/description/category),
-    with DB-side pagination (LIMIT/OFFSET) and efficient count.
-    """
-    with Session(engine) as session:
-        stmt = select(Transaction)
-        if start:
-            stmt = stmt.where(Transaction.date >= start)
-        if end:
-            stmt = stmt.where(Transaction.date <= end)
-        if tx_type:
-            stmt = stmt.where(Transaction.direction.ilike(f"%{tx_type}%"))
-        if search:
-            q = f"%{search}%"
-            stmt = stmt.where(
-                (Transaction.major_category.ilike(q)) |
-                (Transaction.sub_category.ilike(q)) |
-                (Transaction.description.ilike(q)) |
-                (Transaction.category.ilike(q))
-            )
-
-        # compute total count efficiently (remove ordering)
-        count_subq = stmt.order_by(None).subquery()
-        # execute count; result shape may be int or a row/tuple depending on SQLAlchemy
-        count_exec = session.exec(select(func.count()).select_from(count_subq))
-        count_val = None
+    ordered by (date DESC, id DESC) with DB-side pagination and efficient count.
+    - after=(date, id): keyset mode, return rows strictly after that position and ignore `page`
+      (cost does not grow with depth); otherwise LIMIT/OFFSET by `page`.
+    - include_total=False skips the COUNT query and returns None as total_count.
+    """
+    with Session(engine) as session:
+        return _query_transactions(session, start, end, tx_type, search, page, per_page, after, include_total)
+
+
+# Fields of the /api/transactions list payload, in output order.
+TX_LIST_FIELDS = ("id", "date", "type", "major_category", "sub_category", "amount", "description")
+_TxListRow = namedtuple("_TxListRow", TX_LIST_FIELDS)
+_TX_LIST_COLUMNS = (
+    Transaction.id,
+    Transaction.date,
+    Transaction.direction.label("type"),
+    Transaction.major_category,
+    Transaction.sub_category,
+    Transaction.amount,
+    Transaction.description,
+)
+
+
+def query_transaction_rows(start: Optional[date] = None,
+                           end: Optional[date] = None,
+                           tx_type: Optional[str] = None,
+                           search: Optional[str] = None,
+                           page: int = 1,
+                           per_page: int = 100,
+                           after: Optional[Tuple[date, int]] = None,
+                           include_total: bool = True) -> Tuple[List[tuple], Optional[int]]:
+    """
+    Same filtering/ordering/paging as query_transactions, but selects only the TX_LIST_FIELDS
+    columns and returns plain tuples in that order (no ORM hydration) for the listing fast path.
+    """
+    with Session(engine) as session:
+        return _query_transactions(session, start, end, tx_type, search, page, per_page, after, include_total,
+                                   list_rows=True)
+
+
+def _query_transactions(session: Session, start: Optional[date], end: Optional[date], tx_type: Optional[str],
+                        search: Optional[str], page: int, per_page: int, after: Optional[Tuple[date, int]],
+                        include_total: bool, list_rows: bool = False) -> Tuple[list, Optional[int]]:
+    stmt = select(*_TX_LIST_COLUMNS) if list_rows else select(Transaction)
+    if start:
+        stmt = stmt.where(Transaction.date >= start)
+    if end:
+        stmt = stmt.where(Transaction.date <= end)
+    if tx_type:
+        stmt = stmt.where(Transaction.direction.ilike(f"%{tx_type}%"))
+    if search:
+        stmt = stmt.where(_search_filter(session, search))
+
+    virtual = _virtual_fixed_transactions(session, start, end, tx_type, search)
+    if list_rows:
+        virtual = [_TxListRow(v.id, v.date, v.direction, v.major_category, v.sub_category, v.amount, v.description)
+                   for v in virtual]
+
+    if not include_total:
+        total = None
+    else:
+        total = _count_rows(session, stmt) + len(virtual)
+
+    base_stmt = stmt
+    # stable (date, id) ordering so keyset cursors never skip or repeat rows
+    stmt = stmt.order_by(Transaction.date.desc(), Transaction.id.desc())
+    if after is not None:
+        after_date, after_id = after
+        stmt = stmt.where(Transaction.date <= after_date).where(
+            (Transaction.date < after_date) | (Transaction.id < after_id)
+        )
+        virtual = [v for v in virtual if _tx_sort_key(v) < (after_date, after_id)]
+    else:
+        offset = max((page - 1) * per_page, 0)
+        skipped = _virtual_rows_before(session, base_stmt, virtual, offset) if virtual and offset else 0
+        virtual = virtual[skipped:]
+        stmt = stmt.offset(offset - skipped)
+    stmt = stmt.limit(per_page)
+    page_items = session.exec(stmt).all()
+    if virtual:
+        merged = heapq.merge(page_items, virtual, key=_tx_sort_key, reverse=True)
+        page_items = list(islice(merged, per_page))
+        if not list_rows:
+            # only the virtual rows that made it onto the page become models
+            page_items = [_row_to_transaction(t) if isinstance(t, TransactionRow) else t for t in page_items]
+    return page_items, total
+
+
+# Shortest query the trigram search index can answer; shorter ones fall back to the ILIKE scan.
+SEARCH_INDEX_MIN_CHARS = 3
+
+_search_fts = table(TRANSACTION_SEARCH_TABLE, column("rowid"))
+# engines known to have the SQLite FTS table (only positive answers are remembered)
+_search_index_engines: "weakref.WeakSet" = weakref.WeakSet()
+
+
+def _has_search_table(session: Session) -> bool:
+    bind = session.get_bind()
+    if bind.dialect.name != "sqlite":
+        return False
+    eng = getattr(bind, "engine", bind)
+    if eng in _search_index_engines:
+        return True
+    if inspect(session.connection()).has_table(TRANSACTION_SEARCH_TABLE):
+        _search_index_engines.add(eng)
+        return True
+    return False
+
+
+def _search_filter(session: Session, search: str):
+    """
+    WHERE clause for `search`: case-insensitive substring of major/sub/description/category.
+    On SQLite, queries of SEARCH_INDEX_MIN_CHARS+ characters are answered by the transaction_search
+    FTS5 trigram index (a quoted phrase of trigrams is exactly a substring match; index and phrase are
+    both SQL lower()-ed, so case folding is ASCII-only like ILIKE); shorter queries, LIKE wildcards
+    and databases without the index use the ILIKE predicates, which PostgreSQL serves from its
+    pg_trgm indexes.
+    """
+    if len(search) >= SEARCH_INDEX_MIN_CHARS and not any(c in search for c in "%_") and _has_search_table(session):
+        phrase = func.lower('"' + search.replace('"', '""') + '"')
+        matches = select(_search_fts.c.rowid).where(literal_column(TRANSACTION_SEARCH_TABLE).op("MATCH")(phrase))
+        return Transaction.id.in_(matches)
+    q = f"%{search}%"
+    return (
+        (Transaction.major_category.ilike(q)) |
+        (Transaction.sub_category.ilike(q)) |
+        (Transaction.description.ilike(q)) |
+        (Transaction.category.ilike(q))
+    )
+
+
+def _virtual_rows_before(session: Session, stmt, virtual: List[Transaction], offset: int) -> int:
+    """
+    Number of virtual rows that sort ahead of merged position `offset`. Virtual ids are negative,
+    so every stored row on the same date sorts first: a virtual row's merged position is
+    (stored rows with date >= its date) + (virtual rows ahead of it).
+    """
+    candidates = virtual[:offset]
+    sub = stmt.where(Transaction.date >= candidates[-1].date).order_by(None).subquery()
+    per_day = session.exec(select(sub.c.date, func.count()).group_by(sub.c.date).order_by(sub.c.date.desc())).all()
+    stored_ahead = 0
+    i = 0
+    for j, v in enumerate(candidates):
+        while i < len(per_day) and per_day[i][0] >= v.date:
+            stored_ahead += per_day[i][1]
+            i += 1
+        if stored_ahead + j >= offset:
+            return j
+    return len(candidates)
+
+
+def _count_rows(session: Session, stmt) -> int:
+    """COUNT(*) over a filtered select (ordering removed)."""
+    # compute total count efficiently (remove ordering)
+    count_subq = stmt.order_by(None).subquery()
+    # execute count; result shape may be int or a row/tuple depending on SQLAlchemy
+    count_exec = session.exec(select(func.count()).select_from(count_subq))
+    count_val = None
+    try:
+        # prefer .one() if available
+        count_val = count_exec.one()
+    except Exception:
         try:
-            # prefer .one() if available
-            count_val = count_exec.one()
+            count_val = count_exec.first()
+        except Exception:
+            count_val = None
+
+    if count_val is None:
+        total = 0
+    elif isinstance(count_val, int):
+        total = int(count_val)
+    elif isinstance(count_val, (list, tuple)):
+        total = int(count_val[0] or 0)
+    else:
+        # Row-like object: try indexing or mapping
+        try:
+            total = int(count_val[0])
         except Exception:
             try:
-                count_val = count_exec.first()
-            except Exception:
-                count_val = None
-
-        if count_val is None:
-            total = 0
-        elif isinstance(count_val, int):
-            total = int(count_val)
-        elif isinstance(count_val, (list, tuple)):
-            total = int(count_val[0] or 0)
-        else:
-            # Row-like object: try indexing or mapping
-            try:
-                total = int(count_val[0])
+                # Row._mapping -> dict-like
+                total = int(next(iter(count_val)) or 0)
             except Exception:
-                try:
-                    # Row._mapping -> dict-like
-                    total = int(next(iter(count_val)) or 0)
-                except Exception:
-                    total = 0
+                total = 0
+    return int(total)
+
+
+def iter_transaction_batches(start: Optional[date] = None, end: Optional[date] = None, batch_size: int = 1000):
+    """
+    Stream (id, date, direction, major_category, sub_category, amount, description) tuples for
+    [start, end] ordered by (date DESC, id DESC), one list of up to `batch_size` rows at a time.
+    Rows come from a streaming cursor without ORM hydration; the session stays open until the
+    generator is exhausted or closed.
+    """
+    stmt = select(
+        Transaction.id,
+        Transaction.date,
+        Transaction.direction,
+        Transaction.major_category,
+        Transaction.sub_category,
+        Transaction.amount,
+        Transaction.description,
+    )
+    if start:
+        stmt = stmt.where(Transaction.date >= start)
+    if end:
+        stmt = stmt.where(Transaction.date <= end)
+    stmt = stmt.order_by(Transaction.date.desc(), Transaction.id.desc())
+    stmt = stmt.execution_options(stream_results=True, yield_per=batch_size)
+    with Session(engine) as session:
+        virtual = [
+            (v.id, v.date, v.direction, v.major_category, v.sub_category, v.amount, v.description)
+            for v in _virtual_fixed_transactions(session, start, end)
+        ]
+        partitions = session.execute(stmt).partitions()
+        if not virtual:
+            yield from partitions
+            return
+        rows = heapq.merge((row for part in partitions for row in part), virtual,
+                           key=lambda r: (r[1], r[0]), reverse=True)
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                return
+            yield batch
+
+
+def encode_cursor(d: date, tx_id: int) -> str:
+    """Opaque keyset cursor for the (date, id) position of a listed transaction."""
+    raw = f"{d.isoformat()}|{tx_id}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Tuple[date, int]:
+    """Inverse of encode_cursor. Raise ValueError on malformed tokens."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        d, tx_id = base64.urlsafe_b64decode(padded.encode("ascii")).decode("ascii").split("|")
+        return date.fromisoformat(d), int(tx_id)
+    except Exception:
+        raise ValueError(f"Invalid cursor: '{token}'")
+
+# engine -> (data_version, get_categories result); every committed write bumps data_version
+_categories_cache: "weakref.WeakKeyDictionary[Any, Tuple[int, Dict[str, Any]]]" = weakref.WeakKeyDictionary()
 
-        # apply ordering + limit/offset for page
-        stmt = stmt.order_by(Transaction.date.desc())
-        offset = max((page - 1) * per_page, 0)
-        stmt = stmt.offset(offset).limit(per_page)
-        page_items = session.exec(stmt).all()
-        return page_items, int(total)
 
 def get_categories() -> Dict[str, List[str]]:
     """
-    Return categories mapping: { "majors": [...], "subs": { major: [sub1, ...] } }
+    Sorted majors and major -> sorted subs of all transactions, read from the transaction_category
+    pairs (O(distinct categories), no transaction scan). Cached per engine until data_version moves,
+    so a warm call costs one version lookup; the returned dict is shared and must not be mutated.
     """
     with Session(engine) as session:
-        stmt = select(Transaction.major_category, Transaction.sub_category)
+        version = _get_data_version(session)
+        hit = _categories_cache.get(engine)
+        if hit and hit[0] == version:
+            return hit[1]
+        stmt = select(TransactionCategory.major_category, TransactionCategory.sub_category).where(
+            TransactionCategory.major_category != ""
+        )
         results = session.exec(stmt).all()
     majors = set()
     subs_map: Dict[str, set] = {}
     for major, sub in results:
-        if major:
-            majors.add(major)
-            subs_map.setdefault(major, set())
-            if sub:
-                subs_map[major].add(sub)
-    return {
+        majors.add(major)
+        subs_map.setdefault(major, set())
+        if sub:
+            subs_map[major].add(sub)
+    categories = {
         "majors": sorted(list(majors)),
         "subs": {k: sorted(list(v)) for k, v in subs_map.items()}
     }
+    _categories_cache[engine] = (version, categories)
+    return categories
 
 
 # --- Savings (Saving) helpers ---
+
+# Contribution schedules: frequency -> (period in days, period in months). Day-based schedules step
+# from start_date; month-based ones fall on day_of_month (start_date's day when unset, clamped to month
+# end) every `months` months counted from start_date's month. Other frequencies contribute nothing.
+SAVING_FREQUENCIES = {"weekly": (7, 0), "biweekly": (14, 0), "monthly": (0, 1), "quarterly": (0, 3), "yearly": (0, 12)}
+# interest_rate is an annual percentage: "simple" accrues linearly per day, "compound" compounds
+# annually (daily factor (1 + rate) ** (1 / 365)).
+SAVING_INTEREST_TYPES = ("simple", "compound")
+
+
+def _nth_contribution(frequency: str, start: date, day_of_month: int, k: int) -> date:
+    """k-th candidate date of a schedule (k = 0 is in start_date's period; it may precede start_date)."""
+    days, months = SAVING_FREQUENCIES[frequency]
+    if days:
+        return start + timedelta(days=k * days)
+    ym = start.year * 12 + start.month - 1 + k * months
+    return _month_occurrence(ym // 12, ym % 12 + 1, day_of_month)
+
+
+def _contribution_count(frequency: Optional[str], start: date, day_of_month: Optional[int], end: Optional[date],
+                        on_date: date) -> int:
+    """
+    Number of scheduled contributions in [start, min(end, on_date)], in O(1): every candidate between
+    the first and the last one falls inside the window, so only those two need a date check.
+    """
+    last = min(end, on_date) if end else on_date
+    if frequency not in SAVING_FREQUENCIES or last < start:
+        return 0
+    days, months = SAVING_FREQUENCIES[frequency]
+    if days:
+        return (last - start).days // days + 1
+    dom = day_of_month or start.day
+    k = ((last.year - start.year) * 12 + last.month - start.month) // months
+    count = k + 1
+    if _nth_contribution(frequency, start, dom, 0) < start:
+        count -= 1
+    if _nth_contribution(frequency, start, dom, k) > last:
+        count -= 1
+    return count
+
+
+class _ContributionSchedule:
+    """
+    Contribution dates of one schedule as ascending date ordinals, with running sums of the ordinals
+    and of the per-rate growth factors, generated once and extended on demand. Interest totals then
+    come from a bisect plus a pointer walk over the requested dates instead of a loop over every contribution.
+    """
+
+    def __init__(self, frequency: str, start: date, day_of_month: int, end: Optional[date]):
+        self._frequency = frequency
+        self._start = start
+        self._dom = day_of_month
+        self._end = end
+        self._next_k = 0
+        self._exhausted = False
+        self._ordinals: List[int] = []
+        self._ordinal_sums: List[int] = [0]
+        self._growth_sums: Dict[float, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def _extend(self, upto: int) -> None:
+        while not self._exhausted:
+            d = _nth_contribution(self._frequency, self._start, self._dom, self._next_k)
+            if self._end and d > self._end:
+                self._exhausted = True
+            elif d.toordinal() > upto:
+                return
+            elif d >= self._start:
+                self._ordinals.append(d.toordinal())
+                self._ordinal_sums.append(self._ordinal_sums[-1] + self._ordinals[-1])
+            self._next_k += 1
+
+    def totals(self, dates: List[date], daily_growth: Optional[float] = None) -> List[Tuple[int, int, float]]:
+        """
+        For each of the ascending `dates`: (n, sum of ordinals, sum of daily_growth ** (start - date)) over
+        the contributions on or before it, from one pointer walk; the growth sum is 0.0 without daily_growth.
+        """
+        out = []
+        with self._lock:
+            self._extend(dates[-1].toordinal())
+            ordinals, ordinal_sums = self._ordinals, self._ordinal_sums
+            sums = None
+            if daily_growth is not None:
+                sums = self._growth_sums.setdefault(daily_growth, [0.0])
+                origin = self._start.toordinal()
+                for o in ordinals[len(sums) - 1:]:
+                    sums.append(sums[-1] + daily_growth ** (origin - o))
+            n = bisect.bisect_right(ordinals, dates[0].toordinal())
+            for d in dates:
+                upto = d.toordinal()
+                while n < len(ordinals) and ordinals[n] <= upto:
+                    n += 1
+                out.append((n, ordinal_sums[n], sums[n] if sums else 0.0))
+        return out
+
+
+    def between(self, first: int, last: int) -> List[int]:
+        """Contribution date ordinals in [first, last]."""
+        with self._lock:
+            self._extend(last)
+            ordinals = self._ordinals
+            return ordinals[bisect.bisect_left(ordinals, first):bisect.bisect_right(ordinals, last)]
+
+
+@functools.lru_cache(maxsize=1024)
+def _contribution_schedule(frequency: str, start: date, day_of_month: int, end: Optional[date]) -> _ContributionSchedule:
+    return _ContributionSchedule(frequency, start, day_of_month, end)
+
+
+def _saving_balance(s: Saving, on_date: date) -> float:
+    """
+    Predicted balance of one saving on on_date (0 when withdrawn): initial_balance plus every scheduled
+    contribution up to on_date, with interest from start_date (principal) or the contribution date
+    until on_date or maturity (end_date), whichever is earlier. Without interest the contribution
+    count is the O(1) _contribution_count; with interest see _saving_balances.
+    """
+    if s.withdrawn:
+        return 0.0
+    if s.interest_rate and s.start_date:
+        return _saving_balances(s, [on_date])[0]
+    amount = float(s.contribution_amount or 0.0)
+    n = _contribution_count(s.frequency, s.start_date, s.day_of_month, s.end_date, on_date) if amount and s.start_date else 0
+    return float(s.initial_balance or 0.0) + n * amount
+
+
+def _saving_balances(s: Saving, dates: List[date]) -> List[float]:
+    """_saving_balance at each of the ascending `dates`, from one walk over the saving's cached schedule."""
+    if s.withdrawn:
+        return [0.0] * len(dates)
+    principal = float(s.initial_balance or 0.0)
+    amount = float(s.contribution_amount or 0.0)
+    rate = float(s.interest_rate or 0.0) / 100 if s.start_date else 0.0
+    compound = bool(rate) and s.interest_type == "compound"
+    daily_growth = (1 + rate) ** (1 / 365) if compound else None
+    if amount and s.start_date and s.frequency in SAVING_FREQUENCIES:
+        schedule = _contribution_schedule(s.frequency, s.start_date, s.day_of_month or s.start_date.day, s.end_date)
+        totals = schedule.totals(dates, daily_growth)
+    else:
+        totals = [(0, 0, 0.0)] * len(dates)
+    out = []
+    for d, (n, ordinal_sum, growth_sum) in zip(dates, totals):
+        if not rate:
+            out.append(principal + n * amount)
+            continue
+        accrue_to = min(s.end_date, d) if s.end_date else d
+        elapsed = max((accrue_to - s.start_date).days, 0)
+        if compound:
+            # every contribution falls in [start_date, accrue_to]: grow them all from start_date at once
+            out.append((principal + amount * growth_sum) * daily_growth ** elapsed)
+        else:
+            # simple: each amount earns rate / 365 per day it was held
+            held_days = principal * elapsed + amount * (n * accrue_to.toordinal() - ordinal_sum)
+            out.append(principal + n * amount + rate / 365 * held_days)
+    return out
+
 def create_saving(data: Dict[str, Any]) -> Saving:
     """
     Create a saving entry. Fields:
@@ -555,6 +1608,9 @@ def create_saving(data: Dict[str, Any]) -> Saving:
             dom = int(dom)
         except Exception:
             raise ValueError(f"Invalid day_of_month: {dom}")
+    frequency = _coerce_saving_choice("frequency", data.get("frequency"), SAVING_FREQUENCIES, "monthly")
+    interest_type = _coerce_saving_choice("interest_type", data.get("interest_type"), SAVING_INTEREST_TYPES, "simple")
+    rate = _coerce_interest_rate(data.get("interest_rate", 0.0))
 
     s = Saving(
         name=data.get("name"),
@@ -564,16 +1620,38 @@ def create_saving(data: Dict[str, Any]) -> Saving:
         start_date=start,
         end_date=end,
         day_of_month=dom,
-        frequency=data.get("frequency", "monthly"),
+        frequency=frequency,
+        interest_rate=rate,
+        interest_type=interest_type,
         withdrawn=bool(data.get("withdrawn", False)),
         active=bool(data.get("active", True))
     )
     with Session(engine) as session:
         session.add(s)
+        _touch_range(session, s.start_date, s.end_date)
         session.commit()
         session.refresh(s)
     return s
 
+def _coerce_saving_choice(name: str, value: Any, allowed, default: str) -> str:
+    """Validate a frequency/interest_type; None or "" (rows saved before the column was validated) mean `default`."""
+    if value is None or value == "":
+        return default
+    if value not in allowed:
+        raise ValueError(f"Invalid {name}: {value} (expected one of {', '.join(allowed)})")
+    return value
+
+
+def _coerce_interest_rate(value: Any) -> float:
+    """Annual interest rate in percent; must stay above -100."""
+    try:
+        rate = float(value or 0.0)
+    except Exception:
+        raise ValueError(f"Invalid interest_rate: {value}")
+    if rate <= -100:
+        raise ValueError(f"Invalid interest_rate: {value}")
+    return rate
+
 def list_savings() -> List[Saving]:
     with Session(engine) as session:
         return session.exec(select(Saving)).all()
@@ -587,6 +1665,7 @@ def update_saving(sid: int, patch: Dict[str, Any]) -> Optional[Saving]:
         s = session.get(Saving, sid)
         if not s:
             return None
+        _touch_range(session, s.start_date, s.end_date)
         for k, v in patch.items():
             if not hasattr(s, k):
                 continue
@@ -602,8 +1681,16 @@ def update_saving(sid: int, patch: Dict[str, Any]) -> Optional[Saving]:
                     v = int(v)
                 except Exception:
                     raise ValueError(f"Invalid day_of_month: {patch.get('day_of_month')}")
+            # a legacy frequency sent back unchanged (e.g. by the edit form) is kept: it contributes nothing
+            if k == "frequency" and v != s.frequency:
+                v = _coerce_saving_choice(k, v, SAVING_FREQUENCIES, "monthly")
+            if k == "interest_type":
+                v = _coerce_saving_choice(k, v, SAVING_INTEREST_TYPES, "simple")
+            if k == "interest_rate":
+                v = _coerce_interest_rate(v)
             setattr(s, k, v)
         session.add(s)
+        _touch_range(session, s.start_date, s.end_date)
         session.commit()
         session.refresh(s)
         return s
@@ -613,15 +1700,17 @@ def delete_saving(sid: int) -> bool:
         s = session.get(Saving, sid)
         if not s:
             return False
+        _touch_range(session, s.start_date, s.end_date)
         session.delete(s)
         session.commit()
         return True
 
 def forecast_savings(on_date: date) -> Dict[str, Any]:
     """
-    For each active, not-withdrawn saving, compute predicted balance up to 'on_date':
-    balance = initial_balance + sum(contributions on each scheduled date <= on_date)
-    Only supports monthly frequency (frequency == 'monthly') and day_of_month scheduling.
+    For each active saving, compute predicted balance up to 'on_date' (see _saving_balance):
+    balance = initial_balance + contributions scheduled on or before on_date (+ interest), 0 when withdrawn.
+    Contributions follow SAVING_FREQUENCIES; without interest their count is computed in closed form
+    (_contribution_count), with interest the totals come from cached _ContributionSchedule arrays.
     Returns { "date": ISO, "total": x, "items": [ {saving fields..., predicted_balance} ] }
     """
     with Session(engine) as session:
@@ -630,27 +1719,7 @@ def forecast_savings(on_date: date) -> Dict[str, Any]:
     total = 0.0
     items = []
     for s in savings:
-        if s.withdrawn:
-            predicted = 0.0
-        else:
-            predicted = float(s.initial_balance or 0.0)
-            # contributions
-            if s.contribution_amount and s.start_date:
-                # contribution dates from start_date until min(end_date or on_date, on_date)
-                contrib_end = min(s.end_date, on_date) if s.end_date else on_date
-                if contrib_end >= s.start_date:
-                    # iterate months
-                    for y, m in _iter_months(s.start_date, contrib_end):
-                        if s.frequency != "monthly":
-                            continue  # only monthly supported for now
-                        last_day = calendar.monthrange(y, m)[1]
-                        if s.day_of_month:
-                            day = min(s.day_of_month, last_day)
-                        else:
-                            day = min(s.start_date.day, last_day)
-                        occ = date(y, m, day)
-                        if occ <= on_date and occ >= s.start_date and (not s.end_date or occ <= s.end_date):
-                            predicted += float(s.contribution_amount)
+        predicted = _saving_balance(s, on_date)
         total += predicted
         items.append({
             "id": s.id,
@@ -662,6 +1731,131 @@ def forecast_savings(on_date: date) -> Dict[str, Any]:
         })
     return {"date": on_date.isoformat(), "total": total, "items": items}
 
+
+FORECAST_SERIES_STEPS = ("day", "week", "month")
+# upper bound on points per series request (about 27 years of days)
+FORECAST_SERIES_MAX_STEPS = 10000
+
+
+def _series_dates(start: date, end: date, step: str) -> List[date]:
+    """
+    Sample dates in [start, end]: every day, every 7 days, or the start day of every month
+    (clamped to month end). Raise ValueError for an unknown step or too many points.
+    """
+    if step not in FORECAST_SERIES_STEPS:
+        raise ValueError(f"Invalid step: '{step}' (expected one of {', '.join(FORECAST_SERIES_STEPS)})")
+    if end < start:
+        raise ValueError("end must not be before start")
+    days = (end - start).days
+    n = {"day": days + 1, "week": days // 7 + 1,
+         "month": (end.year - start.year) * 12 + end.month - start.month + 1}[step]
+    if n > FORECAST_SERIES_MAX_STEPS:
+        raise ValueError(f"Too many points: {n} (max {FORECAST_SERIES_MAX_STEPS}); use a larger step")
+    if step == "month":
+        return [d for d in (_month_occurrence(y, m, start.day) for y, m in _iter_months(start, end)) if d <= end]
+    stride = 7 if step == "week" else 1
+    return [start + timedelta(days=k * stride) for k in range(n)]
+
+
+def forecast_savings_series(start: date, end: date, step: str = "month") -> Dict[str, Any]:
+    """
+    forecast_savings evaluated at every sample date of _series_dates(start, end, step) in one pass:
+    savings are read once, and each item's curve comes from one pointer walk over its cached contribution
+    schedule (running counts / ordinal sums / growth sums), so the cost per item is O(steps + contributions).
+    Returns { "start", "end", "step", "dates": [ISO...], "total": [...], "items": [ {id, name, kind, balances} ] };
+    balances[k] / total[k] equal forecast_savings(dates[k]).
+    """
+    dates = _series_dates(start, end, step)
+    with Session(engine) as session:
+        savings = session.exec(select(Saving).where(Saving.active == True)).all()
+
+    items = [{"id": s.id, "name": s.name, "kind": s.kind, "balances": _saving_balances(s, dates)} for s in savings]
+    # summed in item order, like forecast_savings' running total
+    total = [sum(col) for col in zip(*(it["balances"] for it in items))] if items else [0.0] * len(dates)
+    return {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "step": step,
+        "dates": [d.isoformat() for d in dates],
+        "total": total,
+        "items": items,
+    }
+
+def _net_before(session: Session, start: date) -> float:
+    """Income minus expense of everything recorded before start (daily_rollup + virtual fixed occurrences)."""
+    stmt = select(func.sum(case((_rollup_is_income(), DailyRollup.amount), else_=-DailyRollup.amount))).where(
+        DailyRollup.date < start
+    )
+    net = float(session.exec(stmt).one() or 0)
+    for v in _virtual_fixed_transactions(session, None, start - timedelta(days=1)):
+        net -= v.amount
+    return net
+
+
+def get_projection(start: date, end: date, step: str = "day", opening_balance: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Cash-flow projection over the sample dates of _series_dates(start, end, step).
+
+    Every source is scattered into day-indexed arrays over [start, last sample] in one pass:
+    recorded income/expense per day from daily_rollup (which already holds materialized fixed
+    expenses; virtual ones are expanded from their rules, as in get_calendar_days) and the contribution
+    dates of every active, non-withdrawn saving (cash moved out to savings). The cash balance is then a
+    running sum (itertools.accumulate) from opening_balance, which defaults to the net of everything
+    recorded before start minus the contributions those savings made before start, so the balance on a
+    given day does not depend on the requested start. Cost is O(days + contributions) plus one
+    savings curve per saving.
+
+    Returns { "start", "end", "step", "opening_balance", "dates": [ISO...], "income", "expense",
+    "savings", "balance", "savings_balance" }: income/expense/savings are the flows of the days since
+    the previous sample date (through dates[k]), balance is the cash after dates[k], and
+    savings_balance[k] equals forecast_savings(dates[k])["total"].
+    """
+    dates = _series_dates(start, end, step)
+    last = dates[-1]
+    with Session(engine) as session:
+        days = _get_calendar_days(session, start, last)
+        net_before = _net_before(session, start) if opening_balance is None else None
+        savings = session.exec(select(Saving).where(Saving.active == True)).all()
+
+    origin, n_days = start.toordinal(), (last - start).days + 1
+    income, expense, saved = [0.0] * n_days, [0.0] * n_days, [0.0] * n_days
+    for d in days:
+        income[d.date.toordinal() - origin] = d.income
+        expense[d.date.toordinal() - origin] = d.expense
+    saved_before = 0.0
+    for s in savings:
+        amount = float(s.contribution_amount or 0.0)
+        if s.withdrawn or not amount or not s.start_date or s.frequency not in SAVING_FREQUENCIES:
+            continue
+        dom = s.day_of_month or s.start_date.day
+        saved_before += amount * _contribution_count(s.frequency, s.start_date, dom, s.end_date, start - timedelta(days=1))
+        for o in _contribution_schedule(s.frequency, s.start_date, dom, s.end_date).between(origin, last.toordinal()):
+            saved[o - origin] += amount
+    if opening_balance is None:
+        opening_balance = net_before - saved_before
+    balance = list(accumulate((i - e - c for i, e, c in zip(income, expense, saved)), initial=float(opening_balance)))
+
+    curves = [_saving_balances(s, dates) for s in savings]
+    bounds = [0] + [(d - start).days + 1 for d in dates]
+
+    def window(flows: List[float]) -> List[float]:
+        # flows of the days after the previous sample date through each sample date
+        return [sum(flows[a:b]) for a, b in zip(bounds, bounds[1:])]
+
+    return {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "step": step,
+        "opening_balance": float(opening_balance),
+        "dates": [d.isoformat() for d in dates],
+        "income": window(income),
+        "expense": window(expense),
+        "savings": window(saved),
+        "balance": [balance[b] for b in bounds[1:]],
+        "savings_balance": [sum(col) for col in zip(*curves)] if curves else [0.0] * len(dates),
+    }
+
+
 def get_setting_categories() -> Dict[str, List[str]]:
     """Return persisted major and sub lists from dedicated tables."""
     with Session(engine) as session:
@@ -678,6 +1872,7 @@ def set_setting_categories(majors: List[str], subs: List[str]) -> None:
     This implementation deletes existing rows and inserts new ones.
     """
     with Session(engine) as session:
+        _mark_changed(session)
         # delete all existing rows
         existing_majors = session.exec(select(CategoryMajor)).all()
         for em in existing_majors:
@@ -699,4 +1894,5 @@ def set_setting_categories(majors: List[str], subs: List[str]) -> None:
             if not name:
                 continue
             session.add(CategorySub(name=name))
+        _mark_changed(session)
         session.commit()
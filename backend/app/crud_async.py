@@ -0,0 +1,103 @@
+"""
+Async read API over the same queries as crud.
+
+Each function opens an AsyncSession on an AsyncEngine (aiosqlite for the SQLite file, psycopg's async
+mode for PostgreSQL) and runs crud's session-taking internals through AsyncSession.run_sync, so the
+query code lives in one place and async endpoints never block a threadpool worker on DB I/O.
+The sync functions in crud stay available for tests, scripts and write endpoints.
+"""
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from . import crud
+from .models_core import DATABASE_URL, Transaction, configure_sqlite_engine, pool_options_from_env
+
+# async driver per backend; sync-only drivers in MONEY_CALENDAR_DATABASE_URL are swapped for these
+_ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "psycopg"}
+
+
+def async_database_url(url: Optional[str] = None) -> str:
+    """The async-driver form of `url` (default: DATABASE_URL), e.g. sqlite:///x.db -> sqlite+aiosqlite:///x.db."""
+    parsed = make_url(url or DATABASE_URL)
+    backend = parsed.get_backend_name()
+    driver = _ASYNC_DRIVERS.get(backend)
+    if driver is None:
+        raise ValueError(f"No async driver configured for '{backend}'")
+    return parsed.set(drivername=f"{backend}+{driver}").render_as_string(hide_password=False)
+
+
+def create_async_app_engine(url: Optional[str] = None, environ=None):
+    """AsyncEngine counterpart of models_core.create_app_engine (same PRAGMA profile / pool settings)."""
+    async_url = async_database_url(url)
+    if make_url(async_url).get_backend_name() == "sqlite":
+        async_engine = create_async_engine(async_url, echo=False)
+        # connect events fire on the sync facade of the async engine
+        configure_sqlite_engine(async_engine.sync_engine)
+        return async_engine
+    return create_async_engine(async_url, echo=False, **pool_options_from_env(environ))
+
+
+engine = create_async_app_engine()
+
+
+async def query_transactions(start: Optional[date] = None,
+                             end: Optional[date] = None,
+                             tx_type: Optional[str] = None,
+                             search: Optional[str] = None,
+                             page: int = 1,
+                             per_page: int = 100,
+                             after: Optional[Tuple[date, int]] = None,
+                             include_total: bool = True) -> Tuple[List[Transaction], Optional[int]]:
+    """Async crud.query_transactions."""
+    async with AsyncSession(engine) as session:
+        return await session.run_sync(
+            crud._query_transactions, start, end, tx_type, search, page, per_page, after, include_total
+        )
+
+
+async def query_transaction_rows(start: Optional[date] = None,
+                                 end: Optional[date] = None,
+                                 tx_type: Optional[str] = None,
+                                 search: Optional[str] = None,
+                                 page: int = 1,
+                                 per_page: int = 100,
+                                 after: Optional[Tuple[date, int]] = None,
+                                 include_total: bool = True) -> Tuple[List[tuple], Optional[int]]:
+    """Async crud.query_transaction_rows."""
+    async with AsyncSession(engine) as session:
+        return await session.run_sync(
+            crud._query_transactions, start, end, tx_type, search, page, per_page, after, include_total, True
+        )
+
+async def get_summary(start: Optional[date] = None, end: Optional[date] = None) -> Dict[str, Any]:
+    """Async crud.get_summary."""
+    async with AsyncSession(engine) as session:
+        return await session.run_sync(crud._get_summary, start, end)
+
+
+async def get_daily_totals(start: Optional[date] = None, end: Optional[date] = None):
+    """Async crud.get_daily_totals."""
+    async with AsyncSession(engine) as session:
+        return await session.run_sync(crud._get_daily_totals, start, end)
+
+
+async def get_calendar_days(start: date, end: date) -> List[crud.CalendarDay]:
+    """Async crud.get_calendar_days."""
+    async with AsyncSession(engine) as session:
+        return await session.run_sync(crud._get_calendar_days, start, end)
+
+
+async def get_data_version() -> int:
+    """Async crud.get_data_version."""
+    async with AsyncSession(engine) as session:
+        return await session.run_sync(crud._get_data_version)
+
+
+async def get_data_changes(after: int, upto: int) -> List[crud.DataChangeRow]:
+    """Async crud.get_data_changes."""
+    async with AsyncSession(engine) as session:
+        return await session.run_sync(crud._get_data_changes, after, upto)
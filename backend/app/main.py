@@ -1,11 +1,17 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, UploadFile, File, Request, Response
 from fastapi.responses import StreamingResponse, PlainTextResponse
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from typing import Optional, List
 from .models_core import create_db_and_tables
-from .crud import create_transactions_bulk, get_summary, create_fixed_expense, list_fixed_expenses, query_transactions, get_transaction, get_categories, update_transaction, delete_transaction, update_fixed_expense, delete_fixed_expense, create_saving, list_savings, update_saving, delete_saving, forecast_savings, get_setting_categories, set_setting_categories
+from . import crud, crud_async
+from .cache import response_cache, MISS
+from .utils import fast_json
+from .crud import TX_LIST_FIELDS, get_data_version, create_transactions_bulk, aggregate_transactions, ensure_daily_rollup, encode_cursor, decode_cursor, iter_transaction_batches, import_transactions_csv, create_fixed_expense, list_fixed_expenses, get_transaction, get_categories, update_transaction, delete_transaction, update_fixed_expense, delete_fixed_expense, create_saving, list_savings, update_saving, delete_saving, forecast_savings, forecast_savings_series, get_projection, get_setting_categories, set_setting_categories
 import logging
 import csv
+import hashlib
+from collections import deque
+import io
 
 app = FastAPI(title="Money Calendar - Backend")
 
@@ -13,6 +19,15 @@ app = FastAPI(title="Money Calendar - Backend")
 @app.on_event("startup")
 def on_startup():
     create_db_and_tables()
+    try:
+        ensure_daily_rollup()
+    except Exception:
+        logging.exception("ensure_daily_rollup failed")
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    await crud_async.engine.dispose()
 
 
 def _parse_date_param(s: Optional[str], name: str) -> Optional[date]:
@@ -41,6 +56,15 @@ def _serialize_transaction(t) -> dict:
     }
 
 
+def _transaction_list_body(rows, total: Optional[int], page: int, per_page: int, next_cursor: Optional[str]) -> bytes:
+    """
+    Pre-encoded /api/transactions body from TX_LIST_FIELDS tuples; same bytes as returning the
+    _serialize_transaction dicts through FastAPI's JSONResponse, without jsonable_encoder.
+    """
+    items = [dict(zip(TX_LIST_FIELDS, r)) for r in rows]
+    return fast_json.dumps({"items": items, "total": total, "page": page, "per_page": per_page, "next_cursor": next_cursor})
+
+
 def _serialize_fixed_expense(fe) -> dict:
     return {
         "id": fe.id,
@@ -66,6 +90,8 @@ def _serialize_saving(it) -> dict:
         "end_date": it.end_date.isoformat() if it.end_date else None,
         "day_of_month": it.day_of_month,
         "frequency": it.frequency,
+        "interest_rate": it.interest_rate,
+        "interest_type": it.interest_type,
         "withdrawn": it.withdrawn,
         "active": it.active,
     }
@@ -84,23 +110,35 @@ def _build_summary_map(items) -> dict:
 
 
 @app.get("/api/transactions")
-def api_transactions(start: Optional[str] = Query(None), end: Optional[str] = Query(None),
-                     type: Optional[str] = Query(None), search: Optional[str] = Query(None),
-                     page: int = Query(1, ge=1), per_page: int = Query(100, ge=1, le=1000)):
+async def api_transactions(request: Request, response: Response,
+                           start: Optional[str] = Query(None), end: Optional[str] = Query(None),
+                           type: Optional[str] = Query(None), search: Optional[str] = Query(None),
+                           page: int = Query(1, ge=1), per_page: int = Query(100, ge=1, le=1000),
+                           after: Optional[str] = Query(None), include_total: bool = Query(True)):
     """
     DB-first transaction listing with optional filters:
     start/end: YYYY-MM-DD inclusive
     type: substring match
     search: substring search in category/major/sub/description
-    pagination: page (1-based) and per_page
+    pagination: page (1-based) and per_page, or keyset mode with `after` = previous `next_cursor`
+    include_total=false skips the total count (total is null)
     """
     parsed_start = _parse_date_param(start, "start") if start else None
     parsed_end = _parse_date_param(end, "end") if end else None
+    try:
+        parsed_after = decode_cursor(after) if after else None
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+    not_modified = _not_modified(request, response, await crud_async.get_data_version())
+    if not_modified:
+        return not_modified
 
     try:
-        items, total = query_transactions(parsed_start, parsed_end, type, search, page, per_page)
-        out = [_serialize_transaction(t) for t in items]
-        return {"items": out, "total": total, "page": page, "per_page": per_page}
+        rows, total = await crud_async.query_transaction_rows(parsed_start, parsed_end, type, search, page, per_page,
+                                                              after=parsed_after, include_total=include_total)
+        next_cursor = encode_cursor(rows[-1].date, rows[-1].id) if len(rows) == per_page else None
+        body = _transaction_list_body(rows, total, page, per_page, next_cursor)
+        return Response(content=body, media_type="application/json", headers=dict(response.headers))
     except Exception as e:
         logging.exception("api_transactions error")
         raise HTTPException(status_code=500, detail=str(e))
@@ -121,11 +159,68 @@ async def api_transactions_create(payload: List[dict]):
     except Exception as e:
         logging.exception("create_transactions_bulk failed")
         raise HTTPException(status_code=500, detail="failed to persist transactions")
-    # return created count and ids minimally
-    out = [{"id": getattr(t, "id", None), "date": t.date.isoformat() if t.date else None, "amount": t.amount} for t in created]
+    # return created count and ids minimally (built from the normalized input, no re-read)
+    out = [{"id": t["id"], "date": t["date"].isoformat() if t.get("date") else None, "amount": t.get("amount")} for t in created]
     return {"created": len(out), "items": out}
 
 
+@app.post("/api/transactions/import", status_code=201)
+def api_transactions_import(file: UploadFile = File(...)):
+    """
+    Bulk-import a CSV upload (multipart field 'file'; columns as in app.utils.csv_parser).
+    Rows are parsed and inserted in fixed-size batches within one DB transaction.
+    """
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        ids = import_transactions_csv(stream)
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+    except Exception:
+        logging.exception("import_transactions_csv failed")
+        raise HTTPException(status_code=500, detail="failed to import transactions")
+    return {"created": len(ids), "ids": ids}
+
+
+# static /api/transactions/* routes must be registered before /api/transactions/{txn_id}
+def _iter_transactions_csv(start: Optional[date], end: Optional[date]):
+    """Yield the transactions CSV one chunk per DB batch so memory stays flat for any export size."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(["id", "date", "type", "major_category", "sub_category", "amount", "description"])
+    yield buf.getvalue()
+    for batch in iter_transaction_batches(start, end):
+        buf.seek(0)
+        buf.truncate(0)
+        for tx_id, d, direction, major, sub, amount, description in batch:
+            writer.writerow([tx_id, d.isoformat() if d else "", direction, major, sub, amount, description or ""])
+        yield buf.getvalue()
+
+
+@app.get("/api/transactions/export")
+def api_transactions_export(start: Optional[str] = Query(None), end: Optional[str] = Query(None), kind: Optional[str] = Query("summary")):
+    """
+    Export CSV of either 'summary' or raw 'transactions' within optional start/end.
+    """
+    s = _parse_date_param(start, "start") if start else None
+    e = _parse_date_param(end, "end") if end else None
+    headers = {"Content-Disposition": f'attachment; filename="export_{start or "all"}_{end or "all"}.csv"'}
+    if kind == "transactions":
+        return StreamingResponse(_iter_transactions_csv(s, e), media_type="text/csv", headers=headers)
+
+    output = io.StringIO()
+    writer = csv.writer(output)
+    # grouped in SQL: only one row per (type, major, category, sub) is loaded
+    summary_map = _build_summary_map(aggregate_transactions(s, e))
+    writer.writerow(["type", "major", "sub", "amount"])
+    for tk in summary_map:
+        for mj in summary_map[tk]:
+            for sb in summary_map[tk][mj]:
+                writer.writerow([tk, mj, sb, summary_map[tk][mj][sb]])
+
+    output.seek(0)
+    return StreamingResponse(output, media_type="text/csv", headers=headers)
+
+
 @app.get("/api/transactions/{txn_id}")
 def api_transaction_get(txn_id: int):
     tx = get_transaction(txn_id)
@@ -142,8 +237,22 @@ def api_transaction_get(txn_id: int):
     }
 
 
+def _reject_fixed_occurrence(txn_id: int) -> None:
+    """
+    In "virtual" mode negative ids are fixed-expense occurrences expanded on read with no stored row:
+    answer 409 and point to the fixed-expense API instead of failing inside crud. In "materialized"
+    mode no such rows exist, so negative ids fall through to the usual 404.
+    """
+    if txn_id < 0 and crud.FIXED_EXPENSE_MODE == "virtual":
+        raise HTTPException(
+            status_code=409,
+            detail="fixed-expense occurrence: change or delete it through /api/fixed_expenses/{fe_id}",
+        )
+
+
 @app.put("/api/transactions/{txn_id}")
 def api_transaction_put(txn_id: int, payload: dict):
+    _reject_fixed_occurrence(txn_id)
     tx = get_transaction(txn_id)
     if not tx:
         raise HTTPException(status_code=404, detail="not found")
@@ -155,6 +264,7 @@ def api_transaction_put(txn_id: int, payload: dict):
 
 @app.patch("/api/transactions/{txn_id}")
 def api_transaction_patch(txn_id: int, payload: dict):
+    _reject_fixed_occurrence(txn_id)
     tx = get_transaction(txn_id)
     if not tx:
         raise HTTPException(status_code=404, detail="not found")
@@ -166,111 +276,223 @@ def api_transaction_patch(txn_id: int, payload: dict):
 
 @app.delete("/api/transactions/{txn_id}", status_code=204)
 def api_transaction_delete(txn_id: int):
+    _reject_fixed_occurrence(txn_id)
     success = delete_transaction(txn_id)
     if not success:
         raise HTTPException(status_code=404, detail="not found")
     return PlainTextResponse(status_code=204, content="")
 
 
+def _etag_for(request: Request, version: int) -> str:
+    """
+    Weak ETag from the data_version counter and the request (path + sorted query params). Today's date
+    is mixed in because some endpoints default to the current month.
+    """
+    params = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    digest = hashlib.blake2b(f"{request.url.path}?{params}|{date.today()}".encode(), digest_size=8).hexdigest()
+    return f'W/"{version}-{digest}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison against an If-None-Match header (list of tags or "*")."""
+    if not if_none_match:
+        return False
+    opaque = etag[2:]
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or (candidate[2:] if candidate.startswith("W/") else candidate) == opaque:
+            return True
+    return False
+
+
+def _not_modified(request: Request, response: Response, version: int) -> Optional[Response]:
+    """
+    Set ETag/Cache-Control on `response`; return a 304 response when If-None-Match already matches,
+    in which case the handler returns it without computing or serializing the body.
+    """
+    headers = {"ETag": _etag_for(request, version), "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+async def _sync_response_cache(version: int) -> None:
+    """
+    Bring response_cache up to `version`: writes committed by this process were invalidated on commit,
+    the ones from other workers or processes are replayed from data_change and drop only the overlapping
+    entries. If the log cannot account for every version in between (pruned, or a write outside crud),
+    or the version went backwards (database replaced), everything is dropped.
+    """
+    synced = response_cache.synced_version
+    if synced == version:
+        return
+    if synced is None or version < synced:
+        response_cache.clear()
+    else:
+        changes = await crud_async.get_data_changes(synced, version)
+        if len(changes) != version - synced:
+            response_cache.clear()
+        else:
+            origin = crud.change_origin()
+            for _, writer, ranges in changes:
+                if writer != origin:
+                    for start, end in ranges:
+                        response_cache.invalidate_range(start, end)
+    response_cache.synced_version = max(version, response_cache.synced_version or 0)
+
+
+async def _cached(key: tuple, version: int, start: Optional[date], end: Optional[date], compute):
+    """
+    Serve `key` from response_cache, or await compute() and cache it for the [start, end] range.
+    `version` is the data_version the handler read; other processes' writes up to it are applied first.
+    """
+    await _sync_response_cache(version)
+    hit = response_cache.get(key)
+    if hit is not MISS:
+        return hit
+    # read before computing: a write committed meanwhile bumps the generation and the result is not cached
+    generation = response_cache.generation
+    value = await compute()
+    response_cache.put(key, start, end, value, generation)
+    return value
+
+
 @app.get("/api/summary")
-def api_summary(start: Optional[str] = Query(None), end: Optional[str] = Query(None)):
+async def api_summary(request: Request, response: Response,
+                      start: Optional[str] = Query(None), end: Optional[str] = Query(None)):
     s = _parse_date_param(start, "start") if start else None
     e = _parse_date_param(end, "end") if end else None
+    version = await crud_async.get_data_version()
+    not_modified = _not_modified(request, response, version)
+    if not_modified:
+        return not_modified
     try:
-        result = get_summary(s, e)
+        result = await _cached(("summary", s, e), version, s, e, lambda: crud_async.get_summary(s, e))
         return result
     except Exception:
         logging.exception("get_summary failed")
         raise HTTPException(status_code=500, detail="summary error")
 
 
+# rows fetched per keyset page while streaming /api/daily
+DAILY_PAGE_SIZE = 1000
+
+
 @app.get("/api/daily")
-def api_daily(start: Optional[str] = Query(None), end: Optional[str] = Query(None)):
+async def api_daily(request: Request, response: Response,
+                    start: Optional[str] = Query(None), end: Optional[str] = Query(None),
+                    fmt: str = Query("json", alias="format", pattern="^(json|ndjson)$")):
+    """
+    Day groups { date, income, expense, transactions[] } in date-descending order, streamed as each
+    day completes: a chunked JSON array (default, same body as before) or NDJSON with format=ndjson.
+    Transactions are read in keyset pages of DAILY_PAGE_SIZE rows, so memory does not grow with the range.
+    """
     s = _parse_date_param(start, "start") if start else None
     e = _parse_date_param(end, "end") if end else None
-    # reuse query_transactions to obtain matching txns (no pagination)
-    items, _ = query_transactions(s, e, None, None, page=1, per_page=10000)
-    # group by date
-    out = {}
-    for t in items:
-        key = t.date.isoformat()
-        if key not in out:
-            out[key] = {"date": key, "income": 0.0, "expense": 0.0, "transactions": []}
-        amt = float(t.amount or 0)
-        is_income = _is_income_direction(t.direction)
-        if is_income:
-            out[key]["income"] += amt
-        else:
-            out[key]["expense"] += amt
-        out[key]["transactions"].append({
-            "id": t.id, "date": key, "type": t.direction, "major_category": t.major_category,
-            "sub_category": t.sub_category, "amount": t.amount, "description": t.description
-        })
-    # return as list sorted desc
-    entries = sorted(out.values(), key=lambda x: x["date"], reverse=True)
-    return entries
+    not_modified = _not_modified(request, response, await crud_async.get_data_version())
+    if not_modified:
+        return not_modified
+    groups = _iter_daily_groups(s, e)
+    if fmt == "ndjson":
+        return StreamingResponse(_ndjson_chunks(groups), media_type="application/x-ndjson", headers=dict(response.headers))
+    return StreamingResponse(_json_array_chunks(groups), media_type="application/json", headers=dict(response.headers))
+
+
+async def _iter_daily_groups(s: Optional[date], e: Optional[date]):
+    # day totals come from daily_rollup (one row per day/direction); rows only fill the transaction lists
+    totals = {}
+    for r in await crud_async.get_daily_totals(s, e):
+        slot = totals.setdefault(r.date, [0.0, 0.0])
+        slot[0 if _is_income_direction(r.direction) else 1] += float(r.amount or 0)
+    # days that have totals but no listed rows are still emitted, in date order
+    pending = deque(sorted(totals, reverse=True))
+
+    def group(d: date) -> dict:
+        income, expense = totals.get(d, (0.0, 0.0))
+        return {"date": d.isoformat(), "income": income, "expense": expense, "transactions": []}
+
+    current = None
+    after = None
+    while True:
+        rows, _ = await crud_async.query_transaction_rows(s, e, None, None, per_page=DAILY_PAGE_SIZE, after=after,
+                                                          include_total=False)
+        for t in rows:
+            if current is None or t.date.isoformat() != current["date"]:
+                # rows arrive in (date DESC, id DESC) order: a new date means the previous day is complete
+                if current is not None:
+                    yield current
+                while pending and pending[0] > t.date:
+                    yield group(pending.popleft())
+                if pending and pending[0] == t.date:
+                    pending.popleft()
+                current = group(t.date)
+            current["transactions"].append({
+                "id": t.id, "date": current["date"], "type": t.type, "major_category": t.major_category,
+                "sub_category": t.sub_category, "amount": t.amount, "description": t.description
+            })
+        if len(rows) < DAILY_PAGE_SIZE:
+            break
+        after = (rows[-1].date, rows[-1].id)
+    if current is not None:
+        yield current
+    for d in pending:
+        yield group(d)
+
+
+async def _json_array_chunks(items):
+    yield b"["
+    sep = b""
+    async for item in items:
+        yield sep + fast_json.dumps(item)
+        sep = b","
+    yield b"]"
+
+
+async def _ndjson_chunks(items):
+    async for item in items:
+        yield fast_json.dumps(item) + b"\n"
 
 
 @app.get("/api/calendar")
-def api_calendar(year: Optional[int] = Query(None), month: Optional[int] = Query(None)):
+async def api_calendar(request: Request, response: Response,
+                       year: Optional[int] = Query(None), month: Optional[int] = Query(None, ge=1, le=12),
+                       months: int = Query(1, ge=1, le=12)):
     """
     Return a mapping of days for the given year/month. If not specified, use current month.
-    Response: { "year": YYYY, "month": MM, "days": { "YYYY-MM-DD": { income, expense, count } } }
+    months=N covers N consecutive months starting at year/month in one response (e.g. ask for the
+    previous month with months=3 to prefetch both neighbours).
+    Response: { "year": YYYY, "month": MM, "months": N, "days": { "YYYY-MM-DD": { income, expense, count } } }
     """
+    version = await crud_async.get_data_version()
+    not_modified = _not_modified(request, response, version)
+    if not_modified:
+        return not_modified
     today = date.today()
     y = year or today.year
     m = month or today.month
-    # compute start/end for month
+    # compute start/end for the month span
     import calendar as _cal
-    last = _cal.monthrange(y, m)[1]
+    last_y, last_m = divmod(y * 12 + m - 1 + months - 1, 12)
     start = date(y, m, 1)
-    end = date(y, m, last)
-    items, _ = query_transactions(start, end, None, None, page=1, per_page=10000)
-    days = {}
-    for t in items:
-        key = t.date.isoformat()
-        if key not in days:
-            days[key] = {"income": 0.0, "expense": 0.0, "count": 0}
-        amt = float(t.amount or 0)
-        is_income = _is_income_direction(t.direction)
-        if is_income:
-            days[key]["income"] += amt
-        else:
-            days[key]["expense"] += amt
-        days[key]["count"] += 1
-    return {"year": y, "month": m, "days": days}
-
+    end = date(last_y, last_m + 1, _cal.monthrange(last_y, last_m + 1)[1])
+    return await _cached(("calendar", start, end), version, start, end, lambda: _build_calendar(y, m, months, start, end))
 
-@app.get("/api/transactions/export")
-def api_transactions_export(start: Optional[str] = Query(None), end: Optional[str] = Query(None), kind: Optional[str] = Query("summary")):
-    """
-    Export CSV of either 'summary' or raw 'transactions' within optional start/end.
-    """
-    s = _parse_date_param(start, "start") if start else None
-    e = _parse_date_param(end, "end") if end else None
-    items, _ = query_transactions(s, e, None, None, page=1, per_page=1000000)
 
-    import io
-    output = io.StringIO()
-    writer = csv.writer(output)
-    if kind == "transactions":
-        writer.writerow(["id", "date", "type", "major_category", "sub_category", "amount", "description"])
-        for t in items:
-            writer.writerow([t.id, t.date.isoformat() if t.date else "", t.direction, t.major_category, t.sub_category, t.amount, t.description or ""])
-    else:
-        summary_map = _build_summary_map(items)
-        writer.writerow(["type", "major", "sub", "amount"])
-        for tk in summary_map:
-            for mj in summary_map[tk]:
-                for sb in summary_map[tk][mj]:
-                    writer.writerow([tk, mj, sb, summary_map[tk][mj][sb]])
-
-    output.seek(0)
-    return StreamingResponse(output, media_type="text/csv", headers={"Content-Disposition": f'attachment; filename="export_{start or "all"}_{end or "all"}.csv"'})
+async def _build_calendar(y: int, m: int, months: int, start: date, end: date) -> dict:
+    # one row per day with income/expense already split by the aggregate query
+    days = {
+        r.date.isoformat(): {"income": r.income, "expense": r.expense, "count": r.count}
+        for r in await crud_async.get_calendar_days(start, end)
+    }
+    return {"year": y, "month": m, "months": months, "days": days}
 
 
 @app.get("/api/categories")
-def api_categories():
+def api_categories(request: Request, response: Response):
+    not_modified = _not_modified(request, response, get_data_version())
+    if not_modified:
+        return not_modified
     try:
         return get_categories()
     except Exception:
@@ -278,13 +500,22 @@ def api_categories():
         raise HTTPException(status_code=500, detail="categories error")
 
 
+@app.get("/api/cache/stats")
+def api_cache_stats():
+    """Hit/miss/eviction/invalidation counters of the summary/calendar response cache (/api/daily streams uncached)."""
+    return response_cache.stats()
+
+
 @app.get("/health")
 def health():
     return {"status": "ok"}
 
 # --- Fixed expenses endpoints ---
 @app.get("/api/fixed_expenses")
-def api_fixed_expenses():
+def api_fixed_expenses(request: Request, response: Response):
+    not_modified = _not_modified(request, response, get_data_version())
+    if not_modified:
+        return not_modified
     try:
         fes = list_fixed_expenses()
         out = [_serialize_fixed_expense(fe) for fe in fes]
@@ -327,7 +558,10 @@ def api_fixed_expense_delete(fe_id: int):
 
 # --- Savings endpoints ---
 @app.get("/api/savings")
-def api_savings_list():
+def api_savings_list(request: Request, response: Response):
+    not_modified = _not_modified(request, response, get_data_version())
+    if not_modified:
+        return not_modified
     try:
         s = list_savings()
         out = [_serialize_saving(it) for it in s]
@@ -369,13 +603,16 @@ def api_saving_delete(sid: int):
     return PlainTextResponse(status_code=204, content="")
 
 @app.get("/api/savings/forecast")
-def api_savings_forecast(date: Optional[str] = Query(None)):
+def api_savings_forecast(request: Request, response: Response, date: Optional[str] = Query(None)):
     if not date:
         raise HTTPException(status_code=400, detail="date query required YYYY-MM-DD")
     try:
         on = datetime.strptime(date, "%Y-%m-%d").date()
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid date format. Expected YYYY-MM-DD")
+    not_modified = _not_modified(request, response, get_data_version())
+    if not_modified:
+        return not_modified
     try:
         res = forecast_savings(on)
         return res
@@ -383,13 +620,62 @@ def api_savings_forecast(date: Optional[str] = Query(None)):
         logging.exception("forecast_savings failed")
         raise HTTPException(status_code=500, detail="forecast error")
 
+@app.get("/api/savings/forecast/series")
+def api_savings_forecast_series(request: Request, response: Response,
+                                start: Optional[str] = Query(None), end: Optional[str] = Query(None),
+                                step: str = Query("month", pattern="^(day|week|month)$")):
+    """
+    Balance curve for charts: { start, end, step, dates[], total[], items[{id, name, kind, balances[]}] },
+    one value per sample date in [start, end]; each point equals /api/savings/forecast for that date.
+    """
+    if not start or not end:
+        raise HTTPException(status_code=400, detail="start and end query required YYYY-MM-DD")
+    s = _parse_date_param(start, "start")
+    e = _parse_date_param(end, "end")
+    not_modified = _not_modified(request, response, get_data_version())
+    if not_modified:
+        return not_modified
+    try:
+        return forecast_savings_series(s, e, step)
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+    except Exception:
+        logging.exception("forecast_savings_series failed")
+        raise HTTPException(status_code=500, detail="forecast error")
+
+@app.get("/api/projection")
+def api_projection(request: Request, response: Response,
+                   start: Optional[str] = Query(None), end: Optional[str] = Query(None),
+                   step: str = Query("day", pattern="^(day|week|month)$"),
+                   opening_balance: Optional[float] = Query(None)):
+    """
+    Cash-flow projection: { start, end, step, opening_balance, dates[], income[], expense[], savings[],
+    balance[], savings_balance[] } merging recorded transactions, fixed expenses and saving schedules.
+    start defaults to today and end to 365 days after start.
+    """
+    s = _parse_date_param(start, "start") or date.today()
+    e = _parse_date_param(end, "end") or s + timedelta(days=365)
+    not_modified = _not_modified(request, response, get_data_version())
+    if not_modified:
+        return not_modified
+    try:
+        return get_projection(s, e, step, opening_balance)
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+    except Exception:
+        logging.exception("get_projection failed")
+        raise HTTPException(status_code=500, detail="projection error")
+
 # --- Settings endpoints ---
 @app.get("/api/settings/categories")
-def api_settings_get_categories():
+def api_settings_get_categories(request: Request, response: Response):
     """
     Return persisted lists for settings: { majors: [...], subs: [...] }.
     Falls back to empty lists if none persisted.
     """
+    not_modified = _not_modified(request, response, get_data_version())
+    if not_modified:
+        return not_modified
     try:
         return get_setting_categories()
     except Exception:
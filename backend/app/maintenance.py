@@ -0,0 +1,36 @@
+"""
+Maintenance commands for the Money Calendar database.
+
+Usage (from the backend directory):
+    python -m app.maintenance rebuild-rollup
+    python -m app.maintenance sync-fixed-expenses
+"""
+import argparse
+from typing import List, Optional
+
+from .models_core import create_db_and_tables
+from . import crud
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.maintenance", description="Money Calendar maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("rebuild-rollup", help="recompute the daily_rollup and transaction_category tables from all transactions")
+    commands.add_parser(
+        "sync-fixed-expenses",
+        help="drop generated fixed-expense rows and re-generate them unless MONEY_CALENDAR_FIXED_EXPENSE_MODE=virtual",
+    )
+    args = parser.parse_args(argv)
+
+    create_db_and_tables()
+    if args.command == "rebuild-rollup":
+        n = crud.rebuild_daily_rollup()
+        print(f"daily_rollup rebuilt: {n} rows")
+    elif args.command == "sync-fixed-expenses":
+        n = crud.sync_fixed_expense_transactions()
+        print(f"fixed expenses synced ({crud.FIXED_EXPENSE_MODE}): {n} rows generated")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
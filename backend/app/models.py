@@ -11,6 +11,10 @@ from .models_core import (
     engine,
     TransactionBase,
     Transaction,
+    DailyRollup,
+    TransactionCategory,
+    DataVersion,
+    DataChange,
     FixedExpense,
     Saving,
     CategoryMajor,
@@ -25,6 +29,10 @@ __all__ = [
     "engine",
     "TransactionBase",
     "Transaction",
+    "DailyRollup",
+    "TransactionCategory",
+    "DataVersion",
+    "DataChange",
     "FixedExpense",
     "Saving",
     "CategoryMajor",
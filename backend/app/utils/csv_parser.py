@@ -1,7 +1,8 @@
 import csv
 from io import StringIO
 from datetime import datetime, date
-from typing import List, Dict, Optional
+from itertools import islice
+from typing import List, Dict, Optional, Iterable, Iterator
 
 DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y")
 
@@ -34,15 +35,14 @@ def _extract_categories(row: Dict[str, str]) -> (Optional[str], Optional[str], O
             major = cat or None
     return cat, major, sub
 
-def parse_csv_transactions(text: str) -> List[Dict]:
+def iter_csv_transactions(f: Iterable[str]) -> Iterator[Dict]:
     """
+    Lazily parse CSV rows from a text stream (file object or iterable of lines).
     Expect CSV with at least columns: date, amount
     Optional columns: category, major_category, sub_category, direction, description, account, type, remarks
     """
-    f = StringIO(text)
     reader = csv.DictReader(f)
     required = ["date", "amount"]
-    out: List[Dict] = []
     for i, row in enumerate(reader, start=1):
         # validate required presence
         if not all(col in row and (row[col] is not None and row[col].strip() != "") for col in required):
@@ -58,7 +58,7 @@ def parse_csv_transactions(text: str) -> List[Dict]:
 
         tx_type = (row.get("type") or direction or "").strip() or None
 
-        out.append({
+        yield {
             "date": parsed_date,
             "amount": amount,
             "category": cat or None,
@@ -69,5 +69,20 @@ def parse_csv_transactions(text: str) -> List[Dict]:
             "account": account,
             "remarks": remarks,
             "raw_source": None
-        })
-    return out
+        }
+
+def iter_csv_transaction_batches(f: Iterable[str], batch_size: int = 1000) -> Iterator[List[Dict]]:
+    """Group iter_csv_transactions output into lists of at most batch_size rows."""
+    rows = iter_csv_transactions(f)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
+
+def parse_csv_transactions(text: str) -> List[Dict]:
+    """
+    Expect CSV with at least columns: date, amount
+    Optional columns: category, major_category, sub_category, direction, description, account, type, remarks
+    """
+    return list(iter_csv_transactions(StringIO(text)))
@@ -0,0 +1,56 @@
+"""
+Compact JSON encoding for hot response paths.
+
+Uses orjson when it is installed and otherwise the stdlib with the same settings as FastAPI's
+JSONResponse (ensure_ascii=False, allow_nan=False, compact separators), so the bytes match the
+default response for the values the API returns. date/datetime values are written as ISO strings.
+
+orjson only formats floats like the stdlib (shortest repr) for 0 and 1e-4 <= |x| < 1e16; outside
+that range it writes exponents differently (1e16 vs 1e+16, 1e-05 as 0.00001) and turns NaN/inf into
+null. Payloads holding such floats, or anything else orjson rejects, go through the stdlib encoder,
+which also raises on NaN/inf like the default response.
+"""
+import json
+from datetime import date, datetime
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+def _default(o: Any) -> Any:
+    if isinstance(o, (date, datetime)):
+        return o.isoformat()
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def _orjson_compatible(obj: Any) -> bool:
+    """False if `obj` holds a float that orjson would encode differently from the stdlib."""
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        t = type(o)
+        if t is float:
+            # NaN fails every comparison, so it is caught here too
+            if o != 0.0 and not 1e-4 <= abs(o) < 1e16:
+                return False
+        elif t is dict:
+            stack.extend(o.values())
+        elif t is list or t is tuple:
+            stack.extend(o)
+    return True
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+def dumps(obj: Any) -> bytes:
+    if orjson is not None and _orjson_compatible(obj):
+        try:
+            return orjson.dumps(obj, default=_default)
+        except orjson.JSONEncodeError:  # e.g. ints beyond 64 bits, non-str keys: let the stdlib decide
+            pass
+    return _stdlib_dumps(obj)
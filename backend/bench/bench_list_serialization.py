@@ -0,0 +1,64 @@
+"""
+Benchmark: /api/transactions page build, ORM objects + jsonable_encoder + json.dumps (previous path)
+vs column tuples + _transaction_list_body (fast path).
+
+Usage (from the backend directory):
+    python -m bench.bench_list_serialization [per_page]
+"""
+import json
+import sys
+import tempfile
+import time
+
+from fastapi.encoders import jsonable_encoder
+from sqlmodel import SQLModel, create_engine
+
+from app import crud
+from app.main import _serialize_transaction, _transaction_list_body
+
+
+def _best_of(fn, repeat: int = 10) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _orm_page(per_page: int) -> bytes:
+    items, total = crud.query_transactions(per_page=per_page)
+    body = {"items": [_serialize_transaction(t) for t in items], "total": total, "page": 1,
+            "per_page": per_page, "next_cursor": None}
+    return json.dumps(jsonable_encoder(body), ensure_ascii=False, allow_nan=False, indent=None,
+                      separators=(",", ":")).encode("utf-8")
+
+
+def _fast_page(per_page: int) -> bytes:
+    rows, total = crud.query_transaction_rows(per_page=per_page)
+    return _transaction_list_body(rows, total, 1, per_page, None)
+
+
+def main() -> None:
+    per_page = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    with tempfile.TemporaryDirectory() as tmp:
+        crud.engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        SQLModel.metadata.create_all(crud.engine)
+        crud.create_transactions_bulk([
+            {"date": f"2026-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}", "type": "지출", "major_category": "식비",
+             "sub_category": "점심", "description": f"row {i}", "amount": i}
+            for i in range(per_page * 5)
+        ])
+        assert _orm_page(per_page) == _fast_page(per_page)
+
+        orm = _best_of(lambda: _orm_page(per_page))
+        fast = _best_of(lambda: _fast_page(per_page))
+        crud.engine.dispose()
+    print(f"per_page={per_page}")
+    print(f"ORM + jsonable_encoder: {orm * 1000:8.1f} ms")
+    print(f"tuples + fast_json:     {fast * 1000:8.1f} ms")
+    print(f"speedup:                {orm / fast:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark: per-row _normalize_tx_dict vs normalize_tx_batch.
+
+Usage (from the backend directory):
+    python -m bench.bench_normalize [rows]
+"""
+import sys
+import time
+
+from app.crud import _normalize_tx_dict, normalize_tx_batch
+
+
+def _rows(n: int):
+    return [
+        {
+            "date": f"2026-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}",
+            "type": "지출" if i % 3 else "수입",
+            "major_category": "식비",
+            "sub_category": "점심",
+            "amount": f"{i:,}",
+            "description": f"row {i}",
+        }
+        for i in range(n)
+    ]
+
+
+def _best_of(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rows = _rows(n)
+    assert normalize_tx_batch(rows) == [_normalize_tx_dict(r) for r in rows]
+
+    per_row = _best_of(lambda: [_normalize_tx_dict(r) for r in rows])
+    batch = _best_of(lambda: normalize_tx_batch(rows))
+    print(f"rows={n}")
+    print(f"per-row _normalize_tx_dict: {per_row * 1000:8.1f} ms")
+    print(f"normalize_tx_batch:         {batch * 1000:8.1f} ms")
+    print(f"speedup:                    {per_row / batch:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
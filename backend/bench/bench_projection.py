@@ -0,0 +1,76 @@
+"""
+Benchmark: full ORM hydration vs column projection / TransactionRow on read paths.
+
+- range listing: query_transactions (Transaction models) vs query_transaction_rows (column tuples)
+- virtual fixed-expense expansion: Transaction models vs TransactionRow tuples
+
+Reports best-of wall time and tracemalloc peak per variant.
+
+Usage (from the backend directory):
+    python -m bench.bench_projection [rows]
+"""
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+
+from sqlmodel import Session, SQLModel, create_engine
+
+from app import crud
+
+
+def _measure(fn, repeat: int = 5):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def _report(label: str, result) -> None:
+    best, peak = result
+    print(f"  {label:<28} {best * 1000:8.1f} ms   peak {peak / 1024 / 1024:6.1f} MiB")
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    start, end = date(2016, 1, 1), date(2026, 12, 31)
+    with tempfile.TemporaryDirectory() as tmp:
+        crud.engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        SQLModel.metadata.create_all(crud.engine)
+        crud.create_transactions_bulk([
+            {"date": f"2026-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}", "type": "지출", "major_category": "식비",
+             "sub_category": "점심", "description": f"row {i}", "amount": i}
+            for i in range(n)
+        ])
+        print(f"range listing ({n} rows)")
+        _report("Transaction models", _measure(lambda: crud.query_transactions(per_page=n, include_total=False)))
+        _report("column tuples", _measure(lambda: crud.query_transaction_rows(per_page=n, include_total=False)))
+
+        old_mode = crud.FIXED_EXPENSE_MODE
+        crud.FIXED_EXPENSE_MODE = "virtual"
+        for i in range(200):
+            crud.create_fixed_expense({"major_category": "주거", "sub_category": f"고정 {i}", "amount": 1000 + i,
+                                       "start_date": "2016-01-01", "end_date": "2026-12-31", "day_of_month": i % 28 + 1})
+
+        with Session(crud.engine) as session:
+            fes = crud.list_fixed_expenses()
+            occurrences = [(fe, d) for fe in fes for d in crud._fixed_occurrence_dates(fe, start, end)]
+            print(f"virtual fixed-expense expansion ({len(occurrences)} occurrences)")
+            _report("Transaction models", _measure(
+                lambda: [crud._fixed_occurrence_tx(fe, d, crud._virtual_tx_id(fe.id, d)) for fe, d in occurrences]))
+            _report("TransactionRow", _measure(
+                lambda: [crud._fixed_occurrence_row(fe, d, crud._virtual_tx_id(fe.id, d)) for fe, d in occurrences]))
+            _report("get_daily_totals (end to end)", _measure(lambda: crud._get_daily_totals(session, start, end)))
+        crud.FIXED_EXPENSE_MODE = old_mode
+        crud.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
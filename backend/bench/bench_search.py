@@ -0,0 +1,62 @@
+"""
+Benchmark: transaction search through the FTS5 trigram index vs the ILIKE scan.
+
+Runs the same query_transaction_rows(search=...) first-page request, with and without the total
+count (the UI default), through the index and with SEARCH_INDEX_MIN_CHARS raised so every query takes
+the ILIKE fallback. Reports best-of wall time.
+
+Usage (from the backend directory):
+    python -m bench.bench_search [rows]
+"""
+import sys
+import tempfile
+import time
+
+from sqlmodel import SQLModel, create_engine
+
+from app import crud
+
+WORDS = ("점심 식사", "저녁 배달", "카페 라떼", "편의점 간식", "택시 요금", "지하철 충전", "월세 이체", "Netflix 구독")
+QUERIES = ("배달", "편의점 간", "Netflix", "#12345", "없는검색어")
+
+
+def _measure(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as tmp:
+        crud.engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        SQLModel.metadata.create_all(crud.engine)
+        batch = 50_000
+        for lo in range(0, n, batch):
+            crud.create_transactions_bulk([
+                {"date": f"20{16 + i % 10}-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}", "type": "지출",
+                 "major_category": "생활", "sub_category": WORDS[i % len(WORDS)].split()[0],
+                 "description": f"{WORDS[(i * 7) % len(WORDS)]} #{i}", "amount": i}
+                for i in range(lo, min(lo + batch, n))
+            ])
+        old_min = crud.SEARCH_INDEX_MIN_CHARS
+        for include_total in (True, False):
+            print(f"search, first page of 100, include_total={include_total} ({n} rows)")
+            for q in QUERIES:
+                def run():
+                    return crud.query_transaction_rows(search=q, per_page=100, include_total=include_total)
+
+                indexed = _measure(run, repeat=3)
+                crud.SEARCH_INDEX_MIN_CHARS = 10 ** 6
+                scan = _measure(run, repeat=3)
+                crud.SEARCH_INDEX_MIN_CHARS = old_min
+                label = f"'{q}'" + ("" if len(q) >= old_min else " (too short, scans)")
+                print(f"  {label:<28} index {indexed * 1000:8.1f} ms   ILIKE {scan * 1000:8.1f} ms")
+        crud.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: SQLite defaults (rollback journal, synchronous=FULL) vs the tuned connection profile
+from app.models_core (WAL, synchronous=NORMAL, mmap, page cache, busy_timeout).
+
+Measures
+- commit latency of small single-row write transactions
+- read latency/throughput of a reader thread while a writer commits large batches
+
+Usage (from the backend directory):
+    python -m bench.bench_sqlite_profile [commits]
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import func, insert, select
+from sqlmodel import SQLModel, create_engine
+
+from app.models_core import Transaction, configure_sqlite_engine, sqlite_pragmas_from_env
+
+
+def _engine(path: str, tuned: bool):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    if tuned:
+        configure_sqlite_engine(engine, sqlite_pragmas_from_env({}))
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def _row(i: int) -> dict:
+    return {"date": date(2026, 1, 1) + timedelta(days=i % 365), "amount": float(i), "direction": "Expense",
+            "major_category": "식비", "sub_category": "점심", "description": f"row {i}"}
+
+
+def _commit_latency(engine, commits: int):
+    samples = []
+    for i in range(commits):
+        t0 = time.perf_counter()
+        with engine.begin() as conn:
+            conn.execute(insert(Transaction), [_row(i)])
+        samples.append(time.perf_counter() - t0)
+    samples.sort()
+    return sum(samples) / len(samples), samples[int(len(samples) * 0.95)]
+
+
+def _concurrent(engine, batches: int = 20, batch_rows: int = 5000):
+    stop = threading.Event()
+    reads = []
+
+    def reader():
+        with engine.connect() as conn:
+            while not stop.is_set():
+                t0 = time.perf_counter()
+                conn.execute(select(func.count(), func.sum(Transaction.amount))).one()
+                conn.rollback()
+                reads.append(time.perf_counter() - t0)
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    t0 = time.perf_counter()
+    for b in range(batches):
+        with engine.begin() as conn:
+            conn.execute(insert(Transaction), [_row(b * batch_rows + i) for i in range(batch_rows)])
+    write_time = time.perf_counter() - t0
+    stop.set()
+    thread.join()
+    reads.sort()
+    return write_time, len(reads), reads[-1] if reads else 0.0
+
+
+def main() -> None:
+    commits = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, tuned in (("sqlite defaults", False), ("tuned profile", True)):
+            engine = _engine(os.path.join(tmp, f"{label.replace(' ', '_')}.db"), tuned)
+            mean, p95 = _commit_latency(engine, commits)
+            write_time, n_reads, worst_read = _concurrent(engine)
+            engine.dispose()
+            print(f"[{label}]")
+            print(f"  commit latency: mean {mean * 1000:7.3f} ms, p95 {p95 * 1000:7.3f} ms ({commits} commits)")
+            print(f"  while writing:  {n_reads:6d} reads in {write_time:5.2f}s, worst read {worst_read * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Shared fixtures for tests that need a scratch database: a temporary directory per test and, for the
+crud tests, a fresh SQLite file that crud (and crud_async) are pointed at for the test's duration.
+"""
+import tempfile
+import unittest
+
+from sqlmodel import SQLModel, create_engine
+
+from app import crud
+
+
+class TempDirTestCase(unittest.TestCase):
+    """self._tmpdir: a TemporaryDirectory removed after each test."""
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+
+class _CrudDatabase:
+    def _open_database(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self._db_url = f"sqlite:///{self._tmpdir.name}/unit_test.db"
+        self._engine = create_engine(self._db_url, echo=False, connect_args={"check_same_thread": False})
+        SQLModel.metadata.create_all(self._engine)
+        self._old_engine = crud.engine
+        crud.engine = self._engine
+
+    def _close_database(self):
+        crud.engine = self._old_engine
+        self._engine.dispose()
+        self._tmpdir.cleanup()
+
+
+class CrudDBTestCase(_CrudDatabase, unittest.TestCase):
+    """crud.engine -> a new SQLite file with every table created (self._engine for direct SQL)."""
+
+    def setUp(self):
+        self._open_database()
+
+    def tearDown(self):
+        self._close_database()
+
+
+class AsyncCrudDBTestCase(_CrudDatabase, unittest.IsolatedAsyncioTestCase):
+    """CrudDBTestCase plus crud_async.engine -> an aiosqlite engine on the same file."""
+
+    def setUp(self):
+        from app import crud_async
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        self._open_database()
+        self._async_engine = create_async_engine(crud_async.async_database_url(self._db_url))
+        self._old_async_engine = crud_async.engine
+        crud_async.engine = self._async_engine
+
+    async def asyncTearDown(self):
+        await self._async_engine.dispose()
+
+    def tearDown(self):
+        from app import crud_async
+
+        crud_async.engine = self._old_async_engine
+        self._close_database()
@@ -0,0 +1,227 @@
+import unittest
+from datetime import date
+from unittest import mock
+
+from app import crud
+from app.cache import MISS, RangeCache, response_cache
+
+try:
+    from starlette.requests import Request
+    from starlette.responses import Response
+
+    from app import crud_async, main
+except ImportError:  # aiosqlite/greenlet not installed
+    crud_async = None
+from test.db_case import AsyncCrudDBTestCase, CrudDBTestCase
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class RangeCacheTests(unittest.TestCase):
+    def test_lru_eviction_and_ttl(self):
+        clock = FakeClock()
+        cache = RangeCache(maxsize=2, ttl=10, clock=clock)
+        cache.put("a", None, None, 1)
+        cache.put("b", None, None, 2)
+        self.assertEqual(cache.get("a"), 1)  # "b" is now least recently used
+        cache.put("c", None, None, 3)
+        self.assertIs(cache.get("b"), MISS)
+        self.assertEqual(cache.get("c"), 3)
+
+        clock.now = 11
+        self.assertIs(cache.get("a"), MISS)
+        self.assertEqual(cache.stats()["evictions"], 2)
+        self.assertEqual((cache.stats()["hits"], cache.stats()["misses"]), (2, 2))
+
+    def test_invalidation_only_drops_overlapping_ranges(self):
+        cache = RangeCache()
+        cache.put("jan", date(2026, 1, 1), date(2026, 1, 31), "jan")
+        cache.put("feb", date(2026, 2, 1), date(2026, 2, 28), "feb")
+        cache.put("all", None, None, "all")
+
+        self.assertEqual(cache.invalidate_dates([date(2026, 2, 10)]), 2)
+        self.assertEqual(cache.get("jan"), "jan")
+        self.assertIs(cache.get("feb"), MISS)
+        self.assertIs(cache.get("all"), MISS)
+
+        cache.put("feb", date(2026, 2, 1), date(2026, 2, 28), "feb")
+        self.assertEqual(cache.invalidate_range(date(2026, 1, 31), None), 2)
+        self.assertEqual(cache.stats()["size"], 0)
+
+    def test_put_skips_values_computed_before_an_invalidation(self):
+        cache = RangeCache()
+        generation = cache.generation
+        cache.invalidate_dates([date(2026, 1, 5)])
+        cache.put("jan", date(2026, 1, 1), date(2026, 1, 31), "stale", generation)
+        self.assertIs(cache.get("jan"), MISS)
+
+    def test_disabled_cache_never_stores(self):
+        cache = RangeCache(maxsize=0)
+        cache.put("a", None, None, 1)
+        self.assertIs(cache.get("a"), MISS)
+
+
+class CacheDBTestCase(CrudDBTestCase):
+    def setUp(self):
+        super().setUp()
+        response_cache.clear()
+
+    def tearDown(self):
+        response_cache.clear()
+        super().tearDown()
+
+
+class CacheInvalidationTests(CacheDBTestCase):
+    def _fill(self):
+        response_cache.put(("summary", "jan"), date(2026, 1, 1), date(2026, 1, 31), "jan")
+        response_cache.put(("summary", "feb"), date(2026, 2, 1), date(2026, 2, 28), "feb")
+
+    def _cached_keys(self):
+        return {key[1] for key in (("summary", "jan"), ("summary", "feb")) if response_cache.get(key) is not MISS}
+
+    def test_transaction_writes_invalidate_their_dates(self):
+        self._fill()
+        created = crud.create_transactions_bulk([{"date": "2026-01-10", "type": "지출", "amount": 1000}])
+        self.assertEqual(self._cached_keys(), {"feb"})
+
+        self._fill()
+        crud.update_transaction(created[0]["id"], {"date": "2026-02-03"})  # old and new date
+        self.assertEqual(self._cached_keys(), set())
+
+        self._fill()
+        crud.delete_transaction(created[0]["id"])
+        self.assertEqual(self._cached_keys(), {"jan"})
+
+    def test_fixed_expense_and_saving_writes_invalidate_their_period(self):
+        self._fill()
+        fe = crud.create_fixed_expense(
+            {"major_category": "주거", "sub_category": "월세", "amount": 500000,
+             "start_date": "2026-02-01", "end_date": "2026-12-31", "day_of_month": 25}
+        )
+        self.assertEqual(self._cached_keys(), {"jan"})
+
+        self._fill()
+        crud.update_fixed_expense(fe.id, {"start_date": "2026-01-01"})
+        self.assertEqual(self._cached_keys(), set())
+
+        self._fill()
+        crud.create_saving({"kind": "적금", "start_date": "2026-01-01", "end_date": "2026-01-31"})
+        self.assertEqual(self._cached_keys(), {"feb"})
+
+    def test_failed_write_does_not_invalidate(self):
+        fe = crud.create_fixed_expense(
+            {"major_category": "주거", "sub_category": "월세", "amount": 500000,
+             "start_date": "2026-01-01", "end_date": "2026-02-28", "day_of_month": 25}
+        )
+        self._fill()
+        with self.assertRaises(ValueError):
+            crud.update_fixed_expense(fe.id, {"amount": "not-a-number"})
+        self.assertEqual(self._cached_keys(), {"jan", "feb"})
+
+
+class DataChangeLogTests(CacheDBTestCase):
+    def test_each_write_logs_its_ranges_and_old_rows_are_pruned(self):
+        crud.create_transactions_bulk([{"date": d, "type": "지출", "amount": 1}
+                                       for d in ("2026-01-10", "2026-01-11", "2026-01-12", "2026-02-01")])
+        crud.create_saving({"kind": "적금", "start_date": "2026-03-01"})
+        crud.set_setting_categories(["식비"], ["점심"])
+        changes = crud.get_data_changes(0, crud.get_data_version())
+        self.assertEqual([c[0] for c in changes], [1, 2, 3, 4])
+        self.assertEqual({c[1] for c in changes}, {crud.change_origin()})
+        self.assertEqual(changes[0][2], [(date(2026, 1, 10), date(2026, 1, 12)), (date(2026, 2, 1), date(2026, 2, 1))])
+        self.assertEqual(changes[1][2], [(date(2026, 3, 1), None)])
+        self.assertEqual(changes[2][2], [])
+
+        with mock.patch.object(crud, "DATA_CHANGE_KEEP", 2):
+            crud.set_setting_categories(["식비"], ["저녁"])
+        self.assertEqual([c[0] for c in crud.get_data_changes(0, crud.get_data_version())], [5, 6])
+
+    def test_fragmented_dates_are_logged_as_one_span(self):
+        dates = [date(2026, 1, 1) + (date(2026, 1, 3) - date(2026, 1, 1)) * k for k in range(100)]
+        self.assertEqual(crud._change_ranges(dates, [(None, date(2025, 1, 1))]),
+                         [["2026-01-01", dates[-1].isoformat()], [None, "2025-01-01"]])
+
+
+@unittest.skipUnless(crud_async, "aiosqlite is not installed")
+class CrossProcessWriteTests(AsyncCrudDBTestCase):
+    def setUp(self):
+        super().setUp()
+        response_cache.clear()
+
+    def tearDown(self):
+        response_cache.clear()
+        super().tearDown()
+
+    def _external_write(self):
+        # what another worker or `python -m app.maintenance` commits: no in-process invalidation runs here
+        with self._engine.begin() as conn:
+            conn.exec_driver_sql(
+                "INSERT INTO daily_rollup (date, direction, major_category, sub_category, amount, count) "
+                "VALUES ('2026-01-20', 'Expense', '식비', '', 7.0, 1)"
+            )
+            conn.exec_driver_sql("UPDATE data_version SET version = version + 1 WHERE id = 1")
+
+    def _foreign_write(self, write, *args):
+        # a crud write committed by another worker: logged in data_change, but this process's cache is untouched
+        with mock.patch.object(crud, "_ORIGIN_TOKEN", "other-worker"), \
+                mock.patch.object(crud, "response_cache", RangeCache()):
+            return write(*args)
+
+    async def test_other_workers_writes_only_invalidate_overlapping_entries(self):
+        crud.create_transactions_bulk([{"date": "2026-01-10", "type": "지출", "major_category": "식비", "amount": 5}])
+        summary = lambda: main.api_summary(_request("/api/summary"), Response(), "2026-01-01", "2026-01-31")
+        march = lambda: main.api_calendar(_request("/api/calendar"), Response(), 2026, 3, 1)
+        self.assertEqual((await summary())["total"], 5.0)
+        self.assertEqual((await march())["days"], {})
+
+        self._foreign_write(crud.create_transactions_bulk,
+                            [{"date": "2026-01-20", "type": "지출", "major_category": "식비", "amount": 7}])
+        hits = response_cache.stats()["hits"]
+        self.assertEqual((await summary())["total"], 12.0)
+        self.assertEqual((await march())["days"], {})
+        self.assertEqual(response_cache.stats()["hits"], hits + 1)  # March survived the January write
+        self.assertEqual(response_cache.synced_version, crud.get_data_version())
+
+        self._foreign_write(crud.create_fixed_expense,
+                            {"major_category": "주거", "sub_category": "월세", "amount": 500,
+                             "start_date": "2026-03-01", "end_date": "2026-03-31", "day_of_month": 25})
+        self.assertEqual((await march())["days"]["2026-03-25"]["expense"], 500.0)
+        self.assertEqual(response_cache.stats()["hits"], hits + 1)
+
+    async def test_own_writes_are_not_replayed(self):
+        crud.create_transactions_bulk([{"date": "2026-01-10", "type": "지출", "amount": 5}])
+        summary = lambda: main.api_summary(_request("/api/summary"), Response(), "2026-01-01", "2026-01-31")
+        await summary()
+        crud.create_transactions_bulk([{"date": "2026-01-11", "type": "지출", "amount": 1}])  # invalidated on commit
+        self.assertEqual((await summary())["total"], 6.0)
+        invalidations = response_cache.stats()["invalidations"]
+        hits = response_cache.stats()["hits"]
+        self.assertEqual((await summary())["total"], 6.0)
+        self.assertEqual(response_cache.stats()["hits"], hits + 1)
+        self.assertEqual(response_cache.stats()["invalidations"], invalidations)
+
+    async def test_writes_from_other_processes_are_not_served_from_the_cache(self):
+        crud.create_transactions_bulk([{"date": "2026-01-10", "type": "지출", "major_category": "식비", "amount": 5}])
+        summary = lambda: main.api_summary(_request("/api/summary"), Response(), "2026-01-01", "2026-01-31")
+        calendar = lambda: main.api_calendar(_request("/api/calendar"), Response(), 2026, 1, 1)
+        self.assertEqual((await summary())["total"], 5.0)
+        self.assertNotIn("2026-01-20", (await calendar())["days"])
+        self.assertEqual((await summary())["total"], 5.0)
+
+        self._external_write()
+        self.assertEqual((await summary())["total"], 12.0)
+        self.assertEqual((await calendar())["days"]["2026-01-20"]["expense"], 7.0)
+
+
+def _request(path: str) -> "Request":
+    return Request({"type": "http", "method": "GET", "path": path, "query_string": b"", "headers": []})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from datetime import date
+
+from app import crud
+
+try:
+    from app import crud_async
+except ImportError:  # aiosqlite/greenlet not installed
+    crud_async = None
+from test.db_case import AsyncCrudDBTestCase
+
+
+@unittest.skipUnless(crud_async, "aiosqlite is not installed")
+class CrudAsyncTests(AsyncCrudDBTestCase):
+    def setUp(self):
+        super().setUp()
+
+        crud.create_transactions_bulk(
+            [
+                {"date": "2026-01-10", "type": "지출", "major_category": "식비", "sub_category": "점심", "amount": 9000},
+                {"date": "2026-01-10", "type": "수입", "major_category": "급여", "amount": 300000},
+                {"date": "2026-01-11", "type": "지출", "major_category": "교통", "description": "버스", "amount": 1500},
+                {"date": "2026-02-01", "type": "지출", "major_category": "식비", "amount": 7000},
+            ]
+        )
+
+    def test_async_database_url_uses_async_drivers(self):
+        self.assertEqual(crud_async.async_database_url("sqlite:///data/app.db"), "sqlite+aiosqlite:///data/app.db")
+        self.assertEqual(
+            crud_async.async_database_url("postgresql://u:p@db/money"), "postgresql+psycopg://u:p@db/money"
+        )
+        with self.assertRaises(ValueError):
+            crud_async.async_database_url("mysql://u:p@db/money")
+
+    async def test_query_transactions_matches_sync(self):
+        start, end = date(2026, 1, 1), date(2026, 1, 31)
+        sync_items, sync_total = crud.query_transactions(start, end, per_page=2)
+        items, total = await crud_async.query_transactions(start, end, per_page=2)
+        self.assertEqual(total, sync_total)
+        self.assertEqual([t.id for t in items], [t.id for t in sync_items])
+
+        cursor = (items[-1].date, items[-1].id)
+        rest, total = await crud_async.query_transactions(start, end, per_page=2, after=cursor, include_total=False)
+        self.assertIsNone(total)
+        self.assertEqual([t.amount for t in rest], [9000.0])
+
+        found, _ = await crud_async.query_transactions(search="버스")
+        self.assertEqual([t.description for t in found], ["버스"])
+
+    async def test_summary_and_daily_totals_match_sync(self):
+        start, end = date(2026, 1, 1), date(2026, 1, 31)
+        self.assertEqual(await crud_async.get_summary(start, end), crud.get_summary(start, end))
+        rows = await crud_async.get_daily_totals(start, end)
+        self.assertEqual(
+            [(r.date, r.direction, r.amount, r.count) for r in rows],
+            [(r.date, r.direction, r.amount, r.count) for r in crud.get_daily_totals(start, end)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
+from io import StringIO
 
-from app.utils.csv_parser import parse_csv_transactions
+from app.utils.csv_parser import iter_csv_transaction_batches, parse_csv_transactions
 
 
 class CsvParserTests(unittest.TestCase):
@@ -24,6 +25,15 @@ class CsvParserTests(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "missing required columns"):
             parse_csv_transactions(bad_text)
 
+    def test_iter_csv_transaction_batches_splits_stream_and_keeps_row_numbers(self):
+        lines = ["date,amount\n"] + [f"2026-01-{d:02d},{d}\n" for d in range(1, 6)] + ["2026-01-06,oops\n"]
+
+        batches = iter_csv_transaction_batches(StringIO("".join(lines)), batch_size=2)
+        self.assertEqual([r["amount"] for r in next(batches)], [1.0, 2.0])
+        self.assertEqual([r["amount"] for r in next(batches)], [3.0, 4.0])
+        with self.assertRaisesRegex(ValueError, "Row 6: invalid amount"):
+            list(batches)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+from datetime import date
+
+from sqlmodel import Session, select
+
+from app import crud
+from app.models_core import DailyRollup
+from test.db_case import CrudDBTestCase
+
+
+class DailyRollupTests(CrudDBTestCase):
+    def _rollup_rows(self):
+        with Session(self._engine) as session:
+            rows = session.exec(select(DailyRollup)).all()
+        return sorted(
+            (r.date, r.direction, r.major_category, r.sub_category, r.amount, r.count) for r in rows
+        )
+
+    def test_rollup_tracks_transaction_writes(self):
+        crud.create_transactions_bulk(
+            [
+                {"date": "2026-01-10", "type": "지출", "major_category": "식비", "sub_category": "점심", "amount": 9000},
+                {"date": "2026-01-10", "type": "지출", "major_category": "식비", "sub_category": "점심", "amount": 6000},
+                {"date": "2026-01-11", "type": "수입", "category": "급여", "amount": 100},
+            ]
+        )
+        self.assertEqual(
+            self._rollup_rows(),
+            [
+                (date(2026, 1, 10), "Expense", "식비", "점심", 15000.0, 2),
+                (date(2026, 1, 11), "Income", "급여", "", 100.0, 1),
+            ],
+        )
+
+        items, _ = crud.query_transactions(start=date(2026, 1, 10), end=date(2026, 1, 10))
+        moved, removed = items[0], items[1]
+        crud.update_transaction(moved.id, {"date": "2026-01-12", "sub_category": "저녁"})
+        crud.delete_transaction(removed.id)
+
+        rows = self._rollup_rows()
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0][:4], (date(2026, 1, 11), "Income", "급여", ""))
+        self.assertEqual(rows[1][:4], (date(2026, 1, 12), "Expense", "식비", "저녁"))
+        self.assertEqual(rows[1][5], 1)
+
+        totals = crud.get_daily_totals(date(2026, 1, 1), date(2026, 1, 31))
+        self.assertEqual([(t.date, t.direction, t.count) for t in totals], [
+            (date(2026, 1, 11), "Income", 1),
+            (date(2026, 1, 12), "Expense", 1),
+        ])
+
+    def test_rollup_tracks_fixed_expense_regeneration_and_rebuild(self):
+        crud.create_fixed_expense(
+            {
+                "major_category": "주거",
+                "sub_category": "월세",
+                "amount": 500000,
+                "start_date": "2026-01-01",
+                "end_date": "2026-03-31",
+                "day_of_month": 5,
+            }
+        )
+        self.assertEqual(len(self._rollup_rows()), 3)
+        fe_id = crud.list_fixed_expenses()[0].id
+
+        crud.update_fixed_expense(fe_id, {"end_date": "2026-02-28", "amount": 400000})
+        rows = self._rollup_rows()
+        self.assertEqual([r[0] for r in rows], [date(2026, 1, 5), date(2026, 2, 5)])
+        self.assertTrue(all(r[4] == 400000.0 and r[5] == 1 for r in rows))
+
+        incremental = self._rollup_rows()
+        self.assertEqual(crud.rebuild_daily_rollup(), 2)
+        self.assertEqual(self._rollup_rows(), incremental)
+
+        crud.delete_fixed_expense(fe_id)
+        self.assertEqual(self._rollup_rows(), [])
+
+    def test_summary_reads_from_rollup(self):
+        crud.create_transactions_bulk(
+            [{"date": "2026-02-01", "type": "지출", "major_category": "교통", "sub_category": "버스", "amount": 1500}]
+        )
+        summary = crud.get_summary(date(2026, 2, 1), date(2026, 2, 28))
+        self.assertEqual(summary["total"], 1500.0)
+        self.assertEqual(summary["by_major"]["교통"]["sub_categories"], {"버스": 1500.0})
+
+    def test_calendar_days_split_income_and_expense_without_a_row_cap(self):
+        crud.create_transactions_bulk(
+            [{"date": f"2026-01-{i % 31 + 1:02d}", "type": "지출", "amount": 1} for i in range(12000)]
+            + [{"date": "2026-01-05", "type": "수입", "amount": 300000}, {"date": "2026-02-01", "amount": 700}]
+        )
+        with Session(self._engine) as session:
+            # legacy rollup labels: Korean income, mixed-case English, unknown direction
+            session.add(DailyRollup(date=date(2026, 1, 6), direction="수입", amount=10.0, count=1))
+            session.add(DailyRollup(date=date(2026, 1, 6), direction="monthly INCOME", amount=5.0, count=1))
+            session.add(DailyRollup(date=date(2026, 1, 6), direction="", amount=2.0, count=1))
+            session.commit()
+
+        days = {d.date: d for d in crud.get_calendar_days(date(2026, 1, 1), date(2026, 2, 28))}
+        self.assertEqual(sum(d.count for d in days.values()), 12000 + 2 + 3)
+        self.assertEqual(days[date(2026, 1, 5)], (date(2026, 1, 5), 300000.0, 387.0, 387 + 1))
+        self.assertEqual(days[date(2026, 1, 6)], (date(2026, 1, 6), 15.0, 387.0 + 2, 387 + 3))
+        self.assertEqual(days[date(2026, 2, 1)].expense, 700.0)
+
+    def test_calendar_days_include_virtual_fixed_expenses(self):
+        old_mode = crud.FIXED_EXPENSE_MODE
+        crud.FIXED_EXPENSE_MODE = "virtual"
+        try:
+            crud.create_fixed_expense(
+                {"major_category": "주거", "sub_category": "월세", "amount": 500000,
+                 "start_date": "2025-12-01", "end_date": "2026-12-31", "day_of_month": 31}
+            )
+            crud.create_transactions_bulk([{"date": "2026-01-31", "type": "수입", "amount": 100}])
+            days = crud.get_calendar_days(date(2025, 12, 1), date(2026, 2, 28))
+        finally:
+            crud.FIXED_EXPENSE_MODE = old_mode
+        self.assertEqual(
+            [tuple(d) for d in days],
+            [(date(2025, 12, 31), 0.0, 500000.0, 1), (date(2026, 1, 31), 100.0, 500000.0, 2),
+             (date(2026, 2, 28), 0.0, 500000.0, 1)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import json
+import unittest
+from datetime import date
+from unittest import mock
+
+from app import crud
+
+try:
+    from app import crud_async, main
+except ImportError:  # aiosqlite/greenlet not installed
+    crud_async = None
+from test.db_case import AsyncCrudDBTestCase
+
+
+def reference_daily(start, end):
+    """The pre-streaming /api/daily body: every group built in memory, then sorted by date."""
+    out = {}
+    for r in crud.get_daily_totals(start, end):
+        key = r.date.isoformat()
+        slot = out.setdefault(key, {"date": key, "income": 0.0, "expense": 0.0, "transactions": []})
+        slot["income" if main._is_income_direction(r.direction) else "expense"] += float(r.amount or 0)
+    items, _ = crud.query_transactions(start, end, per_page=100000, include_total=False)
+    for t in items:
+        key = t.date.isoformat()
+        slot = out.setdefault(key, {"date": key, "income": 0.0, "expense": 0.0, "transactions": []})
+        slot["transactions"].append({
+            "id": t.id, "date": key, "type": t.direction, "major_category": t.major_category,
+            "sub_category": t.sub_category, "amount": t.amount, "description": t.description
+        })
+    return sorted(out.values(), key=lambda x: x["date"], reverse=True)
+
+
+@unittest.skipUnless(crud_async, "aiosqlite is not installed")
+class DailyStreamTests(AsyncCrudDBTestCase):
+    def setUp(self):
+        super().setUp()
+
+        # several rows per day so day groups straddle the (patched) page boundaries
+        crud.create_transactions_bulk(
+            [
+                {"date": f"2026-01-{day:02d}", "type": "수입" if n == 0 else "지출", "major_category": "식비",
+                 "description": f"\"{day}-{n}\" 점심 🍚", "amount": 1000 * day + n + 0.5}
+                for day in (3, 4, 10, 11, 20) for n in range(day % 4 + 1)
+            ]
+        )
+
+    async def _body(self, start=None, end=None, ndjson=False):
+        chunks = main._ndjson_chunks if ndjson else main._json_array_chunks
+        return b"".join([chunk async for chunk in chunks(main._iter_daily_groups(start, end))])
+
+    async def test_stream_matches_in_memory_body_across_page_sizes(self):
+        for page_size in (1, 2, 3, 1000):
+            with mock.patch.object(main, "DAILY_PAGE_SIZE", page_size):
+                for start, end in ((None, None), (date(2026, 1, 4), date(2026, 1, 11))):
+                    body = await self._body(start, end)
+                    self.assertEqual(json.loads(body), reference_daily(start, end))
+
+    async def test_ndjson_emits_one_group_per_line(self):
+        with mock.patch.object(main, "DAILY_PAGE_SIZE", 2):
+            lines = (await self._body(ndjson=True)).splitlines()
+        self.assertEqual([json.loads(line) for line in lines], reference_daily(None, None))
+        self.assertEqual([json.loads(line)["date"] for line in lines],
+                         ["2026-01-20", "2026-01-11", "2026-01-10", "2026-01-04", "2026-01-03"])
+
+    async def test_empty_range_is_an_empty_array(self):
+        self.assertEqual(await self._body(date(2025, 1, 1), date(2025, 1, 31)), b"[]")
+
+    async def test_virtual_fixed_expenses_are_grouped_with_their_day(self):
+        old_mode = crud.FIXED_EXPENSE_MODE
+        crud.FIXED_EXPENSE_MODE = "virtual"
+        try:
+            crud.create_fixed_expense(
+                {"major_category": "주거", "sub_category": "월세", "amount": 500000,
+                 "start_date": "2026-01-01", "end_date": "2026-01-31", "day_of_month": 10}
+            )
+            with mock.patch.object(main, "DAILY_PAGE_SIZE", 2):
+                groups = json.loads(await self._body(date(2026, 1, 1), date(2026, 1, 31)))
+        finally:
+            crud.FIXED_EXPENSE_MODE = old_mode
+        tenth = next(g for g in groups if g["date"] == "2026-01-10")
+        self.assertIn(500000.0, [t["amount"] for t in tenth["transactions"]])
+        self.assertEqual([g["date"] for g in groups], sorted({g["date"] for g in groups}, reverse=True))
+        self.assertEqual(sum(len(g["transactions"]) for g in groups), 14)
+
+
+if __name__ == "__main__":
+    unittest.main()
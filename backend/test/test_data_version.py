@@ -0,0 +1,82 @@
+import unittest
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app import crud, models_core
+from app.main import _etag_matches, _not_modified
+from test.db_case import CrudDBTestCase
+
+
+class DataVersionTests(CrudDBTestCase):
+    def test_every_mutation_bumps_the_version(self):
+        self.assertEqual(crud.get_data_version(), 0)
+        created = crud.create_transactions_bulk([{"date": "2026-01-10", "type": "지출", "amount": 1000}])
+        crud.update_transaction(created[0]["id"], {"amount": 2000})
+        crud.delete_transaction(created[0]["id"])
+        fe = crud.create_fixed_expense(
+            {"major_category": "주거", "sub_category": "월세", "amount": 500000,
+             "start_date": "2026-01-01", "end_date": "2026-03-31", "day_of_month": 25}
+        )
+        crud.update_fixed_expense(fe.id, {"amount": 510000})
+        crud.delete_fixed_expense(fe.id)
+        saving = crud.create_saving({"kind": "적금", "start_date": "2026-01-01"})
+        crud.update_saving(saving.id, {"contribution_amount": 100000})
+        crud.delete_saving(saving.id)
+        crud.set_setting_categories(["식비"], ["점심"])
+        self.assertEqual(crud.get_data_version(), 11)  # settings replace commits twice
+
+    def test_reads_and_failed_writes_do_not_bump(self):
+        crud.create_transactions_bulk([{"date": "2026-01-10", "type": "지출", "amount": 1000}])
+        crud.query_transactions()
+        crud.get_summary()
+        self.assertIsNone(crud.update_transaction(9999, {"amount": 1}))
+        with self.assertRaises(ValueError):
+            crud.create_transactions_bulk([{"date": "not a date", "amount": 1}])
+        self.assertEqual(crud.get_data_version(), 1)
+
+    def test_startup_seeds_the_row_once_and_writes_upsert_it(self):
+        old_engine = models_core.engine
+        models_core.engine = self._engine
+        try:
+            models_core.create_db_and_tables()
+            models_core.create_db_and_tables()
+        finally:
+            models_core.engine = old_engine
+        with self._engine.connect() as conn:
+            self.assertEqual(conn.exec_driver_sql("SELECT id, version FROM data_version").fetchall(), [(1, 0)])
+        crud.set_setting_categories(["식비"], ["점심"])
+        self.assertEqual(crud.get_data_version(), 2)
+
+
+def _request(if_none_match=None, query=b"start=2026-01-01&end=2026-01-31"):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/api/summary", "query_string": query, "headers": headers})
+
+
+class ETagTests(unittest.TestCase):
+    def test_etag_matching_is_weak_and_accepts_lists(self):
+        self.assertTrue(_etag_matches('W/"3-abc"', 'W/"3-abc"'))
+        self.assertTrue(_etag_matches('"3-abc"', 'W/"3-abc"'))
+        self.assertTrue(_etag_matches('W/"2-abc", W/"3-abc"', 'W/"3-abc"'))
+        self.assertTrue(_etag_matches("*", 'W/"3-abc"'))
+        self.assertFalse(_etag_matches('W/"2-abc"', 'W/"3-abc"'))
+        self.assertFalse(_etag_matches(None, 'W/"3-abc"'))
+
+    def test_not_modified_depends_on_version_and_params(self):
+        response = Response()
+        self.assertIsNone(_not_modified(_request(), response, 5))
+        etag = response.headers["etag"]
+        self.assertEqual(response.headers["cache-control"], "no-cache")
+
+        # same params in another order -> same tag -> 304 without a body
+        reordered = _not_modified(_request(etag, b"end=2026-01-31&start=2026-01-01"), Response(), 5)
+        self.assertEqual(reordered.status_code, 304)
+        self.assertEqual(reordered.headers["etag"], etag)
+
+        self.assertIsNone(_not_modified(_request(etag), Response(), 6))
+        self.assertIsNone(_not_modified(_request(etag, b"start=2026-02-01"), Response(), 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
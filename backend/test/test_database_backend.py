@@ -0,0 +1,101 @@
+import os
+import unittest
+from datetime import date
+
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from app import crud, models_core
+from app.models_core import DailyRollup
+from test.db_case import TempDirTestCase
+
+POSTGRES_URL = os.environ.get("MONEY_CALENDAR_TEST_POSTGRES_URL")
+
+
+class EngineConfigTests(TempDirTestCase):
+    def test_sqlite_url_gets_pragma_profile(self):
+        engine = models_core.create_app_engine(f"sqlite:///{self._tmpdir.name}/config.db", environ={})
+        with engine.connect() as conn:
+            self.assertEqual(conn.exec_driver_sql("PRAGMA journal_mode").scalar(), "wal")
+        engine.dispose()
+
+    def test_server_url_uses_pool_settings_from_environment(self):
+        # create_engine does not connect, it only needs the driver to be importable
+        try:
+            engine = models_core.create_app_engine(
+                "postgresql+psycopg://user:pw@localhost/money_calendar",
+                environ={
+                    "MONEY_CALENDAR_DB_POOL_SIZE": "12",
+                    "MONEY_CALENDAR_DB_MAX_OVERFLOW": "3",
+                    "MONEY_CALENDAR_DB_POOL_PRE_PING": "off",
+                },
+            )
+        except ImportError:
+            self.skipTest("psycopg is not installed")
+        self.assertEqual(engine.pool.size(), 12)
+        self.assertEqual(engine.pool._max_overflow, 3)
+        self.assertFalse(engine.pool._pre_ping)
+        engine.dispose()
+
+    def test_invalid_pool_setting_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "MONEY_CALENDAR_DB_POOL_SIZE"):
+            models_core.create_app_engine(
+                "postgresql+psycopg://user:pw@localhost/money_calendar",
+                environ={"MONEY_CALENDAR_DB_POOL_SIZE": "many"},
+            )
+
+    def test_schema_helpers_use_inspector(self):
+        engine = create_engine(f"sqlite:///{self._tmpdir.name}/legacy.db")
+        with engine.begin() as conn:
+            conn.exec_driver_sql('CREATE TABLE "transaction" (id INTEGER PRIMARY KEY, date DATE, amount FLOAT)')
+        models_core._ensure_columns(engine, "transaction", {"major_category": "TEXT", "type": "TEXT"})
+        models_core._ensure_indexes(engine)
+        with engine.connect() as conn:
+            self.assertIn("major_category", models_core._existing_columns(conn, "transaction"))
+            index_names = {ix["name"] for ix in models_core.inspect(conn).get_indexes("transaction")}
+        self.assertIn("idx_transaction_major", index_names)
+        engine.dispose()
+
+
+@unittest.skipUnless(POSTGRES_URL, "set MONEY_CALENDAR_TEST_POSTGRES_URL to run against PostgreSQL")
+class PostgresBackendTests(unittest.TestCase):
+    def setUp(self):
+        self._engine = models_core.create_app_engine(POSTGRES_URL)
+        SQLModel.metadata.drop_all(self._engine)
+        SQLModel.metadata.create_all(self._engine)
+        self._old_engine = crud.engine
+        crud.engine = self._engine
+
+    def tearDown(self):
+        crud.engine = self._old_engine
+        SQLModel.metadata.drop_all(self._engine)
+        self._engine.dispose()
+
+    def test_transaction_writes_and_rollup_upsert(self):
+        created = crud.create_transactions_bulk(
+            [
+                {"date": "2026-01-10", "type": "지출", "major_category": "식비", "amount": 9000},
+                {"date": "2026-01-10", "type": "지출", "major_category": "식비", "amount": 1000},
+            ]
+        )
+        crud.update_transaction(created[0]["id"], {"amount": 4000})
+        crud.delete_transaction(created[1]["id"])
+
+        with Session(self._engine) as session:
+            rows = session.exec(select(DailyRollup)).all()
+        self.assertEqual([(r.date, r.amount, r.count) for r in rows], [(date(2026, 1, 10), 4000.0, 1)])
+
+        items, total = crud.query_transactions(start=date(2026, 1, 1), end=date(2026, 1, 31), search="식")
+        self.assertEqual(total, 1)
+        self.assertEqual(items[0].amount, 4000.0)
+
+    def test_ensure_schema_helpers_are_idempotent(self):
+        models_core._ensure_columns(self._engine, "transaction", {"raw_source": "TEXT"})
+        models_core._ensure_indexes(self._engine)
+        models_core._ensure_indexes(self._engine)
+        with self._engine.connect() as conn:
+            index_names = {ix["name"] for ix in models_core.inspect(conn).get_indexes("transaction")}
+        self.assertTrue({name for name, _ in models_core.TRANSACTION_INDEXES} <= index_names)
+
+
+if __name__ == "__main__":
+    unittest.main()
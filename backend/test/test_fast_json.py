@@ -0,0 +1,82 @@
+import json
+import unittest
+from datetime import date
+from unittest import mock
+
+from fastapi.encoders import jsonable_encoder
+
+from app import crud
+from app.main import _serialize_transaction, _transaction_list_body
+from app.utils import fast_json
+from test.db_case import CrudDBTestCase
+
+
+class FastJsonListingTests(CrudDBTestCase):
+    def setUp(self):
+        super().setUp()
+        crud.create_transactions_bulk(
+            [
+                {"date": "2026-01-10", "type": "지출", "major_category": "식비", "sub_category": "점심",
+                 "description": '김밥 "천국" \\ 😀', "amount": 9000},
+                {"date": "2026-01-11", "type": "수입", "major_category": "급여", "amount": 1234.5},
+                {"date": "2026-01-12", "amount": 0.1},
+            ]
+        )
+
+    def _reference_body(self, per_page=2):
+        # the previous response: ORM objects -> _serialize_transaction -> FastAPI JSONResponse
+        items, total = crud.query_transactions(per_page=per_page)
+        content = {"items": [_serialize_transaction(t) for t in items], "total": total, "page": 1,
+                   "per_page": per_page, "next_cursor": "abc"}
+        return json.dumps(jsonable_encoder(content), ensure_ascii=False, allow_nan=False, indent=None,
+                          separators=(",", ":")).encode("utf-8")
+
+    def _fast_body(self, per_page=2):
+        rows, total = crud.query_transaction_rows(per_page=per_page)
+        return _transaction_list_body(rows, total, 1, per_page, "abc")
+
+    def test_fast_body_is_byte_identical(self):
+        self.assertEqual(self._fast_body(), self._reference_body())
+
+    def test_stdlib_fallback_is_byte_identical(self):
+        with mock.patch.object(fast_json, "orjson", None):
+            self.assertEqual(self._fast_body(), self._reference_body())
+
+    def test_rows_include_virtual_fixed_expenses(self):
+        old_mode = crud.FIXED_EXPENSE_MODE
+        crud.FIXED_EXPENSE_MODE = "virtual"
+        try:
+            crud.create_fixed_expense(
+                {"major_category": "주거", "sub_category": "월세", "amount": 500000,
+                 "start_date": "2026-01-01", "end_date": "2026-01-31", "day_of_month": 11}
+            )
+            rows, total = crud.query_transaction_rows(start=date(2026, 1, 1), end=date(2026, 1, 31))
+            items, _ = crud.query_transactions(start=date(2026, 1, 1), end=date(2026, 1, 31))
+            self.assertEqual(total, 4)
+            self.assertEqual([tuple(r) for r in rows],
+                             [(t.id, t.date, t.direction, t.major_category, t.sub_category, t.amount, t.description)
+                              for t in items])
+            self.assertEqual(self._fast_body(per_page=10), self._reference_body(per_page=10))
+        finally:
+            crud.FIXED_EXPENSE_MODE = old_mode
+
+
+class FastJsonFloatTests(unittest.TestCase):
+    def test_floats_outside_the_shared_range_keep_stdlib_bytes(self):
+        body = {"amounts": [1e16, -1.5e-07, 1e-05, 1.7976931348623157e308, 0.0001, 1234.5, 0.0], "n": 2 ** 70}
+        expected = b'{"amounts":[1e+16,-1.5e-07,1e-05,1.7976931348623157e+308,0.0001,1234.5,0.0],"n":1180591620717411303424}'
+        self.assertEqual(fast_json.dumps(body), expected)
+        with mock.patch.object(fast_json, "orjson", None):
+            self.assertEqual(fast_json.dumps(body), expected)
+
+    def test_nan_and_infinity_are_rejected_on_both_paths(self):
+        for value in (float("nan"), float("inf"), -float("inf")):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    fast_json.dumps({"items": [{"amount": value}]})
+                with mock.patch.object(fast_json, "orjson", None), self.assertRaises(ValueError):
+                    fast_json.dumps({"items": [{"amount": value}]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,10 +2,18 @@ import tempfile
 import unittest
 from datetime import date
 
+from sqlalchemy import event
 from sqlmodel import SQLModel, Session, create_engine, select
 
 from app import crud
-from app.models_core import FixedExpense, Transaction
+from app.models_core import DailyRollup, FixedExpense, Transaction
+
+try:
+    from fastapi import HTTPException
+
+    from app import main
+except ImportError:  # aiosqlite/greenlet not installed
+    main = None
 
 
 class CrudDBTestCase(unittest.TestCase):
@@ -123,6 +131,208 @@ class FixedExpenseCrudTests(CrudDBTestCase):
         self.assertIsNone(remaining_fixed)
         self.assertEqual(txs, [])
 
+    def _generated(self, fixed_id):
+        with Session(self._engine) as session:
+            txs = session.exec(
+                select(Transaction).where(Transaction.raw_source == f"fixed:{fixed_id}").order_by(Transaction.date)
+            ).all()
+        return [(t.id, t.date, t.amount, t.description) for t in txs]
+
+    def _rollup(self):
+        with Session(self._engine) as session:
+            return sorted((r.date, r.major_category, r.amount, r.count) for r in session.exec(select(DailyRollup)).all())
+
+    def test_update_fixed_expense_only_writes_the_difference(self):
+        crud.create_fixed_expense(
+            {
+                "major_category": "통신",
+                "sub_category": "휴대폰",
+                "description": "요금",
+                "amount": 50000,
+                "start_date": "2026-01-01",
+                "end_date": "2027-12-31",
+                "day_of_month": 25,
+            }
+        )
+        fixed_id = crud.list_fixed_expenses()[0].id
+        before = self._generated(fixed_id)
+        self.assertEqual(len(before), 24)
+
+        statements = []
+
+        def listener(conn, cursor, stmt, params, ctx, many):
+            # the per-commit data_version upsert and data_change log are bookkeeping, not row writes
+            if "data_version" not in stmt and "data_change" not in stmt:
+                statements.append(stmt.split()[0].upper())
+
+        event.listen(self._engine, "before_cursor_execute", listener)
+        try:
+            crud.update_fixed_expense(fixed_id, {"description": "요금제 변경"})
+        finally:
+            event.remove(self._engine, "before_cursor_execute", listener)
+        self.assertNotIn("DELETE", statements)
+        self.assertNotIn("INSERT", statements)
+        after_desc = self._generated(fixed_id)
+        self.assertEqual([r[0] for r in after_desc], [r[0] for r in before])
+        self.assertTrue(all(r[3] == "요금제 변경" for r in after_desc))
+
+        crud.update_fixed_expense(fixed_id, {"end_date": "2028-01-31", "start_date": "2026-02-01"})
+        moved = self._generated(fixed_id)
+        self.assertEqual([r[0] for r in moved[:-1]], [r[0] for r in before[1:]])
+        self.assertEqual(moved[-1][1], date(2028, 1, 25))
+
+        crud.update_fixed_expense(fixed_id, {"day_of_month": 31, "amount": 55000})
+        shifted = self._generated(fixed_id)
+        self.assertEqual([r[0] for r in shifted], [r[0] for r in moved])
+        self.assertEqual(shifted[0][1:3], (date(2026, 2, 28), 55000.0))
+
+        incremental = self._rollup()
+        crud.rebuild_daily_rollup()
+        self.assertEqual(self._rollup(), incremental)
+
+    @unittest.skipUnless(main, "aiosqlite is not installed")
+    def test_api_answers_404_for_negative_ids_in_materialized_mode(self):
+        crud.create_fixed_expense(
+            {"major_category": "주거", "sub_category": "월세", "amount": 500000,
+             "start_date": "2026-01-01", "end_date": "2026-03-31", "day_of_month": 25}
+        )
+        fixed_id = crud.list_fixed_expenses()[0].id
+        occurrence_id = -(fixed_id * 1_000_000 + 2026 * 12 + 1)  # what "virtual" mode would call February
+        for call in (lambda: main.api_transaction_put(occurrence_id, {"amount": 1}),
+                     lambda: main.api_transaction_patch(occurrence_id, {"amount": 1}),
+                     lambda: main.api_transaction_delete(occurrence_id)):
+            with self.assertRaises(HTTPException) as ctx:
+                call()
+            self.assertEqual(ctx.exception.status_code, 404)
+        self.assertEqual(len(self._generated(fixed_id)), 3)
+
+
+class VirtualFixedExpenseTests(CrudDBTestCase):
+    def setUp(self):
+        super().setUp()
+        self._old_mode = crud.FIXED_EXPENSE_MODE
+        crud.FIXED_EXPENSE_MODE = "virtual"
+
+    def tearDown(self):
+        crud.FIXED_EXPENSE_MODE = self._old_mode
+        super().tearDown()
+
+    def _create_rent(self):
+        crud.create_fixed_expense(
+            {
+                "major_category": "주거",
+                "sub_category": "월세",
+                "description": "오피스텔",
+                "amount": 500000,
+                "start_date": "2026-01-01",
+                "end_date": "2030-12-31",
+                "day_of_month": 31,
+            }
+        )
+        return crud.list_fixed_expenses()[0].id
+
+    def test_virtual_mode_writes_no_rows_and_expands_window(self):
+        fixed_id = self._create_rent()
+        with Session(self._engine) as session:
+            self.assertEqual(session.exec(select(Transaction)).all(), [])
+
+        items, total = crud.query_transactions(start=date(2026, 2, 1), end=date(2026, 3, 31))
+        self.assertEqual(total, 2)
+        self.assertEqual([t.date for t in items], [date(2026, 3, 31), date(2026, 2, 28)])
+        self.assertTrue(all(t.id < 0 and t.raw_source == f"fixed:{fixed_id}" for t in items))
+
+        again, _ = crud.query_transactions(start=date(2026, 3, 1), end=date(2026, 3, 31))
+        self.assertEqual(again[0].id, items[0].id)
+        resolved = crud.get_transaction(items[0].id)
+        self.assertEqual((resolved.date, resolved.amount), (date(2026, 3, 31), 500000.0))
+
+        self.assertEqual(crud.query_transactions(tx_type="income", start=date(2026, 2, 1), end=date(2026, 3, 31))[1], 0)
+        self.assertEqual(crud.query_transactions(search="오피스", start=date(2026, 2, 1), end=date(2026, 3, 31))[1], 2)
+
+        totals = crud.get_daily_totals(date(2026, 2, 1), date(2026, 2, 28))
+        self.assertEqual([(t.date, t.direction, t.amount, t.count) for t in totals],
+                         [(date(2026, 2, 28), "Expense", 500000.0, 1)])
+
+    @unittest.skipUnless(main, "aiosqlite is not installed")
+    def test_api_rejects_writes_to_virtual_occurrences(self):
+        self._create_rent()
+        items, _ = crud.query_transactions(start=date(2026, 2, 1), end=date(2026, 2, 28))
+        virtual_id = items[0].id
+        self.assertEqual(main.api_transaction_get(virtual_id)["amount"], 500000.0)
+        for call in (lambda: main.api_transaction_put(virtual_id, {"amount": 1}),
+                     lambda: main.api_transaction_patch(virtual_id, {"amount": 1}),
+                     lambda: main.api_transaction_delete(virtual_id)):
+            with self.assertRaises(HTTPException) as ctx:
+                call()
+            self.assertEqual(ctx.exception.status_code, 409)
+            self.assertIn("/api/fixed_expenses", ctx.exception.detail)
+        self.assertEqual(crud.get_transaction(virtual_id).amount, 500000.0)
+
+    def test_virtual_rows_merge_with_stored_rows_across_pages(self):
+        self._create_rent()
+        crud.create_transactions_bulk(
+            [
+                {"date": f"2026-{m:02d}-{d:02d}", "type": "지출", "amount": m * 100 + d}
+                for m in range(1, 7)
+                for d in (1, 28, 30)
+                if not (m == 2 and d == 30)
+            ]
+        )
+        window = {"start": date(2026, 1, 1), "end": date(2026, 6, 30)}
+        everything, total = crud.query_transactions(per_page=1000, **window)
+        self.assertEqual(total, 17 + 6)
+        self.assertEqual([(t.date, t.id) for t in everything],
+                         sorted(((t.date, t.id) for t in everything), reverse=True))
+
+        for per_page in (1, 4, 5, 7):
+            paged = []
+            page = 1
+            while True:
+                items, _ = crud.query_transactions(page=page, per_page=per_page, include_total=False, **window)
+                paged.extend(items)
+                if len(items) < per_page:
+                    break
+                page += 1
+            self.assertEqual([t.id for t in paged], [t.id for t in everything], per_page)
+
+        keyset = []
+        after = None
+        while True:
+            items, _ = crud.query_transactions(per_page=4, after=after, include_total=False, **window)
+            keyset.extend(items)
+            if len(items) < 4:
+                break
+            after = (items[-1].date, items[-1].id)
+        self.assertEqual([t.id for t in keyset], [t.id for t in everything])
+
+        exported = [row[0] for batch in crud.iter_transaction_batches(batch_size=5, **window) for row in batch]
+        self.assertEqual(exported, [t.id for t in everything])
+
+    def test_read_paths_use_rows_and_models_only_where_returned(self):
+        self._create_rent()
+        crud.create_transactions_bulk([{"date": "2026-02-10", "type": "지출", "amount": 1000}])
+        with Session(self._engine) as session:
+            occurrences = crud._virtual_fixed_transactions(session, date(2026, 1, 1), date(2026, 3, 31))
+        self.assertTrue(all(type(o) is crud.TransactionRow for o in occurrences))
+
+        items, _ = crud.query_transactions(start=date(2026, 2, 1), end=date(2026, 2, 28))
+        self.assertTrue(all(isinstance(t, Transaction) for t in items))
+        self.assertEqual(sorted(t.amount for t in items), [1000.0, 500000.0])
+        self.assertIsInstance(crud.get_transaction(occurrences[0].id), Transaction)
+
+        rows, _ = crud.query_transaction_rows(start=date(2026, 2, 1), end=date(2026, 2, 28))
+        self.assertEqual([(r.date, r.type) for r in rows], [(date(2026, 2, 28), "Expense"), (date(2026, 2, 10), "Expense")])
+
+    def test_sync_switches_between_modes(self):
+        fixed_id = self._create_rent()
+        crud.FIXED_EXPENSE_MODE = "materialized"
+        self.assertEqual(crud.sync_fixed_expense_transactions(), 60)
+        crud.FIXED_EXPENSE_MODE = "virtual"
+        self.assertEqual(crud.sync_fixed_expense_transactions(), 0)
+        with Session(self._engine) as session:
+            rows = session.exec(select(Transaction).where(Transaction.raw_source == f"fixed:{fixed_id}")).all()
+        self.assertEqual(rows, [])
+
 
 if __name__ == "__main__":
     unittest.main()
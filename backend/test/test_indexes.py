@@ -0,0 +1,70 @@
+import unittest
+from datetime import date
+
+from sqlalchemy import event
+
+from app import crud, models_core
+from test.db_case import CrudDBTestCase
+
+
+class IndexTests(CrudDBTestCase):
+    def _capture(self, fn):
+        """Run fn and return the (sql, params) pairs it sent to the DB."""
+        seen = []
+        listener = lambda conn, cursor, stmt, params, ctx, many: seen.append((stmt, params))
+        event.listen(self._engine, "before_cursor_execute", listener)
+        try:
+            fn()
+        finally:
+            event.remove(self._engine, "before_cursor_execute", listener)
+        return seen
+
+    def _plan(self, sql, params):
+        with self._engine.connect() as conn:
+            rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+        return " | ".join(r[3] for r in rows)
+
+    def _index_names(self):
+        with self._engine.connect() as conn:
+            rows = conn.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'transaction'"
+            ).fetchall()
+        return {r[0] for r in rows}
+
+    def test_declared_indexes_exist_on_fresh_and_legacy_databases(self):
+        declared = {name for name, _ in models_core.TRANSACTION_INDEXES}
+        self.assertEqual(self._index_names(), declared)
+
+        with self._engine.begin() as conn:
+            for name in declared:
+                conn.exec_driver_sql(f"DROP INDEX {name}")
+        self.assertEqual(self._index_names(), set())
+        models_core._ensure_indexes(self._engine)
+        self.assertEqual(self._index_names(), declared)
+
+    def test_fixed_expense_rows_are_found_through_raw_source_index(self):
+        crud.create_fixed_expense(
+            {
+                "major_category": "주거",
+                "sub_category": "월세",
+                "amount": 1,
+                "start_date": "2026-01-01",
+                "end_date": "2026-06-30",
+                "day_of_month": 1,
+            }
+        )
+        fixed_id = crud.list_fixed_expenses()[0].id
+        statements = self._capture(lambda: crud.update_fixed_expense(fixed_id, {"amount": 2}))
+        raw_source_stmts = [(sql, p) for sql, p in statements if "raw_source = ?" in sql]
+        self.assertTrue(raw_source_stmts)
+        for sql, params in raw_source_stmts:
+            self.assertIn("idx_transaction_raw_source", self._plan(sql, params), sql)
+
+    def test_range_aggregate_uses_covering_index(self):
+        statements = self._capture(lambda: crud.aggregate_transactions(date(2026, 1, 1), date(2026, 1, 31)))
+        sql, params = next((sql, p) for sql, p in statements if "GROUP BY" in sql)
+        self.assertIn("USING COVERING INDEX idx_transaction_date_cover", self._plan(sql, params))
+
+
+if __name__ == "__main__":
+    unittest.main()
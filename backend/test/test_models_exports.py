@@ -7,6 +7,10 @@ class ModelsExportTests(unittest.TestCase):
     def test_models_module_reexports_models_core_symbols(self):
         self.assertIs(models.engine, models_core.engine)
         self.assertIs(models.Transaction, models_core.Transaction)
+        self.assertIs(models.DailyRollup, models_core.DailyRollup)
+        self.assertIs(models.TransactionCategory, models_core.TransactionCategory)
+        self.assertIs(models.DataVersion, models_core.DataVersion)
+        self.assertIs(models.DataChange, models_core.DataChange)
         self.assertIs(models.FixedExpense, models_core.FixedExpense)
         self.assertIs(models.Saving, models_core.Saving)
         self.assertIs(models.CategoryMajor, models_core.CategoryMajor)
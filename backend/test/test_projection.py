@@ -0,0 +1,130 @@
+import random
+import unittest
+from datetime import date, timedelta
+
+from app import crud
+from test.db_case import CrudDBTestCase
+
+
+def reference_projection(start, end, opening_balance=None):
+    """Day by day: every stored/virtual transaction and every saving contribution, walked one at a time."""
+    items, _ = crud.query_transactions(per_page=10 ** 6, include_total=False)
+    flows = {}
+    before = 0.0
+    for t in items:
+        signed = t.amount if "income" in (t.direction or "").lower() else -t.amount
+        if t.date < start:
+            before += signed
+        else:
+            flows[t.date] = flows.get(t.date, 0.0) + signed
+    for s in crud.list_savings():
+        if not s.active or s.withdrawn or not s.contribution_amount:
+            continue
+        d = s.start_date
+        while d <= end:
+            n = crud._contribution_count(s.frequency, s.start_date, s.day_of_month, s.end_date, d)
+            prev = crud._contribution_count(s.frequency, s.start_date, s.day_of_month, s.end_date, d - timedelta(days=1))
+            if n > prev and d >= start:
+                flows[d] = flows.get(d, 0.0) - s.contribution_amount
+            elif n > prev:
+                before -= s.contribution_amount
+            d += timedelta(days=1)
+    balance = before if opening_balance is None else opening_balance
+    out = []
+    d = start
+    while d <= end:
+        balance += flows.get(d, 0.0)
+        out.append(balance)
+        d += timedelta(days=1)
+    return out
+
+
+class ProjectionTests(CrudDBTestCase):
+    def setUp(self):
+        super().setUp()
+        self._old_mode = crud.FIXED_EXPENSE_MODE
+
+        rng = random.Random(24)
+        crud.create_transactions_bulk(
+            [
+                {"date": (date(2025, 6, 1) + timedelta(days=rng.randrange(500))).isoformat(),
+                 "type": rng.choice(["수입", "지출", "지출"]), "major_category": "생활",
+                 "amount": rng.randrange(1, 10 ** 5)}
+                for _ in range(300)
+            ]
+        )
+        crud.create_saving({"name": "적금", "kind": "적금", "initial_balance": 500_000, "contribution_amount": 100_000,
+                            "start_date": "2025-11-30", "end_date": "2026-08-31", "day_of_month": 31,
+                            "interest_rate": 3.5})
+        crud.create_saving({"name": "주간", "kind": "적금", "contribution_amount": 20_000,
+                            "start_date": "2026-01-05", "frequency": "weekly", "interest_type": "compound",
+                            "interest_rate": 2})
+        crud.create_saving({"name": "해지", "kind": "예금", "initial_balance": 1_000_000, "contribution_amount": 1,
+                            "start_date": "2025-01-01", "withdrawn": True})
+
+    def tearDown(self):
+        crud.FIXED_EXPENSE_MODE = self._old_mode
+        super().tearDown()
+
+    def _add_fixed(self):
+        crud.create_fixed_expense({"major_category": "주거", "sub_category": "월세", "amount": 550_000,
+                                   "start_date": "2025-03-01", "end_date": "2027-02-28", "day_of_month": 31})
+
+    def test_daily_balance_matches_transaction_walk_in_both_fixed_modes(self):
+        start, end = date(2026, 1, 1), date(2026, 12, 31)
+        for mode in ("materialized", "virtual"):
+            with self.subTest(mode=mode):
+                crud.FIXED_EXPENSE_MODE = mode
+                self._add_fixed()
+                result = crud.get_projection(start, end)
+                self.assertEqual(len(result["dates"]), 365)
+                expected = reference_projection(start, end)
+                for got, want in zip(result["balance"], expected):
+                    self.assertAlmostEqual(got, want, places=4)
+                self.assertAlmostEqual(result["balance"][-1], result["opening_balance"] + sum(result["income"])
+                                       - sum(result["expense"]) - sum(result["savings"]), places=4)
+                crud.delete_fixed_expense(crud.list_fixed_expenses()[0].id)
+
+    def test_sampled_steps_sum_flows_and_match_savings_forecast(self):
+        self._add_fixed()
+        start, end = date(2026, 1, 15), date(2027, 3, 1)
+        daily = crud.get_projection(start, end, opening_balance=1000)
+        self.assertEqual(daily["opening_balance"], 1000.0)
+        self.assertAlmostEqual(daily["balance"][-1], reference_projection(start, end, 1000)[-1], places=4)
+        for step in ("week", "month"):
+            sampled = crud.get_projection(start, end, step, opening_balance=1000)
+            offsets = [(date.fromisoformat(d) - start).days for d in sampled["dates"]]
+            self.assertEqual(sampled["balance"], [daily["balance"][k] for k in offsets])
+            for key in ("income", "expense", "savings"):
+                bounds = [0] + [k + 1 for k in offsets]
+                want = [sum(daily[key][a:b]) for a, b in zip(bounds, bounds[1:])]
+                for got, w in zip(sampled[key], want):
+                    self.assertAlmostEqual(got, w, places=4)
+            for d, total in zip(sampled["dates"], sampled["savings_balance"]):
+                self.assertEqual(total, crud.forecast_savings(date.fromisoformat(d))["total"])
+        # weekly savings: 20,000 every Monday of the daily window
+        mondays = sum(1 for k in range(len(daily["dates"])) if (start + timedelta(days=k)).weekday() == 0)
+        self.assertEqual(sum(daily["savings"]), 20_000 * mondays + 100_000 * 8)
+
+    def test_balance_on_a_day_does_not_depend_on_start(self):
+        self._add_fixed()
+        day = date(2026, 9, 30)
+        balances = []
+        for start in (date(2025, 6, 1), date(2026, 1, 1), date(2026, 3, 17), day):
+            result = crud.get_projection(start, day)
+            self.assertEqual(result["dates"][-1], day.isoformat())
+            balances.append(result["balance"][-1])
+        for b in balances[1:]:
+            self.assertAlmostEqual(b, balances[0], places=4)
+
+    def test_validation(self):
+        with self.assertRaisesRegex(ValueError, "Invalid step"):
+            crud.get_projection(date(2026, 1, 1), date(2026, 2, 1), "year")
+        with self.assertRaisesRegex(ValueError, "end must not be before start"):
+            crud.get_projection(date(2026, 2, 1), date(2026, 1, 1))
+        with self.assertRaisesRegex(ValueError, "Too many points"):
+            crud.get_projection(date(2000, 1, 1), date(2040, 1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
+import calendar
+import random
 import tempfile
 import unittest
-from datetime import date
+from datetime import date, timedelta
 
 from sqlmodel import SQLModel, create_engine
 
@@ -24,6 +26,67 @@ class CrudDBTestCase(unittest.TestCase):
         self._tmpdir.cleanup()
 
 
+def reference_contributions(start, day_of_month, end, on_date):
+    """The pre-closed-form forecast loop: walk every month and collect the scheduled dates."""
+    contrib_end = min(end, on_date) if end else on_date
+    out = []
+    if contrib_end < start:
+        return out
+    for y, m in crud._iter_months(start, contrib_end):
+        last_day = calendar.monthrange(y, m)[1]
+        day = min(day_of_month, last_day) if day_of_month else min(start.day, last_day)
+        occ = date(y, m, day)
+        if occ <= on_date and occ >= start and (not end or occ <= end):
+            out.append(occ)
+    return out
+
+
+def reference_schedule(frequency, start, day_of_month, end, on_date):
+    """Brute-force contribution dates: step candidate by candidate from start_date's period."""
+    last = min(end, on_date) if end else on_date
+    out = []
+    if last < start:
+        return out
+    k = 0
+    while True:
+        if frequency in ("weekly", "biweekly"):
+            occ = start + timedelta(days=k * (7 if frequency == "weekly" else 14))
+        else:
+            months = {"monthly": 1, "quarterly": 3, "yearly": 12}[frequency]
+            y, m = divmod(start.month - 1 + k * months, 12)
+            y += start.year
+            occ = date(y, m + 1, min(day_of_month or start.day, calendar.monthrange(y, m + 1)[1]))
+        if occ > last:
+            return out
+        if occ >= start:
+            out.append(occ)
+        k += 1
+
+
+def reference_balance(sv, on_date):
+    """Per-contribution forecast: every amount earns interest from its own date until on_date / maturity."""
+    if sv.withdrawn:
+        return 0.0
+    rate = (sv.interest_rate or 0.0) / 100
+    accrue_to = min(sv.end_date, on_date) if sv.end_date else on_date
+
+    def grown(amount, since):
+        days = max((accrue_to - since).days, 0)
+        if sv.interest_type == "compound":
+            return amount * (1 + rate) ** (days / 365)
+        return amount * (1 + rate * days / 365)
+
+    balance = grown(float(sv.initial_balance), sv.start_date)
+    if sv.contribution_amount:
+        for occ in reference_schedule(sv.frequency, sv.start_date, sv.day_of_month, sv.end_date, on_date):
+            balance += grown(float(sv.contribution_amount), occ)
+    return balance
+
+
+def random_date(rng, lo=date(1990, 1, 1), span_days=30 * 365):
+    return lo + timedelta(days=rng.randrange(span_days))
+
+
 class SavingsAndSettingsTests(CrudDBTestCase):
     def test_create_saving_requires_kind(self):
         with self.assertRaisesRegex(ValueError, "Missing required field: kind"):
@@ -79,6 +142,169 @@ class SavingsAndSettingsTests(CrudDBTestCase):
         item = result["items"][0]
         self.assertEqual(item["predicted_balance"], 100.0)
 
+    def test_contribution_count_matches_month_loop_on_random_inputs(self):
+        rng = random.Random(20261016)
+        for _ in range(3000):
+            start = random_date(rng)
+            # dense month-end / leap-year cases next to wide ranges
+            on_date = start + timedelta(days=rng.choice([rng.randrange(-40, 120), rng.randrange(40 * 366)]))
+            end = rng.choice([None, start + timedelta(days=rng.randrange(-10, 20 * 366))])
+            dom = rng.choice([None, 0, 1, 28, 29, 30, 31, rng.randint(1, 31)])
+            args = (start, dom, end, on_date)
+            self.assertEqual(crud._contribution_count("monthly", *args), len(reference_contributions(*args)), args)
+
+    def test_contribution_count_and_schedule_match_brute_force_for_every_frequency(self):
+        rng = random.Random(23)
+        for frequency in crud.SAVING_FREQUENCIES:
+            for _ in range(600):
+                start = random_date(rng)
+                on_date = start + timedelta(days=rng.choice([rng.randrange(-40, 400), rng.randrange(30 * 366)]))
+                end = rng.choice([None, start + timedelta(days=rng.randrange(-10, 20 * 366))])
+                dom = rng.choice([None, 1, 29, 30, 31, rng.randint(1, 31)])
+                expected = reference_schedule(frequency, start, dom, end, on_date)
+                args = (frequency, start, dom, end, on_date)
+                self.assertEqual(crud._contribution_count(*args), len(expected), args)
+                schedule = crud._contribution_schedule(frequency, start, dom or start.day, end)
+                (n, ordinal_sum, _), = schedule.totals([on_date])
+                self.assertEqual((n, ordinal_sum), (len(expected), sum(d.toordinal() for d in expected)), args)
+        self.assertEqual(crud._contribution_count("daily", date(2026, 1, 1), None, None, date(2026, 2, 1)), 0)
+
+    def test_forecast_matches_month_loop_for_random_savings(self):
+        rng = random.Random(7)
+        savings = []
+        for i in range(40):
+            start = random_date(rng, date(2020, 1, 1), 6 * 365)
+            data = {
+                "name": f"s{i}",
+                "kind": rng.choice(["적금", "예금", "주식"]),
+                "initial_balance": rng.randrange(0, 10 ** 6),
+                "contribution_amount": rng.choice([0, rng.randrange(1, 10 ** 6), rng.randrange(1, 10 ** 4) + 0.25]),
+                "start_date": start.isoformat(),
+                "end_date": rng.choice([None, (start + timedelta(days=rng.randrange(-30, 3000))).isoformat()]),
+                "day_of_month": rng.choice([None, rng.randint(1, 31)]),
+                "frequency": "monthly",
+                "withdrawn": rng.random() < 0.1,
+            }
+            savings.append(crud.create_saving(data))
+        for on_date in (date(2019, 12, 31), date(2024, 2, 29), date(2031, 1, 31), date(2060, 6, 15)):
+            result = crud.forecast_savings(on_date)
+            by_id = {item["id"]: item["predicted_balance"] for item in result["items"]}
+            for sv in savings:
+                expected = float(sv.initial_balance)
+                if sv.withdrawn:
+                    expected = 0.0
+                elif sv.contribution_amount and sv.frequency == "monthly":
+                    for _ in reference_contributions(sv.start_date, sv.day_of_month, sv.end_date, on_date):
+                        expected += float(sv.contribution_amount)
+                # n * amount instead of n repeated additions: equal up to float rounding
+                self.assertAlmostEqual(by_id[sv.id], expected, places=6)
+            self.assertAlmostEqual(result["total"], sum(by_id.values()), places=6)
+
+    def test_forecast_with_frequencies_and_interest_matches_per_contribution_sum(self):
+        rng = random.Random(2023)
+        savings = []
+        for i in range(60):
+            start = random_date(rng, date(2015, 1, 1), 12 * 365)
+            savings.append(crud.create_saving({
+                "name": f"s{i}",
+                "kind": rng.choice(["적금", "예금", "주식"]),
+                "initial_balance": rng.randrange(0, 10 ** 7),
+                "contribution_amount": rng.choice([0, rng.randrange(1, 10 ** 6)]),
+                "start_date": start.isoformat(),
+                "end_date": rng.choice([None, (start + timedelta(days=rng.randrange(-30, 4000))).isoformat()]),
+                "day_of_month": rng.choice([None, rng.randint(1, 31)]),
+                "frequency": rng.choice(list(crud.SAVING_FREQUENCIES)),
+                "interest_rate": rng.choice([0, 2.5, 3.85, 12, -5]),
+                "interest_type": rng.choice(crud.SAVING_INTEREST_TYPES),
+                "withdrawn": rng.random() < 0.05,
+            }))
+        for on_date in (date(2014, 6, 1), date(2021, 2, 28), date(2030, 12, 31), date(2075, 1, 1), date(2021, 2, 28)):
+            result = crud.forecast_savings(on_date)
+            by_id = {item["id"]: item["predicted_balance"] for item in result["items"]}
+            for sv in savings:
+                expected = reference_balance(sv, on_date)
+                self.assertAlmostEqual(by_id[sv.id], expected, delta=1e-9 * max(1.0, abs(expected)),
+                                       msg=(sv.frequency, sv.interest_type, sv.interest_rate, on_date))
+
+    def test_interest_examples_and_validation(self):
+        deposit = crud.create_saving({"name": "예금", "kind": "예금", "initial_balance": 1_000_000,
+                                      "start_date": "2025-01-01", "end_date": "2027-01-01",
+                                      "interest_rate": 10, "interest_type": "compound"})
+        weekly = crud.create_saving({"name": "주간", "kind": "적금", "contribution_amount": 10_000,
+                                     "start_date": "2026-01-01", "end_date": "2026-12-31", "frequency": "weekly",
+                                     "interest_rate": 3.65})
+        by_id = lambda d: {it["id"]: it["predicted_balance"] for it in crud.forecast_savings(d)["items"]}
+        self.assertAlmostEqual(by_id(date(2026, 1, 1))[deposit.id], 1_100_000, places=4)
+        # maturity: no interest after end_date
+        self.assertAlmostEqual(by_id(date(2030, 1, 1))[deposit.id], 1_210_000, places=4)
+        # 53 weekly contributions in 2026, each earning 0.01% per day held until 2026-12-31
+        held = sum((date(2026, 12, 31) - (date(2026, 1, 1) + timedelta(days=7 * k))).days for k in range(53))
+        self.assertAlmostEqual(by_id(date(2027, 6, 1))[weekly.id], 530_000 + 10_000 * 0.0001 * held, places=6)
+
+        with self.assertRaisesRegex(ValueError, "Invalid frequency"):
+            crud.create_saving({"kind": "적금", "frequency": "daily"})
+        with self.assertRaisesRegex(ValueError, "Invalid interest_type"):
+            crud.create_saving({"kind": "적금", "interest_type": "continuous"})
+        with self.assertRaisesRegex(ValueError, "Invalid interest_rate"):
+            crud.update_saving(deposit.id, {"interest_rate": -100})
+        crud.update_saving(deposit.id, {"interest_rate": "0", "frequency": "quarterly"})
+        self.assertEqual(by_id(date(2030, 1, 1))[deposit.id], 1_000_000)
+
+    def test_legacy_frequency_values_round_trip_through_the_edit_form(self):
+        self.assertEqual(crud.create_saving({"kind": "적금", "frequency": None}).frequency, "monthly")
+        self.assertEqual(crud.create_saving({"kind": "적금", "frequency": ""}).frequency, "monthly")
+        legacy = crud.create_saving({"kind": "적금", "initial_balance": 1000, "contribution_amount": 500,
+                                     "start_date": "2026-01-01"})
+        with self._engine.begin() as conn:
+            conn.exec_driver_sql("UPDATE saving SET frequency = 'month' WHERE id = ?", (legacy.id,))
+        # SavingsView sends the stored frequency back with every edit
+        updated = crud.update_saving(legacy.id, {"name": "예전 적금", "frequency": "month"})
+        self.assertEqual((updated.name, updated.frequency), ("예전 적금", "month"))
+        items = {it["id"]: it["predicted_balance"] for it in crud.forecast_savings(date(2026, 6, 1))["items"]}
+        self.assertEqual(items[legacy.id], 1000)  # unknown frequency: no contributions
+        self.assertEqual(crud.update_saving(legacy.id, {"frequency": None}).frequency, "monthly")
+        with self.assertRaisesRegex(ValueError, "Invalid frequency"):
+            crud.update_saving(legacy.id, {"frequency": "month"})
+
+    def test_forecast_series_matches_forecast_at_every_date(self):
+        rng = random.Random(11)
+        for i in range(15):
+            start = random_date(rng, date(2024, 1, 1), 3 * 365)
+            crud.create_saving({
+                "name": f"s{i}", "kind": "적금", "initial_balance": rng.randrange(0, 10 ** 5),
+                "contribution_amount": rng.choice([0, rng.randrange(1, 10 ** 5)]),
+                "start_date": start.isoformat(),
+                "end_date": rng.choice([None, (start + timedelta(days=rng.randrange(0, 900))).isoformat()]),
+                "day_of_month": rng.choice([None, 1, 15, 29, 31]),
+                "frequency": rng.choice(list(crud.SAVING_FREQUENCIES)),
+                "interest_rate": rng.choice([0, 3.5]),
+                "interest_type": rng.choice(crud.SAVING_INTEREST_TYPES),
+                "withdrawn": i == 0,
+            })
+        for start, end, step in ((date(2024, 1, 31), date(2027, 12, 31), "month"),
+                                 (date(2025, 2, 3), date(2026, 3, 1), "week"),
+                                 (date(2025, 12, 20), date(2026, 3, 10), "day")):
+            series = crud.forecast_savings_series(start, end, step)
+            self.assertEqual(series["dates"][0], start.isoformat())
+            self.assertLessEqual(series["dates"][-1], end.isoformat())
+            for k, d in enumerate(series["dates"]):
+                expected = crud.forecast_savings(date.fromisoformat(d))
+                self.assertEqual(series["total"][k], expected["total"], (step, d))
+                self.assertEqual([it["balances"][k] for it in series["items"]],
+                                 [it["predicted_balance"] for it in expected["items"]], (step, d))
+
+    def test_forecast_series_sample_dates_and_validation(self):
+        month = crud.forecast_savings_series(date(2026, 1, 31), date(2026, 4, 30), "month")
+        self.assertEqual(month["dates"], ["2026-01-31", "2026-02-28", "2026-03-31", "2026-04-30"])
+        self.assertEqual(month["total"], [0.0] * 4)
+        self.assertEqual(len(crud.forecast_savings_series(date(2026, 1, 1), date(2026, 1, 15), "week")["dates"]), 3)
+        with self.assertRaisesRegex(ValueError, "Invalid step"):
+            crud.forecast_savings_series(date(2026, 1, 1), date(2026, 2, 1), "year")
+        with self.assertRaisesRegex(ValueError, "before start"):
+            crud.forecast_savings_series(date(2026, 2, 1), date(2026, 1, 1))
+        with self.assertRaisesRegex(ValueError, "Too many points"):
+            crud.forecast_savings_series(date(2000, 1, 1), date(2040, 1, 1), "day")
+
     def test_setting_categories_replace_and_get_sorted_unique(self):
         crud.set_setting_categories(
             majors=["식비", "교통", "식비", "주거"],
@@ -0,0 +1,137 @@
+import unittest
+from datetime import date
+from unittest import mock
+
+from sqlalchemy import event
+
+from app import crud, models_core
+from test.db_case import CrudDBTestCase
+
+FTS_AVAILABLE = bool(models_core.transaction_search_ddl("sqlite"))
+
+
+@unittest.skipUnless(FTS_AVAILABLE, "SQLite without the FTS5 trigram tokenizer")
+class SearchIndexTests(CrudDBTestCase):
+    def setUp(self):
+        super().setUp()
+
+        crud.create_transactions_bulk(
+            [
+                {"date": "2026-01-01", "type": "지출", "major_category": "식비", "sub_category": "점심",
+                 "description": "회사 앞 김밥천국 점심", "amount": 7000},
+                {"date": "2026-01-02", "type": "지출", "major_category": "구독", "sub_category": "영상",
+                 "description": "NETFLIX Premium", "amount": 17000},
+                {"date": "2026-01-03", "type": "지출", "category": "교통비", "description": "버스 \"환승\" 요금",
+                 "amount": 1500},
+                {"date": "2026-01-04", "type": "수입", "major_category": "월급", "sub_category": "본봉",
+                 "description": None, "amount": 3000000},
+            ]
+        )
+
+    def _ids(self, search):
+        items, total = crud.query_transactions(search=search, per_page=100)
+        self.assertEqual(total, len(items))
+        return [t.id for t in items]
+
+    def _scan_ids(self, search):
+        with mock.patch.object(crud, "SEARCH_INDEX_MIN_CHARS", 10 ** 6):
+            return self._ids(search)
+
+    def _search_sql(self, search):
+        seen = []
+        listener = lambda conn, cursor, stmt, params, ctx, many: seen.append(stmt)
+        event.listen(self._engine, "before_cursor_execute", listener)
+        try:
+            crud.query_transactions(search=search, include_total=False)
+        finally:
+            event.remove(self._engine, "before_cursor_execute", listener)
+        return " ".join(seen)
+
+    def test_index_matches_ilike_scan(self):
+        for q in ("김밥천국", "밥천", "netflix", "Premium", "교통비", "\"환승\"", "월급", "없는말", "점심", "식", "a_b"):
+            self.assertEqual(self._ids(q), self._scan_ids(q), q)
+
+    def test_long_queries_use_fts_and_short_ones_scan(self):
+        self.assertIn("transaction_search MATCH", self._search_sql("김밥천국"))
+        self.assertNotIn("LIKE", self._search_sql("김밥천국"))
+        self.assertNotIn("transaction_search MATCH", self._search_sql("점심"))
+        self.assertNotIn("transaction_search MATCH", self._search_sql("50%할인"))
+
+    def test_triggers_follow_updates_and_deletes(self):
+        bus = self._ids("환승")
+        crud.update_transaction(bus[0], {"description": "지하철 정기권"})
+        self.assertEqual(self._ids("버스 \"환"), [])
+        self.assertEqual(self._ids("정기권"), bus)
+        # date-only updates leave the index alone but the row stays searchable
+        crud.update_transaction(bus[0], {"date": "2026-02-01"})
+        self.assertEqual(self._ids("정기권"), bus)
+        crud.delete_transaction(bus[0])
+        self.assertEqual(self._ids("정기권"), [])
+
+        crud.create_fixed_expense(
+            {"major_category": "주거", "sub_category": "관리비", "description": "아파트 관리비", "amount": 1,
+             "start_date": "2026-01-01", "end_date": "2026-03-31", "day_of_month": 5}
+        )
+        fixed_id = crud.list_fixed_expenses()[0].id
+        self.assertEqual(len(self._ids("아파트 관리")), 3)
+        crud.update_fixed_expense(fixed_id, {"description": "오피스텔 관리비", "end_date": "2026-02-28"})
+        self.assertEqual(self._ids("아파트 관리"), [])
+        self.assertEqual(len(self._ids("오피스텔")), 2)
+        crud.delete_fixed_expense(fixed_id)
+        self.assertEqual(self._ids("오피스텔"), [])
+
+    def test_missing_index_is_built_for_existing_rows(self):
+        with self._engine.begin() as conn:
+            conn.exec_driver_sql(f"DROP TABLE {models_core.TRANSACTION_SEARCH_TABLE}")
+            for suffix in ("ai", "ad", "au"):
+                conn.exec_driver_sql(f"DROP TRIGGER {models_core.TRANSACTION_SEARCH_TABLE}_{suffix}")
+        crud._search_index_engines.discard(self._engine)
+        self.assertEqual(self._ids("김밥천국"), self._scan_ids("김밥천국"))
+        self.assertNotIn("transaction_search MATCH", self._search_sql("김밥천국"))
+
+        with self._engine.begin() as conn:
+            models_core._ensure_search_index(conn)
+        self.assertIn("transaction_search MATCH", self._search_sql("김밥천국"))
+        self.assertEqual(len(self._ids("김밥천국")), 1)
+        self.assertEqual(self._ids("NETFLIX"), self._scan_ids("NETFLIX"))
+
+    def test_non_ascii_case_folding_matches_ilike_scan(self):
+        crud.create_transactions_bulk(
+            [
+                {"date": "2026-01-05", "type": "지출", "major_category": "교육", "description": "Café ÉCOLE",
+                 "amount": 1},
+                {"date": "2026-01-06", "type": "지출", "major_category": "여행", "description": "ПРИВЕТ мир",
+                 "amount": 1},
+            ]
+        )
+        # SQLite lower() (and so ILIKE) folds ASCII only: the index must agree at every query length
+        for q in ("école", "ÉCOLE", "éc", "ÉC", "CAFÉ", "café", "привет", "ПРИВЕТ", "МИР", "мир", "пр"):
+            self.assertEqual(self._ids(q), self._scan_ids(q), q)
+        self.assertEqual(len(self._ids("CAFé")), 1)
+        self.assertEqual(self._ids("CAFÉ"), [])
+        self.assertEqual(self._ids("école"), [])
+        self.assertEqual(self._ids("привет"), [])
+
+    def test_index_from_older_definition_is_recreated(self):
+        with self._engine.begin() as conn:
+            models_core.drop_transaction_search(conn)
+            conn.exec_driver_sql(
+                f"CREATE VIRTUAL TABLE {models_core.TRANSACTION_SEARCH_TABLE} USING fts5("
+                f"{', '.join(models_core.TRANSACTION_SEARCH_COLUMNS)}, content='transaction', content_rowid='id', "
+                f"tokenize='trigram')"
+            )
+            models_core._ensure_search_index(conn)
+            sql = conn.exec_driver_sql(
+                "SELECT sql FROM sqlite_master WHERE name = ?", (models_core.TRANSACTION_SEARCH_TABLE,)
+            ).scalar()
+        self.assertIn("case_sensitive 1", sql)
+        self.assertEqual(self._ids("netflix"), self._scan_ids("netflix"))
+        self.assertEqual(len(self._ids("김밥천국")), 1)
+
+    def test_search_stays_in_date_window(self):
+        items, total = crud.query_transactions(start=date(2026, 1, 2), end=date(2026, 1, 3), search="요금")
+        self.assertEqual((total, [t.description for t in items]), (1, ["버스 \"환승\" 요금"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
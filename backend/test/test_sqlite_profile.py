@@ -0,0 +1,44 @@
+import unittest
+
+from sqlmodel import create_engine
+
+from app import models_core
+from test.db_case import TempDirTestCase
+
+
+class SqliteProfileTests(TempDirTestCase):
+    def _pragma(self, engine, name):
+        with engine.connect() as conn:
+            return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+    def test_connect_hook_applies_default_profile(self):
+        engine = create_engine(f"sqlite:///{self._tmpdir.name}/profile.db", connect_args={"check_same_thread": False})
+        models_core.configure_sqlite_engine(engine, models_core.sqlite_pragmas_from_env({}))
+
+        self.assertEqual(self._pragma(engine, "journal_mode"), "wal")
+        self.assertEqual(self._pragma(engine, "synchronous"), 1)  # NORMAL
+        self.assertEqual(self._pragma(engine, "temp_store"), 2)  # MEMORY
+        self.assertEqual(self._pragma(engine, "busy_timeout"), 5000)
+        self.assertEqual(self._pragma(engine, "cache_size"), -65536)
+        engine.dispose()
+
+    def test_profile_is_overridable_from_environment(self):
+        pragmas = models_core.sqlite_pragmas_from_env(
+            {"MONEY_CALENDAR_SQLITE_JOURNAL_MODE": "DELETE", "MONEY_CALENDAR_SQLITE_MMAP_SIZE": ""}
+        )
+        self.assertEqual(pragmas["journal_mode"], "DELETE")
+        self.assertEqual(pragmas["mmap_size"], "")
+
+        engine = create_engine(f"sqlite:///{self._tmpdir.name}/override.db")
+        models_core.configure_sqlite_engine(engine, pragmas)
+        self.assertEqual(self._pragma(engine, "journal_mode"), "delete")
+        self.assertEqual(self._pragma(engine, "mmap_size"), 0)
+        engine.dispose()
+
+    def test_profile_rejects_unsafe_values(self):
+        with self.assertRaisesRegex(ValueError, "MONEY_CALENDAR_SQLITE_SYNCHRONOUS"):
+            models_core.sqlite_pragmas_from_env({"MONEY_CALENDAR_SQLITE_SYNCHRONOUS": "OFF; DROP TABLE x"})
+
+
+if __name__ == "__main__":
+    unittest.main()
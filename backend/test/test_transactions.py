@@ -1,12 +1,26 @@
 import tempfile
 import unittest
 from datetime import date
+from io import StringIO
 
-from sqlmodel import SQLModel, create_engine
+from sqlalchemy import event
+from sqlmodel import SQLModel, create_engine, select
 
 from app import crud
 
 
+def reference_categories():
+    """The pre-index get_categories: every (major, sub) of the transaction table, deduplicated in Python."""
+    majors, subs = set(), {}
+    for t in crud.list_transactions():
+        if t.major_category:
+            majors.add(t.major_category)
+            subs.setdefault(t.major_category, set())
+            if t.sub_category:
+                subs[t.major_category].add(t.sub_category)
+    return {"majors": sorted(majors), "subs": {k: sorted(v) for k, v in subs.items()}}
+
+
 class CrudDBTestCase(unittest.TestCase):
     def setUp(self):
         self._tmpdir = tempfile.TemporaryDirectory()
@@ -44,6 +58,31 @@ class TransactionCrudTests(CrudDBTestCase):
         with self.assertRaisesRegex(ValueError, "Invalid date format"):
             crud._normalize_tx_dict({"date": "2026-99-99", "amount": "1000", "type": "수입"})
 
+    def test_normalize_tx_batch_matches_per_row_normalizer(self):
+        rows = [
+            {"date": "2026-02-01", "type": "수입", "amount": "1,234"},
+            {"date": " 2026-2-3 ", "type": "INCOME", "amount": 7},
+            {"date": "2026/02/04", "direction": "expense", "type": "수입", "amount": 1.5},
+            {"date": "12/31/2026", "type": "지출", "amount": "10"},
+            {"date": "01/02/2026", "type": "exp", "amount": "0"},
+            {"date": "2026-02-05T10:00:00", "type": None, "amount": True},
+            {"date": date(2026, 2, 6), "direction": "", "amount": 3},
+            {"date": "2026-02-07", "type": ["odd"], "amount": "2"},
+        ]
+        self.assertEqual(crud.normalize_tx_batch(rows), [crud._normalize_tx_dict(r) for r in rows])
+
+        # format detected from the first row (m/d/Y) must not shadow the d/m/Y priority of the per-row parser
+        ambiguous = [{"date": "12/31/2026", "amount": 1}, {"date": "01/02/2026", "amount": 1}]
+        self.assertEqual(crud.normalize_tx_batch(ambiguous)[1]["date"], date(2026, 2, 1))
+
+    def test_normalize_tx_batch_raises_same_errors_as_per_row(self):
+        for bad in ({"date": "2026-02-30", "amount": 1}, {"date": "2026-01-01", "amount": "1.2.3"}):
+            with self.assertRaises(ValueError) as per_row:
+                crud._normalize_tx_dict(bad)
+            with self.assertRaises(ValueError) as batch:
+                crud.normalize_tx_batch([{"date": "2026-01-01", "amount": 1}, bad])
+            self.assertEqual(str(batch.exception), str(per_row.exception))
+
     def test_transactions_crud_and_query_filters(self):
         created = crud.create_transactions_bulk(
             [
@@ -129,6 +168,178 @@ class TransactionCrudTests(CrudDBTestCase):
         self.assertEqual(categories["subs"]["식비"], ["아침", "점심"])
         self.assertEqual(categories["subs"]["급여"], ["본봉"])
 
+    def test_get_categories_follows_writes_and_matches_full_scan(self):
+        created = crud.create_transactions_bulk(
+            [
+                {"date": "2026-01-01", "type": "지출", "major_category": "식비", "sub_category": "아침", "amount": 1},
+                {"date": "2026-01-02", "type": "지출", "major_category": "식비", "sub_category": "아침", "amount": 2},
+                {"date": "2026-01-03", "type": "지출", "major_category": "교통", "amount": 3},
+                {"date": "2026-01-04", "type": "지출", "category": "기타", "amount": 4},
+            ]
+        )
+        ids = [row["id"] for row in created]
+        steps = [
+            lambda: None,
+            lambda: crud.update_transaction(ids[0], {"sub_category": "저녁"}),
+            lambda: crud.update_transaction(ids[2], {"major_category": "교통비", "sub_category": "버스"}),
+            lambda: crud.delete_transaction(ids[1]),
+            lambda: crud.create_fixed_expense({"major_category": "주거", "sub_category": "월세", "amount": 1,
+                                               "start_date": "2026-01-01", "end_date": "2026-03-31",
+                                               "day_of_month": 25}),
+            lambda: crud.update_fixed_expense(crud.list_fixed_expenses()[0].id, {"sub_category": "관리비"}),
+            lambda: crud.import_transactions_csv(StringIO("date,type,category,amount\n2026-02-01,지출,의료>약국,5000\n")),
+            lambda: crud.delete_fixed_expense(crud.list_fixed_expenses()[0].id),
+            lambda: crud.delete_transaction(ids[0]),
+        ]
+        for step in steps:
+            step()
+            self.assertEqual(crud.get_categories(), reference_categories())
+        self.assertNotIn("주거", crud.get_categories()["majors"])
+        self.assertNotIn("식비", crud.get_categories()["majors"])
+
+    def test_get_categories_is_cached_until_data_version_changes(self):
+        crud.create_transactions_bulk(
+            [{"date": "2026-01-01", "type": "지출", "major_category": "식비", "sub_category": "점심", "amount": 1}]
+        )
+        seen = []
+        listener = lambda conn, cursor, stmt, params, ctx, many: seen.append(stmt)
+        event.listen(self._engine, "before_cursor_execute", listener)
+        try:
+            first = crud.get_categories()
+            seen.clear()
+            self.assertIs(crud.get_categories(), first)
+            self.assertFalse(any("transaction_category" in stmt for stmt in seen), seen)
+            crud.set_setting_categories(["식비"], ["점심"])  # unrelated write: bumps data_version only
+            self.assertEqual(crud.get_categories(), first)
+            self.assertTrue(any("transaction_category" in stmt for stmt in seen))
+        finally:
+            event.remove(self._engine, "before_cursor_execute", listener)
+
+        # databases created before the index existed are filled on startup
+        with crud.Session(self._engine) as session:
+            session.execute(crud.delete(crud.TransactionCategory.__table__))
+            session.commit()
+        # raw SQL bypasses data_version, so the cached result is still served until it is dropped
+        self.assertEqual(crud.get_categories(), first)
+        crud._categories_cache.clear()
+        self.assertEqual(crud.get_categories(), {"majors": [], "subs": {}})
+        crud.ensure_daily_rollup()
+        self.assertEqual(crud.get_categories(), {"majors": ["식비"], "subs": {"식비": ["점심"]}})
+        with crud.Session(self._engine) as session:
+            pairs = session.exec(select(crud.TransactionCategory.major_category, crud.TransactionCategory.count)).all()
+        self.assertEqual(pairs, [("식비", 1)])
+
+    def test_get_summary_aggregates_by_major_and_sub(self):
+        crud.create_transactions_bulk(
+            [
+                {"date": "2026-01-01", "type": "지출", "major_category": "식비", "sub_category": "점심", "amount": 9000},
+                {"date": "2026-01-02", "type": "지출", "major_category": "식비", "sub_category": "점심", "amount": 6000},
+                {"date": "2026-01-03", "type": "지출", "major_category": "식비", "amount": 1000},
+                {"date": "2026-01-04", "type": "지출", "category": "교통", "amount": 1500},
+                {"date": "2026-02-01", "type": "지출", "major_category": "식비", "sub_category": "점심", "amount": 7000},
+            ]
+        )
+
+        summary = crud.get_summary(date(2026, 1, 1), date(2026, 1, 31))
+        self.assertEqual(summary["total"], 17500.0)
+        self.assertEqual(summary["by_major"]["식비"]["total"], 16000.0)
+        self.assertEqual(
+            summary["by_major"]["식비"]["sub_categories"],
+            {"점심": 15000.0, "unspecified": 1000.0},
+        )
+        self.assertEqual(summary["by_major"]["교통"]["sub_categories"], {"unspecified": 1500.0})
+
+        groups = crud.aggregate_transactions(date(2026, 1, 1), date(2026, 1, 31))
+        lunch = [g for g in groups if g.sub_category == "점심"]
+        self.assertEqual(len(lunch), 1)
+        self.assertEqual((lunch[0].amount, lunch[0].count), (15000.0, 2))
+
+    def test_query_transactions_keyset_pagination_walks_all_rows(self):
+        crud.create_transactions_bulk(
+            [
+                {"date": f"2026-01-0{d}", "type": "지출", "major_category": "식비", "amount": d * 100 + i}
+                for d in (1, 2, 3)
+                for i in range(3)
+            ]
+        )
+
+        offset_items, total = crud.query_transactions(page=1, per_page=100)
+        self.assertEqual(total, 9)
+
+        seen = []
+        after = None
+        while True:
+            items, page_total = crud.query_transactions(per_page=4, after=after, include_total=False)
+            self.assertIsNone(page_total)
+            seen.extend(items)
+            if len(items) < 4:
+                break
+            after = crud.decode_cursor(crud.encode_cursor(items[-1].date, items[-1].id))
+
+        self.assertEqual([t.id for t in seen], [t.id for t in offset_items])
+        self.assertEqual([(t.date, t.id) for t in seen], sorted(((t.date, t.id) for t in seen), reverse=True))
+
+    def test_iter_transaction_batches_streams_column_tuples(self):
+        crud.create_transactions_bulk(
+            [
+                {"date": f"2026-03-{d:02d}", "type": "지출", "major_category": "식비", "amount": d}
+                for d in range(1, 8)
+            ]
+        )
+
+        batches = list(crud.iter_transaction_batches(date(2026, 3, 2), date(2026, 3, 31), batch_size=3))
+        self.assertEqual([len(b) for b in batches], [3, 3])
+        rows = [row for b in batches for row in b]
+        self.assertEqual(rows[0][1:3], (date(2026, 3, 7), "Expense"))
+        self.assertEqual([r[5] for r in rows], [7.0, 6.0, 5.0, 4.0, 3.0, 2.0])
+
+    def test_import_transactions_csv_inserts_in_batches_and_returns_ids(self):
+        text = "date,amount,category,type,description\n" + "".join(
+            f"2026-04-{d:02d},\"1,{d:03d}\",식비/점심,지출,row {d}\n" for d in range(1, 6)
+        )
+
+        ids = crud.import_transactions_csv(StringIO(text), batch_size=2)
+        self.assertEqual(len(ids), 5)
+        self.assertEqual(len(set(ids)), 5)
+
+        first = crud.get_transaction(ids[0])
+        self.assertEqual((first.date, first.amount, first.direction), (date(2026, 4, 1), 1001.0, "Expense"))
+        self.assertEqual((first.major_category, first.sub_category), ("식비", "점심"))
+        self.assertEqual(crud.get_daily_totals(date(2026, 4, 5), date(2026, 4, 5))[0].amount, 1005.0)
+
+    def test_import_transactions_csv_is_atomic_on_bad_row(self):
+        text = "date,amount\n2026-04-01,100\n2026-04-02,100\n2026-04-03,abc\n"
+        with self.assertRaisesRegex(ValueError, "Row 3"):
+            crud.import_transactions_csv(StringIO(text), batch_size=2)
+        _, total = crud.query_transactions()
+        self.assertEqual(total, 0)
+
+    def test_create_transactions_bulk_returns_ids_without_refresh(self):
+        created = crud.create_transactions_bulk(
+            [
+                {"date": "2026-05-01", "type": "지출", "amount": "1,500", "major_category": "교통"},
+                {"date": "2026-05-02", "type": "수입", "amount": 10},
+            ]
+        )
+        self.assertEqual([c["date"] for c in created], [date(2026, 5, 1), date(2026, 5, 2)])
+        self.assertEqual([c["amount"] for c in created], [1500.0, 10.0])
+        for c in created:
+            stored = crud.get_transaction(c["id"])
+            self.assertEqual((stored.date, stored.amount, stored.direction), (c["date"], c["amount"], c["direction"]))
+
+    def test_create_transactions_bulk_without_returning_support(self):
+        crud.create_transactions_bulk([{"date": "2026-05-01", "type": "지출", "amount": 1}])
+        self._engine.dialect.insert_executemany_returning_sort_by_parameter_order = False
+
+        created = crud.create_transactions_bulk(
+            [{"date": "2026-05-02", "type": "지출", "amount": n} for n in (2, 3, 4)]
+        )
+        self.assertEqual([crud.get_transaction(c["id"]).amount for c in created], [2.0, 3.0, 4.0])
+
+    def test_decode_cursor_rejects_garbage(self):
+        with self.assertRaisesRegex(ValueError, "Invalid cursor"):
+            crud.decode_cursor("not-a-cursor")
+
 
 if __name__ == "__main__":
     unittest.main()